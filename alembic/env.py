@@ -12,6 +12,7 @@ from src.db.models.user import User
 from src.db.models.user_job import UserJob
 from src.db.models.user_filtered_job import UserFilteredJob
 from src.db.models.user_keyword import UserKeyword
+from src.db.models.telegram_media import TelegramMedia
 
 
 # this is the Alembic Config object, which provides
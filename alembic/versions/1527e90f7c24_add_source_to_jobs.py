@@ -0,0 +1,53 @@
+"""Add source to jobs
+
+Revision ID: 1527e90f7c24
+Revises: 7e535b32b306
+Create Date: 2026-10-17 19:41:27.093512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1527e90f7c24"
+down_revision: Union[str, Sequence[str], None] = "7e535b32b306"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# URL host pattern of every fetcher, to backfill existing rows
+SOURCE_URL_PATTERNS = {
+    "robota_ua": "%robota.ua%",
+    "djinni": "%djinni.co%",
+    "dou": "%dou.ua%",
+    "justjoin": "%justjoin.it%",
+    "nofluff": "%nofluffjobs.com%",
+    "pracuj": "%pracuj.pl%",
+    "bulldog": "%bulldogjob.%",
+    "jooble": "%jooble.%",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "jobs", sa.Column("source", sa.String(length=32), nullable=True)
+    )
+    for source, pattern in SOURCE_URL_PATTERNS.items():
+        op.execute(
+            sa.text(
+                "UPDATE jobs SET source = :source "
+                "WHERE source IS NULL AND url LIKE :pattern"
+            ).bindparams(source=source, pattern=pattern)
+        )
+    op.create_index("ix_jobs_source", "jobs", ["source"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_source", table_name="jobs")
+    op.drop_column("jobs", "source")
@@ -0,0 +1,56 @@
+"""Add hot query indexes
+
+Revision ID: 2cb285f2a43a
+Revises: fd8169a09acd
+Create Date: 2026-10-17 22:05:31.640127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2cb285f2a43a"
+down_revision: Union[str, Sequence[str], None] = "fd8169a09acd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# CREATE INDEX CONCURRENTLY can't run inside a transaction, the bot keeps
+# reading and writing these tables while the migration runs
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_archived_at",
+            "jobs",
+            ["archived_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_regions_user_id",
+            "user_regions",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_regions_user_id",
+            table_name="user_regions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_jobs_archived_at",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
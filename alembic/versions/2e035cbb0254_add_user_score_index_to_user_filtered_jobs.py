@@ -0,0 +1,43 @@
+"""Add user score index to user filtered jobs
+
+Revision ID: 2e035cbb0254
+Revises: ce6964e154a7
+Create Date: 2026-10-17 21:12:44.509817
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2e035cbb0254"
+down_revision: Union[str, Sequence[str], None] = "ce6964e154a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # user_jobs anti-join is already served by the uix_user_job index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_filtered_jobs_user_score",
+            "user_filtered_jobs",
+            ["user_id", sa.text("score DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_filtered_jobs_user_score",
+            table_name="user_filtered_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,56 @@
+"""Add job_id indexes for cascade deletes
+
+Revision ID: 78cdf03e740a
+Revises: 2cb285f2a43a
+Create Date: 2026-10-17 23:41:12.518304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "78cdf03e740a"
+down_revision: Union[str, Sequence[str], None] = "2cb285f2a43a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# deleting a job cascades to user_jobs and user_filtered_jobs by job_id,
+# the unique (user_id, job_id) constraints can't serve that lookup
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_jobs_job_id",
+            "user_jobs",
+            ["job_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_user_filtered_jobs_job_id",
+            "user_filtered_jobs",
+            ["job_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_filtered_jobs_job_id",
+            table_name="user_filtered_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_user_jobs_job_id",
+            table_name="user_jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
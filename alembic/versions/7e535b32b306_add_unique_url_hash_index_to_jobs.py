@@ -0,0 +1,115 @@
+"""Add unique url hash index to jobs
+
+Revision ID: 7e535b32b306
+Revises: 27a74dbf6227
+Create Date: 2026-10-17 19:02:11.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e535b32b306"
+down_revision: Union[str, Sequence[str], None] = "27a74dbf6227"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # concurrent saves could create duplicates, keep the oldest row per URL
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE job_duplicates AS
+        SELECT id, kept_id
+        FROM (
+            SELECT id, min(id) OVER (PARTITION BY url) AS kept_id FROM jobs
+        ) jobs_by_url
+        WHERE id <> kept_id
+        """
+    )
+    # move user history onto the kept row, the (user_id, job_id) unique
+    # constraints allow one row per user: keep the user's decision
+    # (applied, then skipped), else the first sent
+    op.execute(
+        """
+        DELETE FROM user_jobs
+        USING (
+            SELECT u.id, row_number() OVER (
+                PARTITION BY u.user_id, coalesce(d.kept_id, u.job_id)
+                ORDER BY
+                    CASE u.status
+                        WHEN 'applied' THEN 0
+                        WHEN 'skipped' THEN 1
+                        ELSE 2
+                    END,
+                    u.id
+            ) AS position
+            FROM user_jobs u
+            LEFT JOIN job_duplicates d ON d.id = u.job_id
+        ) ranked
+        WHERE user_jobs.id = ranked.id AND ranked.position > 1
+        """
+    )
+    op.execute(
+        """
+        UPDATE user_jobs SET job_id = d.kept_id
+        FROM job_duplicates d
+        WHERE user_jobs.job_id = d.id
+        """
+    )
+    # same for scores, keep the best one
+    op.execute(
+        """
+        DELETE FROM user_filtered_jobs
+        USING (
+            SELECT f.id, row_number() OVER (
+                PARTITION BY f.user_id, coalesce(d.kept_id, f.job_id)
+                ORDER BY f.score DESC, f.id
+            ) AS position
+            FROM user_filtered_jobs f
+            LEFT JOIN job_duplicates d ON d.id = f.job_id
+        ) ranked
+        WHERE user_filtered_jobs.id = ranked.id AND ranked.position > 1
+        """
+    )
+    op.execute(
+        """
+        UPDATE user_filtered_jobs SET job_id = d.kept_id
+        FROM job_duplicates d
+        WHERE user_filtered_jobs.job_id = d.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM jobs
+        USING job_duplicates d
+        WHERE jobs.id = d.id
+        """
+    )
+    op.execute("DROP TABLE job_duplicates")
+    # the cleanup above commits first, the build does not block saves
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uix_jobs_url_md5",
+            "jobs",
+            [sa.text("md5(url)")],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uix_jobs_url_md5",
+            table_name="jobs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,49 @@
+"""Add search text with trigram index to jobs
+
+Revision ID: 983dc1a3ec4d
+Revises: 1527e90f7c24
+Create Date: 2026-10-17 20:14:53.281904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "983dc1a3ec4d"
+down_revision: Union[str, Sequence[str], None] = "1527e90f7c24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("jobs", sa.Column("search_text", sa.Text(), nullable=True))
+    # same as utils.search_text.build_search_text
+    op.execute(
+        r"""
+        UPDATE jobs SET search_text =
+            lower(btrim(regexp_replace(title, '\s+', ' ', 'g')))
+            || E'\n'
+            || lower(btrim(regexp_replace(
+                coalesce(array_to_string(skills, ' '), ''), '\s+', ' ', 'g'
+            )))
+        """
+    )
+    op.create_index(
+        "ix_jobs_search_text_trgm",
+        "jobs",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_search_text_trgm", table_name="jobs")
+    op.drop_column("jobs", "search_text")
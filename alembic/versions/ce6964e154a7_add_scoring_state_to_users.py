@@ -0,0 +1,37 @@
+"""Add scoring state to users
+
+Revision ID: ce6964e154a7
+Revises: 983dc1a3ec4d
+Create Date: 2026-10-17 20:52:06.614209
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "ce6964e154a7"
+down_revision: Union[str, Sequence[str], None] = "983dc1a3ec4d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("scored_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "users",
+        sa.Column("scoring_profile", sa.String(length=32), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "scoring_profile")
+    op.drop_column("users", "scored_at")
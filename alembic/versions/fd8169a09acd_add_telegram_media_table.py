@@ -0,0 +1,39 @@
+"""Add telegram media table
+
+Revision ID: fd8169a09acd
+Revises: 2e035cbb0254
+Create Date: 2026-10-17 21:40:18.275406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "fd8169a09acd"
+down_revision: Union[str, Sequence[str], None] = "2e035cbb0254"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "telegram_media",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("file_id", sa.String(length=255), nullable=False),
+        sa.Column(
+            "datetime_added", sa.DateTime(timezone=True), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("url"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("telegram_media")
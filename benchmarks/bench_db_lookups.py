@@ -0,0 +1,66 @@
+"""
+Compare hot CRUD lookup latency with and without prepared statements.
+
+Needs a migrated local PostgreSQL configured by the DB_* env variables.
+Run: python -m benchmarks.bench_db_lookups
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.db.crud.job import get_job_by_id
+from src.db.crud.user import get_user_by_telegram_id
+from src.db.crud.user_job import get_user_job
+from src.db.crud.user_keyword import get_user_keyword
+from src.db.db import DB_STATEMENT_CACHE_SIZE, create_pool_engine
+
+
+CALLS = 2_000
+
+LOOKUPS: dict[str, Callable[[AsyncSession, int], Awaitable]] = {
+    "get_user_by_telegram_id": lambda s, i: get_user_by_telegram_id(s, i),
+    "get_user_job": lambda s, i: get_user_job(s, i, i),
+    "get_user_keyword": lambda s, i: get_user_keyword(s, i, "python"),
+    "get_job_by_id": lambda s, i: get_job_by_id(s, i),
+}
+
+
+async def time_lookups(statement_cache_size: int) -> dict[str, float]:
+    """Return microseconds per call of every lookup."""
+    engine = create_pool_engine("bot", statement_cache_size)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    timings = {}
+    try:
+        async with session_factory() as session:
+            # crud helpers swallow errors, fail fast without a database
+            await session.execute(text("SELECT 1"))
+            for name, lookup in LOOKUPS.items():
+                await lookup(session, 0)  # warm up connection and caches
+                start = time.perf_counter()
+                for i in range(CALLS):
+                    await lookup(session, i)
+                elapsed = time.perf_counter() - start
+                timings[name] = elapsed / CALLS * 1_000_000
+    finally:
+        await engine.dispose()
+    return timings
+
+
+async def main() -> None:
+    """Time lookups without and with the statement cache."""
+    uncached = await time_lookups(0)
+    cached = await time_lookups(DB_STATEMENT_CACHE_SIZE)
+    for name in LOOKUPS:
+        print(
+            f"{name:<24} | no cache {uncached[name]:7.1f}us | "
+            f"cache {cached[name]:7.1f}us "
+            f"({uncached[name] / cached[name]:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
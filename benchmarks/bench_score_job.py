@@ -0,0 +1,138 @@
+"""
+Compare job scoring strategies on 50k synthetic jobs.
+
+score_job keeps plain substring checks: a combined regex over the same
+text was measured slower at every profile size users can have.
+
+Profiles are built like real ones: up to MAX_KEYWORDS phrases, each
+split into tokens by build_keyword_weights.
+
+Run: python -m benchmarks.bench_score_job
+"""
+
+import random
+import re
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from src.telegram.commands.keywords.add_keywords import MAX_KEYWORDS
+from src.utils.search_text import build_search_text
+from src.utils.telegram.job_filter import build_keyword_weights, score_job
+
+
+JOBS_COUNT = 50_000
+# keyword phrases per user and words per phrase
+KEYWORD_COUNTS = (1, 3, MAX_KEYWORDS)
+PHRASE_WORDS = (2, 5)
+
+WORDS = [
+    "python", "django", "fastapi", "senior", "junior", "backend",
+    "frontend", "developer", "engineer", "react", "node", "java", "golang",
+    "devops", "aws", "docker", "kubernetes", "sql", "postgres", "data",
+    "ml", "qa", "lead", "remote", "c++", "c#", "php", "rust", "scala",
+    "android", "ios", "flutter", "angular", "vue", "spark", "airflow",
+]
+
+
+def make_jobs(count: int, rng: random.Random) -> list[SimpleNamespace]:
+    """Build random jobs with title, skills and stored search text."""
+    filler = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 9)))
+        for _ in range(400)
+    ]
+    vocabulary = WORDS + filler
+    jobs = [
+        SimpleNamespace(
+            title=" ".join(rng.choices(vocabulary, k=5)).title(),
+            skills=rng.choices(vocabulary, k=8),
+        )
+        for _ in range(count)
+    ]
+    # computed once at ingestion in production
+    for job in jobs:
+        job.search_text = build_search_text(job.title, job.skills)
+    return jobs
+
+
+def naive_score(job: SimpleNamespace, weights: dict[str, int]) -> int:
+    """Lowercase raw title and skills on every call."""
+    title = (job.title or "").lower()
+    skills = " ".join(job.skills or []).lower()
+    score = 0
+    for keyword, weight in weights.items():
+        if keyword in title:
+            score += weight
+        elif keyword in skills:
+            score += weight // 2
+    return score
+
+
+def regex_scorer(weights: dict[str, int]) -> Callable:
+    """Combined lookahead regex, finds overlapping keywords too."""
+    keywords = sorted(weights, key=len, reverse=True)
+    pattern = re.compile(
+        "(?=(" + "|".join(map(re.escape, keywords)) + "))"
+    )
+    contained = {k: {o for o in keywords if o in k} for k in keywords}
+
+    def find(text: str) -> set[str]:
+        found: set[str] = set()
+        for match in set(pattern.findall(text)):
+            found |= contained[match]
+        return found
+
+    def score(job: SimpleNamespace) -> int:
+        in_title = find((job.title or "").lower())
+        in_skills = find(" ".join(job.skills or []).lower()) - in_title
+        return sum(weights[k] for k in in_title) + sum(
+            weights[k] // 2 for k in in_skills
+        )
+
+    return score
+
+
+def timed(func: Callable[[], list[int]]) -> tuple[float, list[int]]:
+    """Return runtime and result of func."""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Time all scorers on the same jobs."""
+    rng = random.Random(42)
+    jobs = make_jobs(JOBS_COUNT, rng)
+
+    for keywords_count in KEYWORD_COUNTS:
+        keywords = [
+            SimpleNamespace(
+                keyword=" ".join(
+                    rng.sample(WORDS, rng.randint(*PHRASE_WORDS))
+                ),
+                weight=rng.randint(1, 10),
+            )
+            for _ in range(keywords_count)
+        ]
+        weights = build_keyword_weights(keywords)
+        regex_score = regex_scorer(weights)
+
+        naive_s, naive = timed(
+            lambda: [naive_score(job, weights) for job in jobs]
+        )
+        regex_s, regex = timed(lambda: [regex_score(job) for job in jobs])
+        stored_s, stored = timed(
+            lambda: [score_job(job, weights) for job in jobs]
+        )
+
+        assert naive == regex == stored, "scores differ"
+        print(
+            f"{JOBS_COUNT} jobs, {keywords_count} keywords "
+            f"({len(weights):>2} tokens) | "
+            f"naive {naive_s:.3f}s | regex {regex_s:.3f}s | "
+            f"score_job {stored_s:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,15 @@ import uvicorn
 
 from logs.logger import logger
 from src.api.notifications_scheduler import notify_at_10am_daily
+from src.db.db import get_pool_stats
 from src.telegram.telegram_bot import start_bot
 from src.utils.fetching.job_loop import job_process_loop
-from src.utils.resources_logging import log_resources
+from src.utils.job_cleanup import job_cleanup_loop
+from src.utils.resources_logging import (
+    log_resources,
+    resource_history,
+    sample_resources_periodically,
+)
 
 app = FastAPI()
 bot_started = False
@@ -24,6 +30,18 @@ async def health_check(request: Request) -> dict:
     return {"status": "ok"}
 
 
+@app.get("/resources")
+async def resources_history() -> dict:
+    """Return sampled memory and CPU history."""
+    return {"samples": list(resource_history)}
+
+
+@app.get("/db/pool")
+async def db_pool_stats() -> dict:
+    """Return live DB pool usage and checkout wait times."""
+    return get_pool_stats()
+
+
 async def log_memory_periodically() -> None:
     """Log memory usage every 60 seconds."""
     while True:
@@ -38,11 +56,15 @@ async def lifespan(_fastapi_app: FastAPI) -> AsyncIterator[None]:
 
     logger.info("-" * 60)
     logger.info("Starting memory logging process")
+    asyncio.create_task(sample_resources_periodically())
     asyncio.create_task(log_memory_periodically())
 
     logger.info("Starting background job loop")
     asyncio.create_task(job_process_loop())
 
+    logger.info("Starting old jobs cleanup loop")
+    asyncio.create_task(job_cleanup_loop())
+
     logger.info("Starting daily notifications at 10 AM UTC")
     asyncio.create_task(notify_at_10am_daily())
 
@@ -29,6 +29,15 @@ JOOBLE_SEARCH_MODE = 1
 # empty = no limit
 JOOBLE_DATE = None
 
+# retries per page on network errors, 429 and 5xx responses
+JOOBLE_MAX_RETRIES = 3
+
+# base seconds for exponential backoff between retries
+JOOBLE_RETRY_BACKOFF = 1.0
+
+# pages requested concurrently, 1 = one page after another
+JOOBLE_PREFETCH_PAGES = 3
+
 
 # Headless mode
 
@@ -42,6 +51,27 @@ BULLDOG_HEADLESS = True
 ROBOTA_UA_HEADLESS = False
 
 
+# Anti-block rate limits
+
+# max real requests (navigations, clicks, scroll loads) per second per host
+SITE_REQUEST_RATES = {
+    "justjoin.it": 0.5,
+    "djinni.co": 0.3,
+    "nofluffjobs.com": 0.3,
+    "pracuj.pl": 0.2,
+    "jobs.dou.ua": 0.3,
+    "bulldogjob.com": 0.3,
+    "robota.ua": 0.1,
+}
+DEFAULT_REQUEST_RATE = 0.2
+
+# requests allowed back-to-back before the rate applies
+REQUEST_BURST = 2
+
+# max extra random seconds added to every throttled request
+REQUEST_JITTER = 1.5
+
+
 # Fetching limitations
 
 JUST_JOIN_MAX_JOBS = 1000
@@ -54,11 +84,44 @@ ROBOTA_UA_MAX_JOBS = 500
 JOOBLE_MAX_JOBS = 1000
 
 
+# Scrolling settings
+
+# max ms to wait for new JustJoin cards after a scroll before stopping
+JUST_JOIN_SCROLL_TIMEOUT = 15000
+
+
+# Saving settings
+
+# jobs written per INSERT ... ON CONFLICT statement
+SAVE_JOBS_CHUNK_SIZE = 500
+
+# fetched jobs buffered before they are saved, keeps memory flat
+SAVE_JOBS_BATCH_SIZE = 100
+
+
 # Filtration settings
 
 # set a job threshold to not show vacancies under this score
 SCORE_THRESHOLD = 0
 
+# region of each job source, "All" sources are shown only for region "all"
+REGION_MAP = {
+    "robota_ua": "Ukraine",
+    "djinni": "Ukraine",
+    "dou": "Ukraine",
+    "justjoin": "Poland",
+    "nofluff": "Poland",
+    "pracuj": "Poland",
+    "bulldog": "Poland",
+    "jooble": "All",
+}
+
+# users whose batch scores are written per transaction
+SCORE_SAVE_CHUNK_SIZE = 50
+
+# users whose parsed keywords stay cached between refreshes (LRU)
+KEYWORD_CACHE_SIZE = 1024
+
 
 # Archiving settings
 
@@ -67,3 +130,61 @@ JOB_ARCHIVE_DAYS = 7
 
 # Number of days after which an archived job can be deleted
 ARCHIVE_LIFETIME_DAYS = 30
+
+# jobs deleted per transaction, keeps cascade locks short
+CLEANUP_BATCH_SIZE = 1000
+
+# seconds to pause between delete batches
+CLEANUP_BATCH_PAUSE = 0.5
+
+# hours between cleanup runs, independent of the fetch loop
+CLEANUP_INTERVAL_HOURS = 24
+
+
+# Orchestration settings
+
+# run fetchers concurrently instead of one site after another
+FETCH_CONCURRENTLY = True
+
+# max number of sites fetched at the same time
+FETCH_MAX_CONCURRENCY = 3
+
+# max seconds for a single site before it is cancelled
+FETCH_SITE_TIMEOUT = 2 * 60 * 60
+
+
+# Browser pool settings
+
+# max browser contexts (site pages) open at the same time
+BROWSER_MAX_CONTEXTS = 3
+
+# relaunch Chromium after this many pages were handed out
+BROWSER_RECYCLE_PAGES = 20
+
+# relaunch Chromium when its processes use more memory than this (MB)
+BROWSER_RECYCLE_MEMORY_MB = 1500
+
+
+# Resource monitoring settings
+
+# seconds between background memory/CPU samples
+RESOURCE_SAMPLE_INTERVAL = 5
+
+# number of samples kept in history (720 * 5s = 1 hour)
+RESOURCE_HISTORY_SIZE = 720
+
+
+# Notification settings
+
+# users loaded, notified and marked as notified per batch
+NOTIFY_BATCH_SIZE = 500
+
+# concurrent senders, Telegram API calls are network bound
+NOTIFY_WORKERS = 20
+
+# max messages per second for the whole bot, Telegram allows about 30
+NOTIFY_RATE = 25
+NOTIFY_BURST = 5
+
+# retries per user after Telegram flood control (RetryAfter)
+NOTIFY_RETRIES = 3
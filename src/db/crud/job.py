@@ -1,17 +1,38 @@
+import hashlib
 from datetime import datetime, timezone, timedelta
 
-from sqlalchemy import select, insert, update
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    and_,
+    select,
+    insert,
+    update,
+    func,
+    literal_column,
+    or_,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from logs.logger import logger
 from src.config import JOB_ARCHIVE_DAYS
 from src.db.models.job import Job
+from src.utils.search_text import build_search_text
+
+
+def match_job_urls(*urls: str) -> ColumnElement[bool]:
+    """Filter jobs by URL through the unique md5(url) index."""
+    # hashed here, plain bound values keep the statement cacheable
+    hashes = [hashlib.md5(url.encode()).hexdigest() for url in urls]
+    return and_(func.md5(Job.url).in_(hashes), Job.url.in_(urls))
 
 
 async def get_job_by_url(session: AsyncSession, url: str) -> Job | None:
     """Fetch a Job by URL."""
     try:
-        result = await session.execute(select(Job).where(Job.url == url))
+        result = await session.execute(select(Job).where(match_job_urls(url)))
         return result.scalars().first()
     except Exception as e:
         logger.error(f"Failed to fetch job by URL '{url}': {e}")
@@ -28,6 +49,70 @@ async def get_job_by_id(session: AsyncSession, job_id: int) -> Job | None:
         return None
 
 
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards with '/'."""
+    return (
+        value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    )
+
+
+async def get_scoring_watermark(session: AsyncSession) -> datetime | None:
+    """Fetch the time before which every job write is visible."""
+    # jobs take last_seen from now(), their transaction start, so writes
+    # still in flight can't be older than the oldest open transaction
+    oldest_xact = (
+        select(func.min(literal_column("xact_start")))
+        .select_from(text("pg_stat_activity"))
+        .where(
+            literal_column("datname") == func.current_database(),
+            literal_column("pid") != func.pg_backend_pid(),
+        )
+        .scalar_subquery()
+    )
+    try:
+        result = await session.execute(
+            select(func.least(func.clock_timestamp(), oldest_xact))
+        )
+        return result.scalar()
+    except Exception as e:
+        logger.error(f"Failed to fetch scoring watermark: {e}")
+        return None
+
+
+async def get_candidate_jobs(
+    session: AsyncSession,
+    sources: list[str] | None = None,
+    keywords: list[str] | None = None,
+    seen_since: datetime | None = None,
+) -> list[Row]:
+    """Fetch scoring columns of active jobs by source and keywords."""
+    stmt = select(Job.id, Job.source, Job.search_text, Job.last_seen).where(
+        or_(Job.archived_at.is_(None), Job.archived_at > func.now())
+    )
+    if seen_since is not None:
+        # new and re-seen jobs, archived ones come back when seen again
+        stmt = stmt.where(Job.last_seen >= seen_since)
+    if sources is not None:
+        stmt = stmt.where(Job.source.in_(sources))
+    if keywords:
+        # a job without any keyword scores 0, trigram index finds the rest
+        stmt = stmt.where(
+            or_(
+                *(
+                    Job.search_text.like(f"%{escape_like(kw)}%", escape="/")
+                    for kw in keywords
+                )
+            )
+        )
+
+    try:
+        result = await session.execute(stmt)
+        return list(result.all())
+    except Exception as e:
+        logger.error(f"Failed to fetch candidate jobs: {e}")
+        return []
+
+
 async def create_job(
     session: AsyncSession,
     title: str,
@@ -48,6 +133,7 @@ async def create_job(
             skills=skills,
             score=score,
             url=url,
+            search_text=build_search_text(title, skills),
         )
         session.add(job)
         await session.commit()
@@ -71,6 +157,44 @@ async def create_multiple_jobs(session: AsyncSession, jobs_data: list[dict]):
         logger.error(f"Failed to insert multiple jobs: {e}")
 
 
+async def upsert_jobs(
+    session: AsyncSession, jobs_data: list[dict]
+) -> tuple[int, int]:
+    """Insert new jobs and refresh seen dates of existing ones."""
+    if not jobs_data:
+        return 0, 0
+
+    # last_seen from the database clock, see get_scoring_watermark
+    stmt = pg_insert(Job).values(
+        [{**job_data, "last_seen": func.now()} for job_data in jobs_data]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[func.md5(Job.url)],
+        set_={
+            "last_seen": stmt.excluded.last_seen,
+            "archived_at": stmt.excluded.archived_at,
+            "source": func.coalesce(stmt.excluded.source, Job.source),
+            "search_text": func.coalesce(
+                Job.search_text, stmt.excluded.search_text
+            ),
+        },
+    )
+    # xmax is 0 only for freshly inserted rows
+    stmt = stmt.returning(literal_column("xmax = 0"))
+
+    try:
+        result = await session.execute(stmt)
+        inserted_flags = result.scalars().all()
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to upsert jobs: {e}")
+        return 0, 0
+
+    inserted = sum(1 for flag in inserted_flags if flag)
+    return inserted, len(inserted_flags) - inserted
+
+
 async def update_jobs_last_seen_archived_at(
     session: AsyncSession, urls: list[str]
 ) -> None:
@@ -85,8 +209,8 @@ async def update_jobs_last_seen_archived_at(
     try:
         await session.execute(
             update(Job)
-            .where(Job.url.in_(urls))
-            .values(last_seen=now, archived_at=new_archived_at)
+            .where(match_job_urls(*urls))
+            .values(last_seen=func.now(), archived_at=new_archived_at)
         )
         await session.commit()
         logger.info(
@@ -0,0 +1,36 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from logs.logger import logger
+from src.db.models.telegram_media import TelegramMedia
+
+
+async def get_all_media_file_ids(session: AsyncSession) -> dict[str, str]:
+    """Fetch stored file_ids keyed by media URL."""
+    try:
+        result = await session.execute(
+            select(TelegramMedia.url, TelegramMedia.file_id)
+        )
+        return {row.url: row.file_id for row in result}
+    except Exception as e:
+        logger.error(f"Failed to fetch media file ids: {e}")
+        return {}
+
+
+async def save_media_file_id(
+    session: AsyncSession, url: str, file_id: str
+) -> None:
+    """Insert or replace the file_id of a media URL."""
+    try:
+        stmt = pg_insert(TelegramMedia).values(url=url, file_id=file_id)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[TelegramMedia.url],
+                set_={"file_id": stmt.excluded.file_id},
+            )
+        )
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Failed to save file id for {url}: {e}")
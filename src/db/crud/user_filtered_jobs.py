@@ -1,22 +1,127 @@
-from typing import Sequence
+from datetime import datetime, timezone
+from typing import Collection, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from logs.logger import logger
 from src.db.models import Job
 from src.db.models.user_filtered_job import UserFilteredJob
+from src.db.models.user_job import UserJob
 
 
 async def create_user_filtered_jobs(
-    session: AsyncSession, entries: list[UserFilteredJob]
+    session: AsyncSession, user_id: int, scored_jobs: list[tuple[int, int]]
 ) -> None:
-    """Insert multiple UserFilteredJob entries."""
+    """Bulk insert (job_id, score) pairs without ORM objects."""
+    if not scored_jobs:
+        return
+    now = datetime.now(timezone.utc)
+    # executemany is batched into multi-row INSERT ... VALUES statements
+    await session.execute(
+        insert(UserFilteredJob),
+        [
+            {
+                "user_id": user_id,
+                "job_id": job_id,
+                "score": score,
+                "datetime_added": now,
+            }
+            for job_id, score in scored_jobs
+        ],
+    )
+
+
+async def save_user_filtered_jobs(
+    session: AsyncSession,
+    scored_jobs: dict[int, list[tuple[int, int]]],
+    rebuild_ids: Collection[int],
+    limit: int,
+) -> None:
+    """Store several users' (job_id, score) pairs in one transaction.
+
+    Lists of rebuild_ids replace the stored ones, the others are merged:
+    archived jobs dropped, new scores added, only the top limit kept.
+    """
+    user_ids = list(scored_jobs)
+    rebuilt = [u for u in user_ids if u in rebuild_ids]
+    merged = [u for u in user_ids if u not in rebuild_ids]
+    rows = [
+        {"user_id": user_id, "job_id": job_id, "score": score}
+        for user_id, pairs in scored_jobs.items()
+        for job_id, score in pairs
+    ]
     try:
-        session.add_all(entries)
+        # one transaction, readers never see a list half written
+        if rebuilt:
+            await session.execute(
+                delete(UserFilteredJob).where(
+                    UserFilteredJob.user_id.in_(rebuilt)
+                )
+            )
+        if merged:
+            await session.execute(
+                delete(UserFilteredJob).where(
+                    UserFilteredJob.user_id.in_(merged),
+                    UserFilteredJob.job_id == Job.id,
+                    Job.archived_at <= func.now(),
+                )
+            )
+        if rows:
+            stmt = pg_insert(UserFilteredJob)
+            # executemany is batched into multi-row INSERT ... VALUES
+            await session.execute(
+                stmt.on_conflict_do_update(
+                    constraint="uix_user_filtered_job",
+                    set_={"score": stmt.excluded.score},
+                ),
+                rows,
+            )
+        if merged:
+            ranked = (
+                select(
+                    UserFilteredJob.id,
+                    func.row_number()
+                    .over(
+                        partition_by=UserFilteredJob.user_id,
+                        order_by=(
+                            UserFilteredJob.score.desc(),
+                            UserFilteredJob.job_id.desc(),
+                        ),
+                    )
+                    .label("rank"),
+                )
+                .where(UserFilteredJob.user_id.in_(merged))
+                .subquery()
+            )
+            await session.execute(
+                delete(UserFilteredJob).where(
+                    UserFilteredJob.id.in_(
+                        select(ranked.c.id).where(ranked.c.rank > limit)
+                    )
+                )
+            )
         await session.commit()
     except Exception as e:
-        logger.error(f"Failed to insert user filtered jobs: {e}")
+        await session.rollback()
+        logger.error(
+            f"Failed to save filtered jobs of {len(user_ids)} users: {e}"
+        )
+
+
+async def count_user_filtered_jobs(
+    session: AsyncSession, user_id: int
+) -> int:
+    """Count a user's filtered jobs."""
+    try:
+        result = await session.execute(
+            select(func.count()).where(UserFilteredJob.user_id == user_id)
+        )
+        return result.scalar() or 0
+    except Exception as e:
+        logger.error(f"Failed to count filtered jobs for user {user_id}: {e}")
+        return 0
 
 
 async def get_filtered_jobs_by_user(
@@ -37,6 +142,35 @@ async def get_filtered_jobs_by_user(
         return []
 
 
+async def get_unseen_jobs(
+    session: AsyncSession,
+    user_id: int,
+    limit: int,
+    exclude_ids: Collection[int] = (),
+) -> list[tuple[Job, int | None]]:
+    """Fetch the best filtered jobs the user wasn't sent yet."""
+    try:
+        seen = select(UserJob.id).where(
+            UserJob.user_id == user_id,
+            UserJob.job_id == UserFilteredJob.job_id,
+            UserJob.status.in_(("sent", "applied", "skipped")),
+        )
+        stmt = (
+            select(Job, UserFilteredJob.score)
+            .join(UserFilteredJob, UserFilteredJob.job_id == Job.id)
+            .where(UserFilteredJob.user_id == user_id, ~seen.exists())
+            .order_by(UserFilteredJob.score.desc(), Job.last_seen.desc())
+            .limit(limit)
+        )
+        if exclude_ids:
+            stmt = stmt.where(UserFilteredJob.job_id.not_in(exclude_ids))
+        result = await session.execute(stmt)
+        return [(row.Job, row.score) for row in result]
+    except Exception as e:
+        logger.error(f"Failed to fetch unseen jobs for user {user_id}: {e}")
+        return []
+
+
 async def get_filtered_job(
     session: AsyncSession, user_id: int, job_id: int
 ) -> UserFilteredJob | None:
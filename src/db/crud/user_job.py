@@ -1,9 +1,12 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import Row, case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from logs.logger import logger
+from src.db.models.job import Job
+from src.db.models.user import User
 from src.db.models.user_job import UserJob
 
 
@@ -69,3 +72,99 @@ async def update_user_job_status(
             f"Failed to update status for UserJob {user_job.job_id}: {e}"
         )
         return None
+
+
+async def mark_user_job(
+    session: AsyncSession, telegram_id: int, job_id: int, status: str
+) -> Row | None:
+    """Upsert a user's job status, return user_id and job title."""
+    try:
+        stmt = pg_insert(UserJob).from_select(
+            ["user_id", "job_id", "status", "datetime_sent"],
+            select(User.id, Job.id, literal(status), func.now()).where(
+                User.telegram_id == telegram_id, Job.id == job_id
+            ),
+        )
+        mark = (
+            stmt.on_conflict_do_update(
+                constraint="uix_user_job",
+                set_={"status": stmt.excluded.status},
+            )
+            .returning(UserJob.user_id, UserJob.job_id)
+            .cte("mark")
+        )
+        result = await session.execute(
+            select(mark.c.user_id, Job.title).join(
+                Job, Job.id == mark.c.job_id
+            )
+        )
+        return result.first()
+    except Exception as e:
+        await session.rollback()
+        logger.error(
+            f"Failed to mark job {job_id} as {status} for {telegram_id}: {e}"
+        )
+        return None
+
+
+async def reserve_vacancy(
+    session: AsyncSession, user_id: int, job_id: int, daily_limit: int
+) -> Row | None:
+    """Mark a job sent and count it against the daily limit.
+
+    Returns within_limit and vacancies_count, the count is None when the
+    job was sent before. None on failure, earlier changes are kept.
+    """
+    today = date.today()
+    new_day = User.last_reset_date < today
+    # the row lock makes concurrent reservations wait and recheck the limit
+    quota = (
+        select(User.id)
+        .where(
+            User.id == user_id,
+            new_day | (User.vacancies_count < daily_limit),
+        )
+        .with_for_update()
+        .cte("quota")
+    )
+    sent = (
+        pg_insert(UserJob)
+        .from_select(
+            ["user_id", "job_id", "status", "datetime_sent"],
+            select(quota.c.id, literal(job_id), literal("sent"), func.now()),
+        )
+        .on_conflict_do_nothing(constraint="uix_user_job")
+        .returning(UserJob.user_id)
+        .cte("sent")
+    )
+    # counts only a job that was inserted just now
+    counted = (
+        update(User)
+        .where(User.id == user_id, select(sent.c.user_id).exists())
+        .values(
+            vacancies_count=case(
+                (new_day, 1), else_=User.vacancies_count + 1
+            ),
+            refresh_count=case((new_day, 0), else_=User.refresh_count),
+            last_reset_date=today,
+        )
+        .returning(User.vacancies_count)
+        .cte("counted")
+    )
+    try:
+        # a savepoint, so a failure keeps the caller's status update
+        async with session.begin_nested():
+            result = await session.execute(
+                select(
+                    select(quota.c.id).exists().label("within_limit"),
+                    select(counted.c.vacancies_count)
+                    .scalar_subquery()
+                    .label("vacancies_count"),
+                )
+            )
+            return result.one()
+    except Exception as e:
+        logger.error(
+            f"Failed to reserve job {job_id} for user {user_id}: {e}"
+        )
+        return None
@@ -1,13 +1,18 @@
 import asyncio
 import os
-from typing import AsyncGenerator
+import time
+import weakref
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import exc, text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from dotenv import load_dotenv
 
 from logs.logger import logger
@@ -26,17 +31,139 @@ DATABASE_URL = (
     f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,  # checks if a connection is alive before using it
-    pool_recycle=1800,  # recycle connections every 30 minutes (seconds)
-)
+# seconds to wait for a free connection before TimeoutError
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+# recycle connections older than this (seconds)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+# extra SELECT 1 on every checkout, recycle alone may be enough
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+# prepared statements kept per connection by the asyncpg dialect, 0 = off
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 256))
+# compiled SQL strings cached by SQLAlchemy per engine
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", 1000))
+
+# bot: Telegram handlers and API, batch: fetching, scoring, broadcasts
+DB_POOL_PROFILES = {
+    "bot": {
+        "pool_size": int(os.getenv("DB_BOT_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_BOT_MAX_OVERFLOW", 5)),
+    },
+    "batch": {
+        "pool_size": int(os.getenv("DB_BATCH_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_BATCH_MAX_OVERFLOW", 10)),
+    },
+}
+
+
+# QueuePool._do_get retries through self._do_get, time only the outer call
+_in_checkout: ContextVar[bool] = ContextVar("_in_checkout", default=False)
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout queue waits and connect times."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # successful checkouts, wait_* excludes opening new connections
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.connects = 0
+        self.connect_total = 0.0
+        self._connect_times: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _create_connection(self) -> Any:
+        start = time.perf_counter()
+        record = super()._create_connection()
+        connect_time = time.perf_counter() - start
+        self._connect_times[record] = connect_time
+        self.connects += 1
+        self.connect_total += connect_time
+        return record
+
+    def _do_get(self) -> Any:
+        if _in_checkout.get():
+            return super()._do_get()
+
+        start = time.perf_counter()
+        token = _in_checkout.set(True)
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            logger.warning(f"DB pool exhausted: {self.status()}")
+            raise
+        finally:
+            _in_checkout.reset(token)
+
+        wait = (
+            time.perf_counter()
+            - start
+            - self._connect_times.pop(record, 0.0)
+        )
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return record
+
+
+def create_pool_engine(
+    profile: str, statement_cache_size: int = DB_STATEMENT_CACHE_SIZE
+) -> AsyncEngine:
+    """Create an engine with the named pool profile."""
+    return create_async_engine(
+        DATABASE_URL,
+        echo=False,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        connect_args={"prepared_statement_cache_size": statement_cache_size},
+        poolclass=TimedQueuePool,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        **DB_POOL_PROFILES[profile],
+    )
+
+
+engine = create_pool_engine("bot")
+batch_engine = create_pool_engine("batch")
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
 )
+BatchSessionLocal = async_sessionmaker(
+    bind=batch_engine,
+    expire_on_commit=False,
+)
+
+
+def get_pool_stats() -> dict[str, dict]:
+    """Return live usage, queue waits and connect times of every pool."""
+    stats = {}
+    for name, pool_engine in (("bot", engine), ("batch", batch_engine)):
+        pool: TimedQueuePool = pool_engine.pool
+        stats[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": DB_POOL_PROFILES[name]["max_overflow"],
+            "checkouts": pool.checkouts,
+            "timeouts": pool.timeouts,
+            "wait_avg_ms": round(
+                pool.wait_total / (pool.checkouts or 1) * 1000, 2
+            ),
+            "wait_max_ms": round(pool.wait_max * 1000, 2),
+            "connects": pool.connects,
+            "connect_avg_ms": round(
+                pool.connect_total / (pool.connects or 1) * 1000, 2
+            ),
+        }
+    return stats
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
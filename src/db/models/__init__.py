@@ -3,3 +3,4 @@ from .user import User  # noqa: F401
 from .user_job import UserJob  # noqa: F401
 from .user_filtered_job import UserFilteredJob  # noqa: F401
 from .user_keyword import UserKeyword  # noqa: F401
+from .telegram_media import TelegramMedia  # noqa: F401
@@ -7,6 +7,8 @@ from sqlalchemy import (
     ARRAY,
     Text,
     DateTime,
+    Index,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,6 +23,20 @@ class Job(Base):
     """Scraped job listings."""
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # hash keeps the unique index small for long URLs
+        Index("uix_jobs_url_md5", text("md5(url)"), unique=True),
+        Index("ix_jobs_source", "source"),
+        # archived jobs lookup in cleanup
+        Index("ix_jobs_archived_at", "archived_at"),
+        # pg_trgm index, serves LIKE '%keyword%' lookups
+        Index(
+            "ix_jobs_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -32,6 +48,10 @@ class Job(Base):
     )
     score: Mapped[int] = mapped_column(Integer, nullable=False)
     url: Mapped[str] = mapped_column(Text, nullable=False)
+    # fetcher name, e.g. "djinni", used for region selection
+    source: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    # normalized "title\nskills", see utils.search_text
+    search_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     last_seen: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
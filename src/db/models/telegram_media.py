@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models.base import Base
+
+
+class TelegramMedia(Base):
+    """Telegram file_id of media first sent by URL."""
+
+    __tablename__ = "telegram_media"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    url: Mapped[str] = mapped_column(Text, unique=True)
+    file_id: Mapped[str] = mapped_column(String(255))
+    datetime_added: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -1,10 +1,11 @@
-from datetime import date
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     String,
     BigInteger,
     Date as SQLDate,
+    DateTime,
     Integer,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -37,6 +38,14 @@ class User(Base):
         SQLDate, nullable=True
     )
 
+    # incremental scoring: jobs seen since scored_at, keywords/region hash
+    scored_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    scoring_profile: Mapped[str | None] = mapped_column(
+        String(32), nullable=True
+    )
+
     jobs: Mapped[list["UserJob"]] = relationship(back_populates="user")
     keywords: Mapped[list["UserKeyword"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
@@ -5,7 +5,9 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +25,14 @@ class UserFilteredJob(Base):
     __tablename__ = "user_filtered_jobs"
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="uix_user_filtered_job"),
+        # serves the next unseen vacancy lookup in score order
+        Index(
+            "ix_user_filtered_jobs_user_score",
+            "user_id",
+            text("score DESC"),
+        ),
+        # the jobs ON DELETE CASCADE looks rows up by job_id alone
+        Index("ix_user_filtered_jobs_job_id", "job_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
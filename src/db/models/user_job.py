@@ -5,6 +5,7 @@ from sqlalchemy import (
     String,
     DateTime,
     ForeignKey,
+    Index,
     UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -22,6 +23,8 @@ class UserJob(Base):
     __tablename__ = "user_jobs"
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="uix_user_job"),
+        # the jobs ON DELETE CASCADE looks rows up by job_id alone
+        Index("ix_user_jobs_job_id", "job_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
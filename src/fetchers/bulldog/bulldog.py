@@ -1,38 +1,27 @@
 import asyncio
-from typing import List
 
-from src.db.db import AsyncSessionLocal
 from src.fetchers.bulldog.fetcher import fetch_bulldog_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> List[dict]:
-    """Fetch jobs from Bulldog API and save to database."""
+async def run_fetch_and_save_jobs() -> int:
+    """Fetch jobs from Bulldog and save them batch by batch."""
     logger.info("-" * 60)
     logger.info("Starting full fetch and save operation")
 
     try:
-        # Fetch jobs from the external Bulldog API
-        jobs = await fetch_bulldog_jobs()
-    except Exception as fetch_err:
-        logger.exception(f"Error fetching jobs: {fetch_err}")
-        return []
+        # Save each fetched page while the next one is scraped
+        saved = await save_job_batches(fetch_bulldog_jobs(), "bulldog")
+    except Exception as err:
+        logger.exception(f"Error fetching or saving jobs: {err}")
+        return 0
 
-    if not jobs:
+    if not saved:
         logger.info("No jobs fetched from Bulldog.")
-        return []
-
-    try:
-        # Save fetched jobs to the database asynchronously
-        async with AsyncSessionLocal() as session:
-            await save_jobs_to_db(jobs, session)
-    except Exception as save_err:
-        logger.exception(f"Error saving jobs: {save_err}")
-        return []
 
     logger.info("Bulldog job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
-from typing import Dict, Any, Union, List
+from typing import Any, AsyncIterator, Dict, List, Union
 
-from playwright.async_api import async_playwright, ViewportSize
+from playwright.async_api import ViewportSize
 from tqdm.asyncio import tqdm_asyncio
 
 from src.config import BULLDOG_MAX_JOBS, BULLDOG_HEADLESS
@@ -9,55 +9,42 @@ from src.fetchers.bulldog.pagination import (
     get_bulldog_max_pages,
 )
 from logs.logger import logger
-from src.utils.fetching.anti_block import (
-    get_random_user_agent,
-    random_wait,
-)
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
+from src.utils.fetching.dom_extraction import CardSpec, extract_cards
 from src.utils.fetching.fetcher_optimization import block_resources
 
 
-async def extract_bulldog_job(item: Any) -> Dict[str, Union[str, List[str]]]:
-    """Extract job info from Bulldog job element safely."""
+# selectors for one Bulldog job card, read in a single page.evaluate
+BULLDOG_CARD_SELECTOR = "a.JobListItem_item__fYh8y"
+BULLDOG_CARD_SPEC: CardSpec = {
+    "title": {"selector": "h3"},
+    "url": {"attr": "href"},
+    "company": {"selector": "div.uppercase"},
+    "location": {
+        "selector": "div.JobListItem_item__details__sg4tk span.text-xs"
+    },
+    "salary": {"selector": "div.JobListItem_item__salary__OIin6"},
+    "skills": {
+        "selector": "div.JobListItem_item__tags__POZkk span",
+        "many": True,
+    },
+}
+
+
+def extract_bulldog_job(
+    raw: Dict[str, Any],
+) -> Dict[str, Union[str, List[str]]]:
+    """Build job info from raw Bulldog card fields safely."""
     job: Dict[str, Union[str, List[str]]] = {}
 
     try:
-        title_el = await item.query_selector("h3")
-        if title_el:
-            title = await title_el.text_content()
-            if title:
-                job["title"] = title.strip()
-
-        url_el = await item.get_attribute("href")
-        if url_el:
-            job["url"] = url_el.strip()
-
-        company_el = await item.query_selector("div.uppercase")
-        if company_el:
-            company = await company_el.text_content()
-            if company:
-                job["company"] = company.strip()
-
-        location_el = await item.query_selector(
-            "div.JobListItem_item__details__sg4tk span.text-xs"
-        )
-        if location_el:
-            location = await location_el.text_content()
-            if location:
-                job["location"] = location.strip()
-
-        salary_el = await item.query_selector(
-            "div.JobListItem_item__salary__OIin6"
-        )
-        if salary_el:
-            salary = await salary_el.text_content()
-            if salary:
-                job["salary"] = salary.strip()
+        for field in ("title", "url", "company", "location", "salary"):
+            if raw.get(field):
+                job[field] = raw[field].strip()
 
         # Collect all skills, stripping whitespace
-        skill_elements = await item.query_selector_all(
-            "div.JobListItem_item__tags__POZkk span"
-        )
-        skills = [await el.text_content() for el in skill_elements]
+        skills = raw.get("skills") or []
         if skills:
             job["skills"] = [s.strip() for s in skills]
 
@@ -67,43 +54,38 @@ async def extract_bulldog_job(item: Any) -> Dict[str, Union[str, List[str]]]:
     return job
 
 
-async def fetch_bulldog_jobs() -> List[Dict[str, Any]]:
-    """Fetch jobs from Bulldogjob site asynchronously."""
-    all_jobs: List[Dict[str, Any]] = []
+async def fetch_bulldog_jobs() -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield jobs from Bulldogjob site page by page."""
+    total = 0
 
     try:
         logger.info("-" * 60)
         logger.info("Launching browser for Bulldogjob scraping")
 
-        async with async_playwright() as p:
-            launch_args: Dict[str, Any] = {"headless": BULLDOG_HEADLESS}
-            browser = await p.chromium.launch(**launch_args)
-
-            # Random User-Agent
-            ua = get_random_user_agent()
-            logger.info(f"User-agent: {ua}")
-            page = await browser.new_page(
-                viewport=ViewportSize(width=600, height=400)
-            )
-            await page.route("**/*", block_resources)
-
+        async with browser_pool.new_page(
+            headless=BULLDOG_HEADLESS,
+            viewport=ViewportSize(width=600, height=400),
+            route_handler=block_resources,
+        ) as page:
             max_pages = await get_bulldog_max_pages(page)
 
             # Loop through multiple pages
             for url in bulldog_pages(start=1, end=max_pages):
                 logger.info(f"Fetching Bulldog page: {url}")
+                await throttle_request(url)
                 await page.goto(url)
                 await page.wait_for_selector(
-                    "a.JobListItem_item__fYh8y", timeout=5000
+                    BULLDOG_CARD_SELECTOR, timeout=5000
                 )
-                job_items = await page.query_selector_all(
-                    "a.JobListItem_item__fYh8y"
+                job_items = await extract_cards(
+                    page, BULLDOG_CARD_SELECTOR, BULLDOG_CARD_SPEC
                 )
 
                 if not job_items:
                     logger.info("No job items found on this page.")
                     continue
 
+                page_jobs: List[Dict[str, Any]] = []
                 for i, item in enumerate(
                     tqdm_asyncio(
                         job_items, desc="Fetching jobs", mininterval=120.0
@@ -111,18 +93,19 @@ async def fetch_bulldog_jobs() -> List[Dict[str, Any]]:
                     1,
                 ):
                     # Jobs limit
-                    if len(all_jobs) >= BULLDOG_MAX_JOBS:
+                    if total >= BULLDOG_MAX_JOBS:
                         logger.info(
                             f"Reached max job count of {BULLDOG_MAX_JOBS}, "
                             f"stopping scraping."
                         )
                         break
 
-                    job = await extract_bulldog_job(item)
+                    job = extract_bulldog_job(item)
                     if "title" in job and "url" in job:
-                        all_jobs.append(job)
+                        page_jobs.append(job)
+                        total += 1
                         logger.debug(
-                            f"{len(all_jobs):>3}. {job['title']:<60} @ "
+                            f"{total:>3}. {job['title']:<60} @ "
                             f"{job.get('company', 'unknown')}"
                         )
                     else:
@@ -130,16 +113,13 @@ async def fetch_bulldog_jobs() -> List[Dict[str, Any]]:
                             f"Skipped job #{i} due to missing title or URL"
                         )
 
-                    # Anti-block delay
-                    await random_wait(0.5, 5.0)
+                if page_jobs:
+                    yield page_jobs
 
-                if len(all_jobs) >= BULLDOG_MAX_JOBS:
+                if total >= BULLDOG_MAX_JOBS:
                     break
 
-            await browser.close()
-            logger.info(f"Scraping done. Total jobs fetched: {len(all_jobs)}")
+            logger.info(f"Scraping done. Total jobs fetched: {total}")
 
     except Exception as err:
         logger.exception(f"Error fetching Bulldog jobs: {err}")
-
-    return all_jobs
@@ -4,12 +4,14 @@ from playwright.async_api import Page
 
 from logs.logger import logger
 from src.config import BULLDOG_URL
+from src.utils.fetching.anti_block import throttle_request
 
 
 async def get_bulldog_max_pages(page: Page) -> int:
     """Get max BulldogJob pages from pagination element."""
     max_page = 1
     try:
+        await throttle_request(BULLDOG_URL)
         await page.goto(BULLDOG_URL)
         await page.wait_for_selector(
             "li.w-10.h-10.mx-1.rounded-full"
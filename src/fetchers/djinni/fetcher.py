@@ -1,61 +1,56 @@
-from playwright.async_api import async_playwright, ViewportSize
+from playwright.async_api import ViewportSize
 
-from typing import Dict, List, Union
+from typing import Any, AsyncIterator, Dict, List, Union
 
 from tqdm.asyncio import tqdm_asyncio
 
 from src.config import DJINNI_HEADLESS, DJINNI_URL, DJINNI_MAX_JOBS
 from src.fetchers.djinni.pagination import build_paginated_url
 from logs.logger import logger
-from src.utils.fetching.anti_block import get_random_user_agent, random_wait
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
+from src.utils.fetching.dom_extraction import CardSpec, extract_cards
 from src.utils.fetching.fetcher_optimization import block_resources
 
 
-async def extract_job_data(item) -> Dict[str, Union[str, List[str]]]:
-    """Extract Djinni job info safely."""
+# selectors for one Djinni job card, read in a single page.evaluate
+DJINNI_CARD_SELECTOR = "ul.list-unstyled > li"
+DJINNI_CARD_SPEC: CardSpec = {
+    "title": {"selector": "h2 a.job-item__title-link"},
+    "href": {"selector": "h2 a.job-item__title-link", "attr": "href"},
+    "company": {"selector": "a.text-body.js-analytics-event"},
+    "location": {"selector": "span.location-text"},
+    "salary": {"selector": ".job-item__salary"},
+    "skills": {"selector": ".job-item__tags span", "many": True},
+}
+
+
+def extract_job_data(raw: Dict[str, Any]) -> Dict[str, Union[str, List[str]]]:
+    """Build Djinni job info from raw card fields safely."""
     job: Dict[str, Union[str, List[str]]] = {}
 
     try:
-        title_el = await item.query_selector("h2 a.job-item__title-link")
-        if title_el:
-            title = await title_el.text_content()
-            href = await title_el.get_attribute("href")
-            if title:
-                job["title"] = title.strip()
-            if href:
-                job["url"] = f"https://djinni.co{href}"
-
-        company_el = await item.query_selector(
-            "a.text-body.js-analytics-event"
-        )
+        if raw.get("title"):
+            job["title"] = raw["title"].strip()
+        if raw.get("href"):
+            job["url"] = f"https://djinni.co{raw['href']}"
+
         job["company"] = (
-            (await company_el.text_content()).strip()
-            if company_el and await company_el.text_content()
-            else "unknown"
+            raw["company"].strip() if raw.get("company") else "unknown"
         )
 
-        location_el = await item.query_selector("span.location-text")
-        if location_el:
-            loc = await location_el.text_content()
-            if loc:
-                job["location"] = loc.strip()
-
-        salary_el = await item.query_selector(".job-item__salary")
-        if salary_el:
-            salary_text = (await salary_el.text_content() or "").strip()
-            if salary_text:
-                parts = salary_text.split()
-                if parts:
-                    job["salary"] = parts[0]
-                    if len(parts) > 1:
-                        job["currency"] = " ".join(parts[1:])
-
-        skills_elements = await item.query_selector_all(".job-item__tags span")
-        skills: List[str] = [
-            s.strip()
-            for s in [await el.text_content() for el in skills_elements]
-            if s
-        ]
+        if raw.get("location"):
+            job["location"] = raw["location"].strip()
+
+        salary_text = (raw.get("salary") or "").strip()
+        if salary_text:
+            parts = salary_text.split()
+            if parts:
+                job["salary"] = parts[0]
+                if len(parts) > 1:
+                    job["currency"] = " ".join(parts[1:])
+
+        skills: List[str] = [s.strip() for s in raw.get("skills") or [] if s]
         if skills:
             job["skills"] = skills
 
@@ -65,64 +60,61 @@ async def extract_job_data(item) -> Dict[str, Union[str, List[str]]]:
     return job
 
 
-async def fetch_jobs() -> List[Dict]:
-    """Fetch jobs from Djinni with pagination."""
+async def fetch_jobs() -> AsyncIterator[List[Dict]]:
+    """Yield Djinni jobs page by page."""
     logger.info("-" * 60)
     logger.info("Starting browser and navigating to Djinni base URL")
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=DJINNI_HEADLESS)
-
-            # Random User-Agent
-            ua = get_random_user_agent()
-            logger.info(f"User-agent: {ua}")
-            page = await browser.new_page(
-                viewport=ViewportSize(width=600, height=400)
-            )
-            await page.route("**/*", block_resources)
-
-            all_jobs: List[Dict] = []
+        async with browser_pool.new_page(
+            headless=DJINNI_HEADLESS,
+            viewport=ViewportSize(width=600, height=400),
+            route_handler=block_resources,
+        ) as page:
+            total = 0
             page_num = 1
 
             while True:
                 paginated_url = build_paginated_url(DJINNI_URL, page_num)
                 logger.debug(f"Fetching page {page_num}: {paginated_url}")
+                await throttle_request(paginated_url)
                 await page.goto(paginated_url)
 
                 try:
                     await page.wait_for_selector(
-                        "ul.list-unstyled > li", timeout=60000
+                        DJINNI_CARD_SELECTOR, timeout=60000
                     )
                 except TimeoutError:
                     logger.info("No job listings found. Stopping pagination.")
                     break
 
-                job_items = await page.query_selector_all(
-                    "ul.list-unstyled > li"
+                job_items = await extract_cards(
+                    page, DJINNI_CARD_SELECTOR, DJINNI_CARD_SPEC
                 )
                 if not job_items:
                     logger.info("No job listings found. Stopping pagination.")
                     break
 
+                page_jobs: List[Dict] = []
                 for i, item in enumerate(
                     tqdm_asyncio(
                         job_items, desc="Fetching jobs", mininterval=120.0
                     ),
                     1,
                 ):
-                    if len(all_jobs) >= DJINNI_MAX_JOBS:
+                    if total >= DJINNI_MAX_JOBS:
                         logger.info(
                             f"Reached max job count of {DJINNI_MAX_JOBS}, "
                             f"stopping scraping."
                         )
                         break
 
-                    job = await extract_job_data(item)
+                    job = extract_job_data(item)
                     if "title" in job and "url" in job:
-                        all_jobs.append(job)
+                        page_jobs.append(job)
+                        total += 1
                         logger.debug(
-                            f"{len(all_jobs):>3}. {job['title']:<60} @ "
+                            f"{total:>3}. {job['title']:<60} @ "
                             f"{job.get('company', 'unknown')}"
                         )
                     else:
@@ -130,21 +122,21 @@ async def fetch_jobs() -> List[Dict]:
                             f"Skipped job #{i} due to missing title or url"
                         )
 
-                    # Anti-block delay
-                    await random_wait(0.5, 5.0)
+                if page_jobs:
+                    yield page_jobs
 
-                if len(all_jobs) >= DJINNI_MAX_JOBS:
+                if total >= DJINNI_MAX_JOBS:
                     break
 
                 # Pagination check
-                pagination_items = await page.query_selector_all(
-                    "ul.pagination li.page-item a.page-link"
+                pagination_texts = await page.eval_on_selector_all(
+                    "ul.pagination li.page-item a.page-link",
+                    "els => els.map(el => el.textContent)",
                 )
                 page_numbers = [
-                    int(await item.text_content())
-                    for item in pagination_items
-                    if (await item.text_content())
-                    and (await item.text_content()).strip().isdigit()
+                    int(text)
+                    for text in pagination_texts
+                    if text and text.strip().isdigit()
                 ]
                 logger.info(f"Pagination buttons found: {page_numbers}")
 
@@ -157,10 +149,7 @@ async def fetch_jobs() -> List[Dict]:
 
                 page_num += 1
 
-            await browser.close()
-            logger.info(f"Browser closed. Total jobs fetched: {len(all_jobs)}")
-            return all_jobs
+            logger.info(f"Djinni done. Total jobs fetched: {total}")
 
     except Exception as e:
         logger.error(f"Error fetching jobs: {e}")
-        return []
@@ -1,36 +1,26 @@
 import asyncio
-from typing import List, Dict, Any
 
-from src.db.db import AsyncSessionLocal
 from src.fetchers.dou.fetcher import fetch_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> List[Dict[str, Any]]:
-    """Fetch DOU jobs and save them asynchronously."""
+async def run_fetch_and_save_jobs() -> int:
+    """Fetch DOU jobs and save them batch by batch."""
     logger.info("-" * 60)
     logger.info("Starting DOU job fetch & save process...")
 
     try:
-        jobs = await fetch_jobs()
-    except Exception as fetch_err:
-        logger.exception(f"Error fetching jobs: {fetch_err}")
-        return []
+        saved = await save_job_batches(fetch_jobs(), "dou")
+    except Exception as err:
+        logger.exception(f"Error fetching or saving jobs: {err}")
+        return 0
 
-    if not jobs:
+    if not saved:
         logger.info("No jobs fetched from DOU.")
-        return []
-
-    try:
-        async with AsyncSessionLocal() as session:
-            await save_jobs_to_db(jobs, session)
-    except Exception as save_err:
-        logger.exception(f"Error saving jobs: {save_err}")
-        return []
 
     logger.info("DOU job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
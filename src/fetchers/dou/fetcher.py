@@ -1,12 +1,14 @@
 import re
+from typing import AsyncIterator
 
 from tqdm.asyncio import tqdm_asyncio
-from playwright.async_api import async_playwright, ViewportSize
+from playwright.async_api import ViewportSize
 
 from src.config import DOU_URL, DOU_HEADLESS, DOU_MAX_JOBS
 from src.fetchers.dou.pagination import click_all_pagination_buttons
 from logs.logger import logger
-from src.utils.fetching.anti_block import get_random_user_agent, random_wait
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
 from src.utils.fetching.fetcher_optimization import block_resources
 
 
@@ -17,25 +19,20 @@ def clean_text(text: str) -> str:
     return re.sub(r"\s+", " ", text.replace("\xa0", " ")).strip()
 
 
-async def fetch_jobs() -> list[dict]:
-    """Fetches full job data from DOU job listing page."""
+async def fetch_jobs() -> AsyncIterator[list[dict]]:
+    """Yields job data from DOU job listing page as it is read."""
     logger.info("-" * 60)
-    logger.info(f"Starting to fetch DOU all_jobs through {DOU_URL}")
+    logger.info(f"Starting to fetch DOU jobs through {DOU_URL}")
 
-    all_jobs: list[dict] = []
+    fetched = 0
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=DOU_HEADLESS)
-
-            # Random User-Agent
-            ua = get_random_user_agent()
-            logger.info(f"User-agent: {ua}")
-            page = await browser.new_page(
-                viewport=ViewportSize(width=600, height=400)
-            )
-            await page.route("**/*", block_resources)
-
+        async with browser_pool.new_page(
+            headless=DOU_HEADLESS,
+            viewport=ViewportSize(width=600, height=400),
+            route_handler=block_resources,
+        ) as page:
+            await throttle_request(DOU_URL)
             await page.goto(DOU_URL)
             await page.wait_for_selector("ul.lt > li.l-vacancy")
             await click_all_pagination_buttons(page)
@@ -47,7 +44,7 @@ async def fetch_jobs() -> list[dict]:
             for i in tqdm_asyncio(
                 range(count), desc="Fetching jobs", mininterval=120.0
             ):
-                if len(all_jobs) >= DOU_MAX_JOBS:
+                if fetched >= DOU_MAX_JOBS:
                     logger.info(
                         f"Reached max job count of "
                         f"{DOU_MAX_JOBS}, stopping scraping."
@@ -69,25 +66,14 @@ async def fetch_jobs() -> list[dict]:
                     "company": clean_text(company) if company else "",
                     "location": clean_text(location) if location else "",
                 }
-                all_jobs.append(clean_job)
+                fetched += 1
                 logger.debug(
                     f"{i+1:>3}. {clean_job['title']:<60} @ "
                     f"{clean_job.get('company', 'unknown')}"
                 )
+                yield [clean_job]
 
-                # Anti-block delay
-                await random_wait(0.5, 5.0)
-
-        logger.info(
-            f"Finished fetching all_jobs. Total all_jobs fetched:"
-            f" {len(all_jobs)}"
-        )
-        return all_jobs
+        logger.info(f"Finished fetching jobs. Total jobs fetched: {fetched}")
 
     except Exception as e:
         logger.exception(f"Error fetching jobs: {e}")
-        return []
-
-    finally:
-        if browser:
-            await browser.close()
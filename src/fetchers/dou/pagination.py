@@ -2,7 +2,7 @@ from playwright.async_api import Page
 
 from logs.logger import logger
 from src.config import DOU_MAX_JOBS
-from src.utils.fetching.anti_block import random_wait
+from src.utils.fetching.anti_block import throttle_request
 
 
 async def click_all_pagination_buttons(page: Page) -> None:
@@ -21,12 +21,12 @@ async def click_all_pagination_buttons(page: Page) -> None:
                 logger.info(f"Reached max_jobs limit: {DOU_MAX_JOBS}")
                 break
 
+            # Anti-block delay
+            await throttle_request(page.url)
+
             logger.debug("Clicking 'Load more' to load more jobs...")
             await page.locator(load_more_selector).click()
 
-            # Anti-block delay
-            await random_wait(0.5, 5.0)
-
         # Final job count
         final_count = await page.locator(job_selector).count()
         logger.info(f"Total jobs loaded: {final_count}")
@@ -1,7 +1,8 @@
+import asyncio
 import os
-from typing import Dict, Any, List
-import requests
+from typing import Any, AsyncIterator, Dict, List
 
+import httpx
 from dotenv import load_dotenv
 from tqdm.asyncio import tqdm_asyncio
 
@@ -14,11 +15,16 @@ from src.config import (
     JOOBLE_MIN_SALARY,
     JOOBLE_SEARCH_MODE,
     JOOBLE_DATE,
+    JOOBLE_MAX_RETRIES,
+    JOOBLE_RETRY_BACKOFF,
+    JOOBLE_PREFETCH_PAGES,
 )
 
 load_dotenv()
 api_key = os.getenv("JOOBLE_API_KEY")
 
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
 
 def ensure_company_name(job: Dict[str, Any]) -> Dict[str, Any]:
     """Ensure job has a company name."""
@@ -27,8 +33,57 @@ def ensure_company_name(job: Dict[str, Any]) -> Dict[str, Any]:
     return job
 
 
-def fetch_jooble_jobs(max_jobs: int = JOOBLE_MAX_JOBS) -> List[Dict[str, Any]]:
-    """Fetch jobs from Jooble API."""
+def build_payload(page: int) -> Dict[str, Any]:
+    """Build Jooble search payload for a page."""
+    return {
+        "keywords": JOOBLE_KEYWORDS,
+        "location": JOOBLE_LOCATION,
+        "page": page,
+        "radius": JOOBLE_RADIUS,
+        "salary": JOOBLE_MIN_SALARY,
+        "searchMode": JOOBLE_SEARCH_MODE,
+        "date": JOOBLE_DATE,
+    }
+
+
+async def request_jooble_page(
+    client: httpx.AsyncClient, api_url: str, page: int
+) -> List[Dict[str, Any]]:
+    """Request one Jooble page with retry and backoff."""
+    payload = build_payload(page)
+    logger.debug(f"Requesting page {page}")
+    logger.debug(f"Request payload: {payload}")
+
+    error = ""
+    for attempt in range(JOOBLE_MAX_RETRIES + 1):
+        try:
+            response = await client.post(api_url, json=payload)
+            if response.status_code not in RETRY_STATUS_CODES:
+                response.raise_for_status()
+                return response.json().get("jobs", [])
+            error = f"status {response.status_code}"
+        except httpx.TransportError as req_err:
+            error = str(req_err) or type(req_err).__name__
+        except Exception as req_err:
+            logger.error(f"Jooble API request failed: {req_err}")
+            return []
+
+        if attempt < JOOBLE_MAX_RETRIES:
+            delay = JOOBLE_RETRY_BACKOFF * 2**attempt
+            logger.warning(
+                f"Jooble page {page} failed ({error}), "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    logger.error(f"Jooble API request failed after retries: {error}")
+    return []
+
+
+async def fetch_jooble_jobs(
+    max_jobs: int = JOOBLE_MAX_JOBS,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield jobs from Jooble API page by page."""
     logger.info("-" * 60)
     logger.info("Fetching jobs from Jooble...")
 
@@ -36,61 +91,63 @@ def fetch_jooble_jobs(max_jobs: int = JOOBLE_MAX_JOBS) -> List[Dict[str, Any]]:
         logger.error(
             "No Jooble API key found in environment variable 'JOOBLE_API_KEY'."
         )
-        return []
+        return
 
     api_url = f"https://jooble.org/api/{api_key}"
-    all_jobs: List[Dict[str, Any]] = []
+    total = 0
     page = 1
     max_pages = 1000  # Prevent infinite loops, because infinity is scary
-
-    while page <= max_pages:
-        payload = {
-            "keywords": JOOBLE_KEYWORDS,
-            "location": JOOBLE_LOCATION,
-            "page": page,
-            "radius": JOOBLE_RADIUS,
-            "salary": JOOBLE_MIN_SALARY,
-            "searchMode": JOOBLE_SEARCH_MODE,
-            "date": JOOBLE_DATE,
-        }
-        logger.debug(f"Requesting page {page}")
-        logger.debug(f"Request payload: {payload}")
-
-        try:
-            response: requests.Response = requests.post(api_url, json=payload)
-            response.raise_for_status()
-            jobs: List[Dict[str, Any]] = response.json().get("jobs", [])
-        except Exception as req_err:
-            logger.error(f"Jooble API request failed: {req_err}")
-            jobs = []
-
-        logger.info(f"Fetched {len(jobs)} jobs from page {page}")
-
-        if not jobs:
-            break
-
-        # Rename 'link' key to 'URL' in each job dict
-        for i, job in enumerate(jobs):
-            if "link" in job:
-                job["url"] = job.pop("link")
-            jobs[i] = ensure_company_name(job)
-
-        for i, job in enumerate(
-            tqdm_asyncio(jobs, desc="Fetching jobs", mininterval=120.0), 1
-        ):
-            company = job.get("company") or "Unknown Company"
-            title = job.get("title", "No Title")
-            logger.debug(f"{i:>3}. {title.strip():<60} @ {company.strip()}")
-
-        all_jobs.extend(jobs)
-
-        if len(all_jobs) >= max_jobs:
-            all_jobs = all_jobs[:max_jobs]
-            logger.info(f"Maximum jobs limit reached: {max_jobs}")
-            break
-
-        page += 1
-
-    logger.info(f"Total jobs fetched from Jooble: {len(all_jobs)}")
-
-    return all_jobs
+    prefetch = max(JOOBLE_PREFETCH_PAGES, 1)
+
+    # one keep-alive client, so pages reuse the same TCP/TLS connections
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_connections=prefetch),
+    ) as client:
+        while page <= max_pages:
+            batch = range(page, min(page + prefetch, max_pages + 1))
+            pages_jobs = await asyncio.gather(
+                *(request_jooble_page(client, api_url, p) for p in batch)
+            )
+
+            reached_end = False
+            for batch_page, jobs in zip(batch, pages_jobs):
+                logger.info(f"Fetched {len(jobs)} jobs from page {batch_page}")
+
+                if not jobs:
+                    reached_end = True
+                    break
+
+                # Rename 'link' key to 'URL' in each job dict
+                for i, job in enumerate(jobs):
+                    if "link" in job:
+                        job["url"] = job.pop("link")
+                    jobs[i] = ensure_company_name(job)
+
+                for i, job in enumerate(
+                    tqdm_asyncio(
+                        jobs, desc="Fetching jobs", mininterval=120.0
+                    ),
+                    1,
+                ):
+                    company = job.get("company") or "Unknown Company"
+                    title = job.get("title", "No Title")
+                    logger.debug(
+                        f"{i:>3}. {title.strip():<60} @ {company.strip()}"
+                    )
+
+                jobs = jobs[:max_jobs - total]
+                total += len(jobs)
+                yield jobs
+
+                if total >= max_jobs:
+                    logger.info(f"Maximum jobs limit reached: {max_jobs}")
+                    reached_end = True
+                    break
+
+            if reached_end:
+                break
+
+            page += prefetch
+
+    logger.info(f"Total jobs fetched from Jooble: {total}")
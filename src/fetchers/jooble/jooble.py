@@ -1,30 +1,25 @@
 import asyncio
-from typing import List
 
-from src.db.db import AsyncSessionLocal
 from src.fetchers.jooble.fetcher import fetch_jooble_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> List[dict]:
-    """Fetch jobs from Jooble and save to DB."""
+async def run_fetch_and_save_jobs() -> int:
+    """Fetch jobs from Jooble and save them batch by batch."""
     logger.info("-" * 60)
     logger.info("Starting Jooble fetch and save operation")
 
-    jobs: List[dict] = []
+    saved = 0
     try:
-        jobs = fetch_jooble_jobs()  # sync call
-        if not jobs:
+        saved = await save_job_batches(fetch_jooble_jobs(), "jooble")
+        if not saved:
             logger.info("No jobs fetched from jooble.")
-        else:
-            async with AsyncSessionLocal() as session:
-                await save_jobs_to_db(jobs, session)
     except Exception as fetch_save_err:
         logger.error(f"Error during fetch/save: {fetch_save_err}")
 
     logger.info("Jooble job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
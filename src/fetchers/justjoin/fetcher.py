@@ -1,12 +1,7 @@
-import asyncio
-from typing import Tuple, Dict, Any, List
+from typing import Any, AsyncIterator, Dict, List
 
 from playwright.async_api import (
-    async_playwright,
-    Browser,
     Page,
-    ElementHandle,
-    Playwright,
     ViewportSize,
 )
 from playwright.async_api import (
@@ -19,30 +14,20 @@ from src.fetchers.justjoin.pagination import (
     scroll_and_fetch_jobs,
 )
 from logs.logger import logger
-from src.utils.fetching.anti_block import get_random_user_agent
-
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
+from src.utils.fetching.dom_extraction import CardSpec, strip_or_none
 from src.utils.fetching.fetcher_optimization import block_resources
 from src.utils.resources_logging import log_resources
 
 
-async def setup_page(playwright: Playwright, url: str) -> Tuple[Browser, Page]:
-    """Launch browser, open page, handle cookies, and wait for offers."""
+async def setup_page(page: Page, url: str) -> Page:
+    """Open page, handle cookies, and wait for offers."""
     logger.info("-" * 60)
     logger.info("Starting setup page")
 
     try:
-        browser: Browser = await playwright.chromium.launch(
-            headless=JUST_JOIN_HEADLESS
-        )
-        log_resources()
-
-        # Random User-Agent
-        ua = get_random_user_agent()
-        logger.info(f"User-agent: {ua}")
-        page = await browser.new_page(
-            viewport=ViewportSize(width=600, height=400)
-        )
-        await page.route("**/*", block_resources)
+        await throttle_request(url)
         await page.goto(url)
         log_resources()
 
@@ -53,45 +38,42 @@ async def setup_page(playwright: Playwright, url: str) -> Tuple[Browser, Page]:
             logger.debug("No cookie popup found or already handled.")
 
         await page.wait_for_selector("a.offer-card", timeout=60000)
-        return browser, page
+        return page
 
     except Exception as err:
         logger.error(f"Error setting up page: {err}")
         raise
 
 
-async def parse_job_offer(offer: ElementHandle) -> Dict[str, Any]:
+# selectors for one JustJoin offer card, read in a single page.evaluate
+JUST_JOIN_CARD_SPEC: CardSpec = {
+    "title": {"selector": "h3"},
+    "href": {"attr": "href"},
+    "company": {"selector": "p.MuiTypography-root.MuiTypography-body1"},
+    "salary": {"selector": "div.mui-18ypp16 span", "many": True},
+    "currency": {"selector": "div.mui-18ypp16 span.mui-1m61siv"},
+    "location": {"selector": "span.mui-1o4wo1x"},
+    "skills": {"selector": "div.skill-tag-1 div.mui-jikuwi", "many": True},
+}
+
+
+def parse_job_offer(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Extract job details asynchronously from a job offer element.
+    Build job details from raw job offer card fields.
     """
-    title_el = await offer.query_selector("h3")
-    title = (await title_el.text_content()).strip() if title_el else "Unknown"
+    title = (raw.get("title") or "Unknown").strip()
 
-    href = await offer.get_attribute("href")
+    href = raw.get("href")
     job_url = f"https://justjoin.it{href}" if href else None
 
-    company_el = await offer.query_selector(
-        "p.MuiTypography-root.MuiTypography-body1"
-    )
-    company = (
-        (await company_el.text_content()).strip() if company_el else "Unknown"
-    )
-    log_resources()
-
-    salary_els = await offer.query_selector_all("div.mui-18ypp16 span")
-    if len(salary_els) >= 2:
-        min_salary_text = await salary_els[0].text_content()
-        max_salary_text = await salary_els[1].text_content()
-        currency_el = await offer.query_selector(
-            "div.mui-18ypp16 span.mui-1m61siv"
-        )
-        currency_text = (
-            await currency_el.text_content() if currency_el else None
-        )
+    company = (raw.get("company") or "Unknown").strip()
 
+    salary_texts = raw.get("salary") or []
+    if len(salary_texts) >= 2:
+        currency_text = raw.get("currency")
         try:
-            min_salary = int(min_salary_text.replace(" ", ""))
-            max_salary = int(max_salary_text.replace(" ", ""))
+            min_salary = int(salary_texts[0].replace(" ", ""))
+            max_salary = int(salary_texts[1].replace(" ", ""))
             average_salary = (min_salary + max_salary) // 2
             salary = str(average_salary)
             currency = currency_text.strip() if currency_text else None
@@ -101,36 +83,24 @@ async def parse_job_offer(offer: ElementHandle) -> Dict[str, Any]:
     else:
         salary = None
         currency = None
-    log_resources()
 
-    location_el = await offer.query_selector("span.mui-1o4wo1x")
-    location = (
-        (await location_el.text_content()).strip() if location_el else None
-    )
-
-    skill_els = await offer.query_selector_all(
-        "div.skill-tag-1 div.mui-jikuwi"
-    )
-    skills = [
-        s.strip()
-        for s in (await asyncio.gather(*[s.text_content() for s in skill_els]))
-    ]
-    log_resources()
+    location = strip_or_none(raw.get("location"))
+    skills = [s.strip() for s in raw.get("skills") or []]
 
     return {
-        "title": title.strip() if title else "Unknown",
+        "title": title or "Unknown",
         "url": job_url,
-        "company": company.strip() if company else "Unknown",
-        "salary": salary.strip() if salary else None,
-        "currency": currency.strip() if currency else None,
-        "location": location.strip() if location else None,
-        "skills": [s.strip() for s in skills],
+        "company": company or "Unknown",
+        "salary": salary,
+        "currency": currency,
+        "location": location or None,
+        "skills": skills,
     }
 
 
-async def fetch_jobs() -> List[Dict[str, Any]]:
+async def fetch_jobs() -> AsyncIterator[List[Dict[str, Any]]]:
     """
-    Launch browser and scrape job offers from target URL asynchronously.
+    Launch browser and yield job offers from target URL batch by batch.
     """
     url = JUST_JOIN_URL
 
@@ -139,22 +109,23 @@ async def fetch_jobs() -> List[Dict[str, Any]]:
     log_resources()
 
     try:
-        async with async_playwright() as p:
-            browser, page = await setup_page(p, url)
+        async with browser_pool.new_page(
+            headless=JUST_JOIN_HEADLESS,
+            viewport=ViewportSize(width=600, height=400),
+            route_handler=block_resources,
+        ) as page:
+            await setup_page(page, url)
             log_resources()
 
-            # Scroll and fetch incrementally
-            results = await scroll_and_fetch_jobs(page)
+            # Scroll and hand over each batch as soon as it is parsed
+            async for batch in scroll_and_fetch_jobs(page):
+                yield batch
             log_resources()
 
-            await browser.close()
-            logger.info("Browser closed. Finished fetching jobs.")
-            log_resources()
-            return results
+        logger.info("Page closed. Finished fetching jobs.")
+        log_resources()
 
     except PlaywrightTimeoutError as timeout_err:
         logger.error(f"Timeout while fetching jobs: {timeout_err}")
-        return []
     except PlaywrightError as pw_err:
         logger.error(f"Playwright error: {pw_err}")
-        return []
@@ -1,27 +1,22 @@
 import asyncio
-from typing import List, Dict, Any
 
-from src.db.db import AsyncSessionLocal
 from src.fetchers.justjoin.fetcher import fetch_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> List[Dict[str, Any]]:
-    """Fetch jobs asynchronously and save to DB."""
-    jobs: List[Dict[str, Any]] = []
+async def run_fetch_and_save_jobs() -> int:
+    """Fetch jobs asynchronously and save them batch by batch."""
+    saved = 0
     try:
-        jobs = await fetch_jobs()
-        if not jobs:
+        saved = await save_job_batches(fetch_jobs(), "justjoin")
+        if not saved:
             logger.info("No jobs fetched from justjoin.")
-        else:
-            async with AsyncSessionLocal() as session:
-                await save_jobs_to_db(jobs, session)
     except Exception as err:
         logger.error(f"Error fetching/saving jobs: {err}")
 
     logger.info("Justjoin job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
@@ -1,69 +1,104 @@
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, List
 
-from playwright.async_api import Page, Error as PlaywrightError
+from playwright.async_api import (
+    Page,
+    Error as PlaywrightError,
+    TimeoutError as PlaywrightTimeoutError,
+)
 from tqdm.asyncio import tqdm_asyncio
 
 from logs.logger import logger
-from src.config import JUST_JOIN_MAX_JOBS
-from src.utils.fetching.anti_block import random_wait
+from src.config import JUST_JOIN_MAX_JOBS, JUST_JOIN_SCROLL_TIMEOUT
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.dom_extraction import extract_cards
 
 
-async def scroll_and_fetch_jobs(page: Page) -> List[Dict[str, Any]]:
-    """Scroll page and fetch job offers asynchronously."""
-    from src.fetchers.justjoin.fetcher import parse_job_offer
+# cards already parsed get this attribute, so we only read appended ones
+PARSED_ATTR = "data-jn-parsed"
+NEW_OFFERS_SELECTOR = f"a.offer-card:not([{PARSED_ATTR}])"
+
+
+async def wait_for_new_offers(page: Page) -> bool:
+    """Wait until unparsed cards appear or the timeout passes."""
+    try:
+        await page.wait_for_function(
+            f"document.querySelectorAll('{NEW_OFFERS_SELECTOR}').length > 0",
+            timeout=JUST_JOIN_SCROLL_TIMEOUT,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        pass
+
+    # last chance: let pending requests settle, then check once more
+    try:
+        await page.wait_for_load_state(
+            "networkidle", timeout=JUST_JOIN_SCROLL_TIMEOUT
+        )
+    except PlaywrightTimeoutError:
+        logger.debug("Network did not go idle after scroll.")
+    return await page.locator(NEW_OFFERS_SELECTOR).count() > 0
+
+
+async def scroll_and_fetch_jobs(
+    page: Page,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Scroll page and yield each newly appended batch of offers."""
+    from src.fetchers.justjoin.fetcher import (
+        JUST_JOIN_CARD_SPEC,
+        parse_job_offer,
+    )
 
-    results = []
     seen_urls = set()
     job_counter = 1
 
     try:
-        previous_height = await page.evaluate("document.body.scrollHeight")
-
-        while True:
-            await page.evaluate(
-                "window.scrollBy(0, document.body.scrollHeight)"
+        while len(seen_urls) < JUST_JOIN_MAX_JOBS:
+            # read and mark the new batch in one round trip
+            offers = await extract_cards(
+                page,
+                NEW_OFFERS_SELECTOR,
+                JUST_JOIN_CARD_SPEC,
+                mark_attr=PARSED_ATTR,
             )
-            await page.wait_for_timeout(60000)
-            new_height = await page.evaluate("document.body.scrollHeight")
-            if new_height == previous_height:
+            if not offers:
+                logger.info("No new offers loaded, stopping scroll.")
                 break
-            previous_height = new_height
-
-            offers = await page.query_selector_all("a.offer-card")
-            all_jobs = []
 
+            batch: List[Dict[str, Any]] = []
             for offer in tqdm_asyncio(
                 offers, desc="Fetching jobs", mininterval=120.0
             ):
-                # Jobs limit
-                # Use total count to stop, not just current batch
-                if len(results) + len(all_jobs) >= JUST_JOIN_MAX_JOBS:
+                if len(seen_urls) >= JUST_JOIN_MAX_JOBS:
                     logger.info(
                         f"Reached max job count of {JUST_JOIN_MAX_JOBS}, "
                         f"stopping scraping."
                     )
                     break
 
-                job_data = await parse_job_offer(offer)
+                job_data = parse_job_offer(offer)
                 if job_data["url"] and job_data["url"] not in seen_urls:
                     seen_urls.add(job_data["url"])
-                    all_jobs.append(job_data)
+                    batch.append(job_data)
                     logger.debug(
                         f"{job_counter:>3}. {job_data['title']:<60} @ "
                         f"{job_data['company']}"
                     )
                     job_counter += 1
 
-                    # Anti-block delay
-                    await random_wait(0.5, 5.0)
+            if batch:
+                yield batch
 
-            if not all_jobs:
-                logger.info("No new offers loaded, stopping scroll.")
+            if len(seen_urls) >= JUST_JOIN_MAX_JOBS:
                 break
 
-            results.extend(all_jobs)
+            # Anti-block delay, scrolling loads the next batch from the site
+            await throttle_request(page.url)
+            await page.evaluate(
+                "window.scrollBy(0, document.body.scrollHeight)"
+            )
+            if not await wait_for_new_offers(page):
+                logger.info("No new offers after scroll, reached the end.")
+                break
 
     except PlaywrightError as e:
         logger.error(f"Playwright error during scroll: {e}")
-
-    return results
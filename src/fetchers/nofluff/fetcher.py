@@ -1,11 +1,13 @@
 import re
+from typing import AsyncIterator
 
-from playwright.async_api import async_playwright, ViewportSize
+from playwright.async_api import ViewportSize
 from tqdm.asyncio import tqdm_asyncio
 
 from logs.logger import logger
 from src.config import NO_FLUFF_HEADLESS, NO_FLUFF_MAX_JOBS
-from src.utils.fetching.anti_block import get_random_user_agent, random_wait
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
 from src.utils.fetching.fetcher_optimization import block_resources
 
 
@@ -28,25 +30,18 @@ def clean_location(text: str) -> str:
         return ""
 
 
-async def fetch_nofluff_jobs(url: str) -> list[dict]:
-    """Fetch NoFluffJobs postings."""
+async def fetch_nofluff_jobs(url: str) -> AsyncIterator[list[dict]]:
+    """Yield NoFluffJobs postings as they are parsed."""
     logger.info("Opening NoFluffJobs URL")
-    all_jobs: list[dict] = []
+    parsed_count = 0
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=NO_FLUFF_HEADLESS,
-                args=["--disable-blink-features=AutomationControlled"],
-            )
-
-            # Random User-Agent
-            ua = get_random_user_agent()
-            logger.info(f"User-agent: {ua}")
-            page = await browser.new_page(
-                viewport=ViewportSize(width=1000, height=700)
-            )
-            await page.route("**/*", block_resources)
+        async with browser_pool.new_page(
+            headless=NO_FLUFF_HEADLESS,
+            viewport=ViewportSize(width=1000, height=700),
+            route_handler=block_resources,
+        ) as page:
+            await throttle_request(url)
             await page.goto(url)
             await page.wait_for_load_state("networkidle")
             logger.info("Page loaded successfully.")
@@ -99,6 +94,7 @@ async def fetch_nofluff_jobs(url: str) -> list[dict]:
                         await load_more_button.scroll_into_view_if_needed(
                             timeout=60_000
                         )
+                        await throttle_request(page.url)
                         await page.evaluate(
                             """
                             Array.from(document.querySelectorAll('button'))
@@ -173,20 +169,15 @@ async def fetch_nofluff_jobs(url: str) -> list[dict]:
                             else ""
                         ),
                     }
-                    all_jobs.append(job_data)
+                    parsed_count += 1
+                    yield [job_data]
                     logger.debug(
                         f"{i+1:>3}. {job_data['title']:<60} @ "
                         f"{job_data['company']}"
                     )
-
-                    # Anti-block delay
-                    await random_wait(0.5, 5.0)
                 except Exception as job_err:
                     logger.warning(f"Failed to parse job {i+1}: {job_err}")
-
-            await browser.close()
     except Exception as fetch_err:
         logger.error(f"Failed to fetch jobs: {fetch_err}")
 
-    logger.info(f"Finished scraping {len(all_jobs)} jobs.")
-    return all_jobs
+    logger.info(f"Finished scraping {parsed_count} jobs.")
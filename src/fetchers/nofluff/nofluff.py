@@ -1,13 +1,12 @@
 import asyncio
 
 from src.config import NO_FLUFF_URL
-from src.db.db import AsyncSessionLocal
 from src.fetchers.nofluff.fetcher import fetch_nofluff_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> list | None:
+async def run_fetch_and_save_jobs() -> int | None:
     """Fetch and save nofluff jobs."""
     if not NO_FLUFF_URL:
         logger.error("Config variable NO_FLUFF_URL not found.")
@@ -17,19 +16,17 @@ async def run_fetch_and_save_jobs() -> list | None:
     logger.info(f"Fetching jobs from: {NO_FLUFF_URL}")
 
     try:
-        jobs = await fetch_nofluff_jobs(NO_FLUFF_URL)
-
-        if jobs:
-            async with AsyncSessionLocal() as session:
-                await save_jobs_to_db(jobs, session)
-        else:
+        saved = await save_job_batches(
+            fetch_nofluff_jobs(NO_FLUFF_URL), "nofluff"
+        )
+        if not saved:
             logger.info("No jobs fetched from nofluff.")
     except Exception as fetch_err:
         logger.error(f"Error fetching or saving jobs: {fetch_err}")
         return None
 
     logger.info("Nofluff job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
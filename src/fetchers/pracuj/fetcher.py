@@ -1,9 +1,9 @@
 import asyncio
 import re
-from typing import Dict, List
+from typing import AsyncIterator, Dict, List
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 
-from playwright.async_api import async_playwright, Page, Locator, ViewportSize
+from playwright.async_api import Page, Locator, ViewportSize
 from playwright.async_api import (
     TimeoutError as PlaywrightTimeoutError,
     Error as PlaywrightError,
@@ -12,7 +12,8 @@ from playwright.async_api import (
 from logs.logger import logger
 from src.config import PRACUJ_HEADLESS, PRACUJ_MAX_JOBS
 from src.fetchers.pracuj.pagination import paginate_jobs
-from src.utils.fetching.anti_block import get_random_user_agent
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
 from src.utils.fetching.fetcher_optimization import block_pracuj_resources
 
 
@@ -159,21 +160,17 @@ async def fetch_jobs_on_page(page: Page) -> List[Dict[str, str]]:
     )
 
 
-async def fetch_pracuj_jobs(url: str) -> List[Dict[str, str]]:
-    """Fetch jobs from Pracuj with cookies, tracking removal, pagination."""
+async def fetch_pracuj_jobs(url: str) -> AsyncIterator[List[Dict[str, str]]]:
+    """Yield Pracuj jobs per page, handling cookies and pagination."""
     logger.info("-" * 60)
     logger.info(f"Starting job fetch from: {url}")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=PRACUJ_HEADLESS)
-
-        # Random User-Agent
-        ua = get_random_user_agent()
-        logger.info(f"User-agent: {ua}")
-        page = await browser.new_page(
-            viewport=ViewportSize(width=600, height=400)
-        )
+    async with browser_pool.new_page(
+        headless=PRACUJ_HEADLESS,
+        viewport=ViewportSize(width=600, height=400),
+    ) as page:
         await block_pracuj_resources(page)
+        await throttle_request(url)
         await page.goto(url)
         await page.wait_for_timeout(3000)
         # debugging part ↓↓↓
@@ -183,11 +180,14 @@ async def fetch_pracuj_jobs(url: str) -> List[Dict[str, str]]:
         # debugging part ↑↑↑
         await accept_cookies_if_present(page)
 
-        all_jobs = await paginate_jobs(page, PRACUJ_MAX_JOBS)
-
-        await browser.close()
-
-    logger.info(
-        f"Finished fetching all_jobs, total collected: {len(all_jobs)}"
-    )
-    return all_jobs
+        total = 0
+        async for jobs in paginate_jobs(page, PRACUJ_MAX_JOBS):
+            for job in jobs:
+                total += 1
+                logger.debug(
+                    f"{total:>3}. {job['title']:<60} @ "
+                    f"{job.get('company', 'unknown')}"
+                )
+            yield jobs
+
+    logger.info(f"Finished fetching jobs, total collected: {total}")
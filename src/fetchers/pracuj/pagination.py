@@ -1,36 +1,37 @@
-from typing import List, Dict
+from typing import AsyncIterator, Dict, List
 
 from playwright.async_api import Page
 from playwright.async_api import Error as PlaywrightError
 
 from logs.logger import logger
-from src.utils.fetching.anti_block import random_wait
+from src.utils.fetching.anti_block import throttle_request
 
 
-async def paginate_jobs(page: Page, max_jobs: int) -> List[Dict[str, str]]:
-    """Fetch jobs through pagination, up to max_jobs."""
+async def paginate_jobs(
+    page: Page, max_jobs: int
+) -> AsyncIterator[List[Dict[str, str]]]:
+    """Yield jobs page by page, up to max_jobs."""
     # fix circular import
     from src.fetchers.pracuj.fetcher import fetch_jobs_on_page
 
-    all_jobs: List[Dict[str, str]] = []
+    total = 0
     page_number = 1
 
     while True:
         # Jobs limit
-        if len(all_jobs) >= max_jobs:
+        if total >= max_jobs:
             logger.info(
                 f"Reached max job count of {max_jobs}, stopping pagination."
             )
             break
 
         jobs_on_page = await fetch_jobs_on_page(page)
-        all_jobs.extend(jobs_on_page)
+        total += len(jobs_on_page)
         logger.info(
-            f"Collected {len(all_jobs)} jobs so far after page {page_number}."
+            f"Collected {total} jobs so far after page {page_number}."
         )
-
-        # Anti-block delay
-        await random_wait(0.5, 10.0)
+        if jobs_on_page:
+            yield jobs_on_page
 
         next_button = page.locator(
             "button[data-test='bottom-pagination-button-next']"
@@ -41,6 +42,8 @@ async def paginate_jobs(page: Page, max_jobs: int) -> List[Dict[str, str]]:
                     f"Next page button enabled, going to page "
                     f"{page_number + 1}."
                 )
+                # Anti-block delay
+                await throttle_request(page.url)
                 await next_button.click()
                 await page.wait_for_timeout(3000)
                 await page.wait_for_selector(
@@ -56,5 +59,3 @@ async def paginate_jobs(page: Page, max_jobs: int) -> List[Dict[str, str]]:
         except PlaywrightError:
             logger.info("Next page button not clickable, ending pagination.")
             break
-
-    return all_jobs
@@ -1,13 +1,15 @@
 import asyncio
-from typing import List
+from typing import AsyncIterator, List
 
-from playwright.async_api import async_playwright, ElementHandle, ViewportSize
+from playwright.async_api import ViewportSize
 from tqdm.asyncio import tqdm_asyncio
 
 from src.config import ROBOTA_UA_URL, ROBOTA_UA_HEADLESS, ROBOTA_UA_MAX_JOBS
 from src.fetchers.robota_ua.pagination import click_next_page
 from logs.logger import logger
-from src.utils.fetching.anti_block import get_random_user_agent, random_wait
+from src.utils.fetching.anti_block import throttle_request
+from src.utils.fetching.browser_pool import browser_pool
+from src.utils.fetching.dom_extraction import CardSpec, extract_cards
 from src.utils.fetching.fetcher_optimization import block_resources
 
 
@@ -34,88 +36,81 @@ async def auto_scroll(
 
         previous_scroll = current_scroll
         next_scroll = min(current_scroll + scroll_step, max_scroll)
+        # Anti-block delay, scrolling loads more cards from the site
+        await throttle_request(page.url)
         await page.evaluate(f"window.scrollTo(0, {next_scroll})")
 
-        # Anti-block delay
-        await random_wait(0.5, 10.0)
-
         scroll_count += 1
 
 
-async def extract_robota_ua_job(item: ElementHandle) -> dict:
-    """Extracts job details from an element handle."""
+# selectors for one robota.ua job card, read in a single page.evaluate
+ROBOTA_UA_CARD_SELECTOR = "a.card"
+ROBOTA_UA_CARD_SPEC: CardSpec = {
+    "url": {"attr": "href"},
+    "title": {"selector": "h2.santa-typo-h3"},
+    "company_alt": {"selector": "div.company-logo img", "attr": "alt"},
+    "company_title": {"selector": "div.company-logo img", "attr": "title"},
+    "company_text": {"selector": "span.santa-mr-20"},
+    "salary": {"selector": "div.santa-mb-10 > span"},
+    "location": {"selector": "div.santa-flex.santa-items-center > span"},
+    "text": {"prop": "innerText"},
+    "is_recommended": {"closest": "alliance-recommended-vacancy-list"},
+}
+
+
+def extract_robota_ua_job(raw: dict) -> dict:
+    """Builds job details from raw card fields."""
     job = {}
 
     # Job URL
-    url = await item.get_attribute("href")
+    url = raw.get("url")
     if url:
         job["url"] = ROBOTA_UA_URL + url.strip()
 
     # Job title
-    title_el = await item.query_selector("h2.santa-typo-h3")
-    if title_el:
-        title = await title_el.text_content()
-        if title:
-            job["title"] = title.strip()
+    title = raw.get("title")
+    if title:
+        job["title"] = title.strip()
 
     # Company name
-    company_img = await item.query_selector("div.company-logo img")
-    company = None
-    if company_img:
-        company = await company_img.get_attribute(
-            "alt"
-        ) or await company_img.get_attribute("title")
-    if not company:
-        span_el = await item.query_selector("span.santa-mr-20")
-        if span_el:
-            company = await span_el.text_content()
-
+    company = (
+        raw.get("company_alt")
+        or raw.get("company_title")
+        or raw.get("company_text")
+    )
     if company:
         job["company"] = company.strip()
 
     # Salary info
-    salary_el = await item.query_selector("div.santa-mb-10 > span")
-    if salary_el:
-        salary = await salary_el.text_content()
-        if salary and any(char.isdigit() or char == "₴" for char in salary):
-            job["salary"] = salary.strip()
+    salary = raw.get("salary")
+    if salary and any(char.isdigit() or char == "₴" for char in salary):
+        job["salary"] = salary.strip()
 
     # Location
-    location_el = await item.query_selector(
-        "div.santa-flex.santa-items-center > span"
-    )
-    if location_el:
-        location = await location_el.text_content()
-        if location:
-            job["location"] = location.strip()
+    location = raw.get("location")
+    if location:
+        job["location"] = location.strip()
 
     return job
 
 
-async def fetch_robota_ua_jobs() -> List[dict]:
-    """Fetches remote jobs from robota.ua."""
+async def fetch_robota_ua_jobs() -> AsyncIterator[List[dict]]:
+    """Yields remote jobs from robota.ua page by page."""
     logger.info("-" * 60)
     logger.info("Launching browser for robota.ua scraping")
-    all_jobs: List[dict] = []
+    total = 0
 
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=ROBOTA_UA_HEADLESS,
-                args=["--disable-blink-features=AutomationControlled"],
-            )
-
-            # Random User-Agent
-            ua = get_random_user_agent()
-            page = await browser.new_page(
-                viewport=ViewportSize(width=600, height=400)
-            )
-            await page.route("**/*", block_resources)
-            logger.info(f"User-agent: {ua}")
+        async with browser_pool.new_page(
+            headless=ROBOTA_UA_HEADLESS,
+            viewport=ViewportSize(width=600, height=400),
+            route_handler=block_resources,
+        ) as page:
             logger.info(f"Fetching robota.ua page: {ROBOTA_UA_URL}")
+            await throttle_request(ROBOTA_UA_URL)
             await page.goto(ROBOTA_UA_URL, timeout=60000)
 
-            while len(all_jobs) < ROBOTA_UA_MAX_JOBS:
+            while total < ROBOTA_UA_MAX_JOBS:
 
                 # debugging part ↓↓↓
                 await asyncio.sleep(3)
@@ -126,25 +121,26 @@ async def fetch_robota_ua_jobs() -> List[dict]:
                 # debugging part ↑↑↑
 
                 await auto_scroll(page)
-                await page.wait_for_selector("a.card", timeout=60000)
+                await page.wait_for_selector(
+                    ROBOTA_UA_CARD_SELECTOR, timeout=60000
+                )
 
-                job_items = await page.query_selector_all("a.card")
+                job_items = await extract_cards(
+                    page, ROBOTA_UA_CARD_SELECTOR, ROBOTA_UA_CARD_SPEC
+                )
                 if not job_items:
                     logger.info("No job items found on the page.")
                     break
 
+                page_jobs: List[dict] = []
                 for item in tqdm_asyncio(
                     job_items, desc="Fetching jobs", mininterval=120.0
                 ):
                     # Filter out jobs from 'recommended' section
-                    is_recommended = await item.evaluate(
-                        "node => node.closest("
-                        "'alliance-recommended-vacancy-list')"
-                    )
-                    if is_recommended:
+                    if item["is_recommended"]:
                         continue
 
-                    job = await extract_robota_ua_job(item)
+                    job = extract_robota_ua_job(item)
                     if not job.get("title") or not job.get("url"):
                         logger.warning(
                             "Skipped job due to missing title or URL"
@@ -152,7 +148,7 @@ async def fetch_robota_ua_jobs() -> List[dict]:
                         continue
 
                     # Check for remote work tag
-                    all_text = await item.inner_text()
+                    all_text = item["text"] or ""
                     is_remote = (
                         "remote work" in all_text.lower()
                         or "віддалена" in all_text.lower()
@@ -165,17 +161,18 @@ async def fetch_robota_ua_jobs() -> List[dict]:
                         )
                         continue
 
-                    all_jobs.append(job)
+                    page_jobs.append(job)
+                    total += 1
                     logger.debug(
-                        f"{len(all_jobs):>3}. {job['title']:<60} @ "
+                        f"{total:>3}. {job['title']:<60} @ "
                         f"{job.get('company', 'unknown')}"
                     )
 
-                    # Anti-block delay
-                    await random_wait(0.5, 10.0)
+                if page_jobs:
+                    yield page_jobs
 
                 # Job limit
-                if len(all_jobs) >= ROBOTA_UA_MAX_JOBS:
+                if total >= ROBOTA_UA_MAX_JOBS:
                     logger.info(
                         f"Reached max job count of {ROBOTA_UA_MAX_JOBS}, "
                         f"stopping scraping."
@@ -195,12 +192,7 @@ async def fetch_robota_ua_jobs() -> List[dict]:
                     logger.info("No more pages to fetch.")
                     break
 
-            await browser.close()
     except Exception as e:
         logger.error(f"An error occurred during scraping: {e}")
-    finally:
-        if browser:
-            await browser.close()
 
-    logger.info(f"Scraping done. Total jobs fetched: {len(all_jobs)}")
-    return all_jobs
+    logger.info(f"Scraping done. Total jobs fetched: {total}")
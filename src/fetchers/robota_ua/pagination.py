@@ -1,6 +1,7 @@
 from playwright.async_api import Page
 
 from logs.logger import logger
+from src.utils.fetching.anti_block import throttle_request
 
 
 async def click_next_page(page: Page) -> bool:
@@ -29,6 +30,7 @@ async def click_next_page(page: Page) -> bool:
 
     old_url = page.url
     logger.info(f"Clicking page {next_page}. Current URL: {old_url}")
+    await throttle_request(old_url)
     await next_link.click()
 
     try:
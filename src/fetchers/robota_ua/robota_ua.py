@@ -1,29 +1,25 @@
 import asyncio
 
-from src.db.db import AsyncSessionLocal
 from src.fetchers.robota_ua.fetcher import fetch_robota_ua_jobs
-from src.fetchers.save_jobs import save_jobs_to_db
+from src.fetchers.save_jobs import save_job_batches
 from logs.logger import logger
 
 
-async def run_fetch_and_save_jobs() -> list[dict]:
-    """Fetch and save Robota UA jobs."""
+async def run_fetch_and_save_jobs() -> int:
+    """Fetch and save Robota UA jobs batch by batch."""
     logger.info("-" * 60)
     logger.info("Starting full fetch and save operation")
 
-    jobs: list[dict] = []
+    saved = 0
     try:
-        jobs = await fetch_robota_ua_jobs()
-        if jobs:
-            async with AsyncSessionLocal() as session:
-                await save_jobs_to_db(jobs, session)
-        else:
+        saved = await save_job_batches(fetch_robota_ua_jobs(), "robota_ua")
+        if not saved:
             logger.info("No jobs fetched from robota ua.")
     except Exception as fetch_err:
         logger.error(f"Failed during fetch/save: {fetch_err}")
 
     logger.info("Robota ua job fetch process completed.")
-    return jobs
+    return saved
 
 
 if __name__ == "__main__":
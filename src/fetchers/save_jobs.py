@@ -1,82 +1,113 @@
 from datetime import datetime, timezone, timedelta
-from typing import List
+from typing import AsyncIterator, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
-from src.config import JOB_ARCHIVE_DAYS
-from src.db.models.job import Job
-from src.db.crud.job import (
-    create_multiple_jobs,
-    update_jobs_last_seen_archived_at,
+from src.config import (
+    JOB_ARCHIVE_DAYS,
+    SAVE_JOBS_BATCH_SIZE,
+    SAVE_JOBS_CHUNK_SIZE,
 )
+from src.db.crud.job import upsert_jobs
+from src.db.db import BatchSessionLocal
 from logs.logger import logger
+from src.utils.search_text import build_search_text
 
 
 MAX_LOCATION_LENGTH = 255
 MAX_TITLE_LENGTH = 255
 
 
-async def save_jobs_to_db(jobs: List[dict], session: AsyncSession):
-    """Efficiently save jobs to the database if not already existing."""
-    if not jobs:
-        return
+def prepare_job_row(
+    job_data: dict, now: datetime, source: str | None = None
+) -> dict:
+    """Build a jobs table row from fetched job data."""
+    title = job_data.get("title")
+    location = job_data.get("location")
 
-    # Fetch all existing URLs in one query
-    urls = [job["url"] for job in jobs if "url" in job]
-    result = await session.execute(select(Job.url).where(Job.url.in_(urls)))
-    existing_urls = set(row[0] for row in result.all())
+    if title and len(title) > MAX_TITLE_LENGTH:
+        title = title[:MAX_TITLE_LENGTH]
+    if location and len(location) > MAX_LOCATION_LENGTH:
+        location = location[:MAX_LOCATION_LENGTH]
 
-    # Update last_seen and archived_at for jobs which are already in db
-    existing_urls_list = list(existing_urls)
-    logger.info(
-        f"Updating last_seen and archived_at for"
-        f" {len(existing_urls_list)} existing jobs."
-    )
-    await update_jobs_last_seen_archived_at(session, existing_urls_list)
-    logger.info(
-        "Finished updating last_seen and archived_at for existing jobs."
-    )
+    return {
+        "title": title,
+        "company": job_data.get("company"),
+        "location": location,
+        "salary": job_data.get("salary"),
+        "skills": job_data.get("skills"),
+        "score": job_data.get("score", 0),
+        "url": job_data["url"],
+        "source": source,
+        "search_text": build_search_text(title, job_data.get("skills")),
+        "archived_at": now + timedelta(days=JOB_ARCHIVE_DAYS),
+    }
 
-    # Filter out jobs that already exist and new jobs
+
+async def save_jobs_to_db(
+    jobs: List[dict], session: AsyncSession, source: str | None = None
+) -> int:
+    """Upsert jobs in chunks, return how many rows were written."""
+    if not jobs:
+        return 0
+
+    now = datetime.now(timezone.utc)
+
+    # one row per URL, a statement can't touch the same row twice
+    rows_by_url: dict[str, dict] = {}
     skipped_count = 0
-    new_jobs = []
     for job_data in jobs:
-        url = job_data.get("url")
-        if not url or url in existing_urls:
+        if not job_data.get("url"):
             skipped_count += 1
             continue
-
-        title = job_data.get("title")
-        location = job_data.get("location")
-
-        if title and len(title) > MAX_TITLE_LENGTH:
-            title = title[:MAX_TITLE_LENGTH]
-        if location and len(location) > MAX_LOCATION_LENGTH:
-            location = location[:MAX_LOCATION_LENGTH]
-
-        new_jobs.append(
-            {
-                "title": title,
-                "company": job_data.get("company"),
-                "location": location,
-                "salary": job_data.get("salary"),
-                "skills": job_data.get("skills"),
-                "score": job_data.get("score", 0),
-                "url": url,
-                "last_seen": datetime.now(timezone.utc),
-                "archived_at": datetime.now(timezone.utc)
-                + timedelta(days=JOB_ARCHIVE_DAYS),
-            }
+        rows_by_url[job_data["url"]] = prepare_job_row(
+            job_data, now, source
         )
 
     if skipped_count:
-        logger.info(f"Skipped {skipped_count} existing jobs.")
+        logger.info(f"Skipped {skipped_count} jobs without URL.")
 
-    if new_jobs:
-        await create_multiple_jobs(session, new_jobs)
-        logger.info(
-            f"Successfully added {len(new_jobs)} new jobs to the database."
-        )
-    else:
-        logger.info("No new jobs to add to the database.")
+    rows = list(rows_by_url.values())
+    inserted_total = updated_total = 0
+    for start in range(0, len(rows), SAVE_JOBS_CHUNK_SIZE):
+        chunk = rows[start:start + SAVE_JOBS_CHUNK_SIZE]
+        inserted, updated = await upsert_jobs(session, chunk)
+        inserted_total += inserted
+        updated_total += updated
+
+    logger.info(
+        f"Added {inserted_total} new jobs, refreshed last_seen and "
+        f"archived_at for {updated_total} existing jobs."
+    )
+    # a failed chunk counts 0, not its length
+    return inserted_total + updated_total
+
+
+async def save_job_batches(
+    batches: AsyncIterator[List[dict]],
+    source: str,
+    batch_size: int = SAVE_JOBS_BATCH_SIZE,
+) -> int:
+    """Save fetched job batches as they arrive, return saved count."""
+    buffer: List[dict] = []
+    saved_count = 0
+
+    async def flush() -> None:
+        nonlocal buffer, saved_count
+        batch, buffer = buffer, []
+        # short session per write, no connection held during scraping
+        async with BatchSessionLocal() as session:
+            saved_count += await save_jobs_to_db(batch, session, source)
+        logger.info(f"Saved {saved_count} {source} jobs so far.")
+
+    try:
+        async for batch in batches:
+            buffer.extend(batch)
+            if len(buffer) >= batch_size:
+                await flush()
+    finally:
+        # keep what was fetched even if the scrape crashed mid-way
+        if buffer:
+            await flush()
+
+    return saved_count
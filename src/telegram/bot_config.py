@@ -98,4 +98,10 @@ NOTIFICATION_GIFS = [
 # Max jobs per user per /refresh
 MAX_FILTERED_JOBS = 1000
 
+# Next unseen jobs prefetched per user, refilled at the low mark
+VACANCY_QUEUE_SIZE = 5
+VACANCY_QUEUE_LOW = 2
+# Users whose vacancy queues are kept in memory (LRU)
+VACANCY_QUEUE_USERS = 1024
+
 user_request_count = defaultdict(int)
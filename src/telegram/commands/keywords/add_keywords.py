@@ -9,6 +9,7 @@ from aiogram.types import (
 )
 from sqlalchemy import select, func
 
+from src.db.crud.user import get_user_by_telegram_id
 from src.db.db import AsyncSessionLocal
 from logs.logger import logger
 from src.db.models import UserKeyword
@@ -20,6 +21,8 @@ from src.telegram.job_utils import (
     add_or_update_user_keyword,
     get_or_create_user,
 )
+from src.telegram.vacancy_queue import invalidate_vacancy_queue
+from src.utils.telegram.job_filter import invalidate_keyword_profile
 
 
 MAX_KEYWORDS = 5
@@ -194,6 +197,11 @@ async def add_keyword_save(message: Message, state: FSMContext) -> None:
                 f"Keyword '{keyword}' {action} with score {weight} ✅"
             )
 
+        user = await get_user_by_telegram_id(session, telegram_id)
+        if user:
+            invalidate_keyword_profile(user.id)
+            invalidate_vacancy_queue(user.id)
+
     await message.answer("You can use /refresh now to filter jobs for you 😎")
     await state.clear()
 
@@ -246,6 +254,11 @@ async def process_weight_callback(
                 f"Keyword '{keyword}' {action} with score {weight} ✅"
             )
 
+        user = await get_user_by_telegram_id(session, cb.from_user.id)
+        if user:
+            invalidate_keyword_profile(user.id)
+            invalidate_vacancy_queue(user.id)
+
     await cb.message.answer(
         "You can use /refresh now to filter jobs for you 😎"
     )
@@ -12,6 +12,8 @@ from src.telegram.bot_config import (
 )
 from src.telegram.commands.keywords.utils import parse_keywords
 from src.db.crud.user_keyword import delete_user_keyword
+from src.telegram.vacancy_queue import invalidate_vacancy_queue
+from src.utils.telegram.job_filter import invalidate_keyword_profile
 
 
 class RemoveKeywordStates(StatesGroup):
@@ -83,6 +85,9 @@ async def remove_keyword_receive(message: Message, state: FSMContext) -> None:
             else:
                 not_found.append(kw)
         await session.commit()
+        if removed:
+            invalidate_keyword_profile(user.id)
+            invalidate_vacancy_queue(user.id)
 
     if removed:
         logger.info(f"Removed {len(removed)} keywords for user {telegram_id}")
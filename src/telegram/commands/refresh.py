@@ -1,39 +1,33 @@
 from datetime import date
 
 from aiogram import types
-from sqlalchemy import select, delete
+from sqlalchemy import select
 
-from src.db.crud.user_keyword import get_user_all_keywords
+from src.db.crud.job import get_candidate_jobs, get_scoring_watermark
 from src.db.db import AsyncSessionLocal
-from src.db.models.job import Job
-from src.db.models.user_filtered_job import UserFilteredJob
 from logs.logger import logger
 from src.db.models.user_region import UserRegion
 from src.telegram.bot_config import dp
 from aiogram.filters import Command
 
 from src.telegram.job_utils import get_or_create_user
-from src.utils.telegram.job_filter import filter_jobs_for_user
-from src.db.crud.user_filtered_jobs import (
-    create_user_filtered_jobs,
+from src.telegram.vacancy_queue import (
+    invalidate_vacancy_queue,
+    prefetch_vacancies,
 )
+from src.utils.telegram.batch_scoring import save_user_scores
+from src.utils.telegram.job_filter import (
+    filter_jobs_for_user,
+    get_keyword_profile,
+    get_region_sources,
+    get_scoring_profile,
+)
+from src.db.crud.user_filtered_jobs import count_user_filtered_jobs
 
 
 MAX_REFRESH_PER_DAY = 3
 
 
-REGION_MAP = {
-    "robota_ua": "Ukraine",
-    "djinni": "Ukraine",
-    "dou": "Ukraine",
-    "justjoin": "Poland",
-    "nofluff": "Poland",
-    "pracuj": "Poland",
-    "bulldog": "Poland",
-    "jooble": "All",
-}
-
-
 @dp.message(Command("refresh"))
 async def refresh_jobs(message: types.Message) -> None:
     """Filter and save jobs for user browsing."""
@@ -81,7 +75,8 @@ async def refresh_jobs(message: types.Message) -> None:
                 await message.answer("Support the bot for future upgrades ⚡")
                 return
 
-            if not await get_user_all_keywords(session, user_id):
+            keyword_profile = await get_keyword_profile(session, user_id)
+            if not keyword_profile.keywords:
                 await message.answer(
                     "You have no keywords set 😬\nUse /add to add some 😇"
                 )
@@ -93,40 +88,58 @@ async def refresh_jobs(message: types.Message) -> None:
 
             user.refresh_count += 1
 
-            await message.answer("⏳ Filtering jobs, please wait…")
-
             # Get user's region
             result = await session.execute(
                 select(UserRegion.region).where(UserRegion.user_id == user_id)
             )
             region = result.scalar()  # None if not set
 
-            # Fetch all jobs
-            all_jobs = await session.execute(select(Job))
-            jobs = list(all_jobs.scalars())
-
-            # URL-based region filtering
-            if region and region != "all":
-                allowed_keys = [
-                    key for key, reg in REGION_MAP.items() if reg == region
-                ]
-                jobs = [
-                    job
-                    for job in jobs
-                    if any(key in job.url for key in allowed_keys)
-                ]
-
-            # Filter jobs for the user (returns list of tuples: (job, score))
-            logger.info(f"Starting job filtering for user {telegram_id}")
-            filtered_jobs = await filter_jobs_for_user(
-                session, user_id, telegram_id, jobs
+            keyword_weights = keyword_profile.weights
+            sources = get_region_sources(region)
+            profile = get_scoring_profile(keyword_weights, sources)
+            # batch scoring keeps unchanged profiles current after every
+            # fetch cycle, only new keywords or region need scoring here
+            rescore = (
+                user.scoring_profile != profile or user.scored_at is None
             )
-            if not filtered_jobs:
+            if rescore:
+                await message.answer("⏳ Filtering jobs, please wait…")
+                watermark = await get_scoring_watermark(session)
+
+                # Active jobs of the user's region containing any keyword
+                jobs = await get_candidate_jobs(
+                    session, sources, list(keyword_weights)
+                )
+
+                # Filter jobs for the user (list of tuples: (job, score))
+                logger.info(
+                    f"Starting job filtering for user {telegram_id} "
+                    f"on {len(jobs)} jobs"
+                )
+                filtered_jobs = await filter_jobs_for_user(
+                    session, user_id, telegram_id, jobs
+                )
+                scored_jobs = [(job.id, score) for job, score in filtered_jobs]
+                await save_user_scores(
+                    session,
+                    {user_id: scored_jobs},
+                    watermark,
+                    {user_id: profile},
+                    rebuild_ids={user_id},
+                )
+                # rank changed, drop the queue built from the old one
+                invalidate_vacancy_queue(user_id)
+            else:
+                await session.commit()
+            # warm the queue before the user taps /vacancy
+            prefetch_vacancies(user_id)
+
+            total = await count_user_filtered_jobs(session, user_id)
+            if not total:
                 logger.info(f"Sending no jobs message to user {telegram_id}")
-                keywords = await get_user_all_keywords(session, user_id)
                 reply = "No jobs found for your keywords 🥲"
-                for kw in keywords:
-                    reply += f"\n• {kw.keyword} ({kw.weight})"
+                for keyword, weight in keyword_profile.keywords:
+                    reply += f"\n• {keyword} ({weight})"
                 await message.answer(reply)
 
                 await message.answer(
@@ -136,35 +149,17 @@ async def refresh_jobs(message: types.Message) -> None:
 
                 logger.info(
                     f"No jobs found for user {telegram_id} with keywords "
-                    f"{[kw.keyword for kw in keywords]}"
+                    f"{[keyword for keyword, _ in keyword_profile.keywords]}"
                 )
                 return
 
-            logger.info(f"Filtering done, found {len(filtered_jobs)} jobs")
-
-            # Delete old filtered jobs for this user
-            logger.info(f"Deleting old filtered jobs for user {telegram_id}")
-            await session.execute(
-                delete(UserFilteredJob).where(
-                    UserFilteredJob.user_id == user_id
-                )
-            )
-            await session.commit()
-
-            # Save new filtered jobs to DB using CRUD
-            logger.info("Saving new filtered vacancies to DB")
-            entries = [
-                UserFilteredJob(user_id=user_id, job_id=job.id, score=score)
-                for job, score in filtered_jobs
-            ]
-            await create_user_filtered_jobs(session, entries)
-
             await message.answer(
-                f"✅ Found {len(filtered_jobs)} relevant jobs. Use "
+                f"✅ Found {total} relevant jobs. Use "
                 f"/vacancy to get your jobs"
             )
             logger.info(
-                f"Found {len(filtered_jobs)} jobs for user {telegram_id}"
+                f"Found {total} jobs for user {telegram_id}, "
+                f"{'rescored' if rescore else 'from batch scoring'}"
             )
 
     except Exception as e:
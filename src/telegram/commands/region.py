@@ -18,6 +18,7 @@ from src.telegram.bot_config import (
 from src.telegram.job_utils import (
     get_or_create_user,
 )
+from src.telegram.vacancy_queue import invalidate_vacancy_queue
 
 
 class RegionStates(StatesGroup):
@@ -81,6 +82,7 @@ async def process_region_selection(
 
             session.add(UserRegion(user_id=user.id, region=region))
             await session.commit()
+            invalidate_vacancy_queue(user.id)
 
         await cb.message.answer(f"Region set to {region} ✅")
         await cb.message.answer(
@@ -6,9 +6,9 @@ from aiogram import types
 from src.db.db import AsyncSessionLocal
 from logs.logger import logger
 from src.telegram.jobs import send_vacancy_to_user
+from src.telegram.media_cache import send_cached_animation
 from src.telegram.bot_config import (
     dp,
-    bot,
     READY_VACANCY_GIFS,
 )
 
@@ -41,9 +41,9 @@ async def send_next_vacancy(message: types.Message) -> None:
     try:
         async with AsyncSessionLocal() as session:
             gif_url = random.choice(READY_VACANCY_GIFS)
-            await bot.send_animation(
-                chat_id=message.chat.id,
-                animation=gif_url,
+            await send_cached_animation(
+                message.chat.id,
+                gif_url,
                 caption="Are you ready?! 🔥\n(Applied and Skip buttons are "
                 "just to track vacancies in DB for now)",
             )
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
+from src.db.crud.job import match_job_urls
 from src.db.crud.user import get_user_by_telegram_id, create_user
 from src.db.crud.user_keyword import upsert_user_keyword
 from src.db.models.user import User
@@ -87,7 +88,7 @@ async def get_job_id_by_url(session: AsyncSession, job_url: str) -> int | None:
         return None
     try:
         result = await session.execute(
-            select(Job.id).where(Job.url == job_url)
+            select(Job.id).where(match_job_urls(job_url))
         )
         return result.scalar_one_or_none()
     except Exception as e:
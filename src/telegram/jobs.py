@@ -1,17 +1,11 @@
 import random
-from datetime import date
 
 from aiogram import types
 from aiogram.exceptions import TelegramBadRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.crud.job import get_job_by_id
-from src.db.crud.user_filtered_jobs import get_filtered_jobs_by_user
-from src.db.crud.user_job import (
-    get_user_job,
-    create_user_job,
-    update_user_job_status,
-)
+from src.db.crud.user_filtered_jobs import count_user_filtered_jobs
+from src.db.crud.user_job import mark_user_job, reserve_vacancy
 from src.db.db import AsyncSessionLocal
 from src.db.models.job import Job
 from .bot_config import (
@@ -26,80 +20,91 @@ from src.telegram.job_utils import (
     create_vacancy_message,
     get_or_create_user,
 )
+from src.telegram.media_cache import send_cached_animation
+from src.telegram.vacancy_queue import pop_vacancy, return_vacancy
 
 
 MAX_VACANCIES_PER_DAY = 7
 
 
-async def send_vacancy_to_user(
-    telegram_id: str, session: AsyncSession, username: str | None = None
+async def advance_vacancy(
+    session: AsyncSession, user_id: int
+) -> tuple[Job | None, int | None, int | None]:
+    """Reserve next vacancy, return job, score and daily count."""
+    while next_job := await pop_vacancy(user_id):
+        job, score = next_job
+        reserved = await reserve_vacancy(
+            session, user_id, job.id, MAX_VACANCIES_PER_DAY
+        )
+        if reserved is None:
+            # most likely the job was deleted meanwhile, skip it
+            continue
+        if not reserved.within_limit:
+            return_vacancy(user_id, job, score)
+            return job, score, None
+        if reserved.vacancies_count is not None:
+            return job, score, reserved.vacancies_count
+        # already sent, e.g. a double tap, don't send it twice
+    return None, None, None
+
+
+async def deliver_vacancy(
+    session: AsyncSession,
+    telegram_id: str,
+    user_id: int,
+    job: Job | None,
+    score: int | None,
+    vacancies_count: int | None,
 ) -> None:
-    """Send next unviewed vacancy to the user."""
-    logger.info("-" * 60)
-    logger.info(f"Sending vacancy to user: {telegram_id}")
-
-    try:
-        user = await get_or_create_user(session, int(telegram_id), username)
-
-        if user.last_reset_date < date.today():
-            user.refresh_count = 0
-            user.vacancies_count = 0
-            user.last_reset_date = date.today()
-            await session.commit()
-            logger.info(f"Reset daily counters for user {telegram_id}")
-
-        if user.vacancies_count >= MAX_VACANCIES_PER_DAY:
-            await bot.send_message(
-                telegram_id, f"⚡ {MAX_VACANCIES_PER_DAY} jobs done today!"
-            )
-            await bot.send_message(
-                telegram_id, "Support the bot for future updates 💎"
-            )
-            logger.info(f"User {telegram_id} reached daily limit")
-            return
-
-        user_filtered_jobs = await get_filtered_jobs_by_user(session, user.id)
-        job_sent = False
-
-        if not user_filtered_jobs:
+    """Send a reserved vacancy, or tell the user why there is none."""
+    if job is None:
+        if not await count_user_filtered_jobs(session, user_id):
             await bot.send_message(
                 telegram_id,
                 "You have no filters set ⏳ Use /add first",
             )
             return
 
-        # check if user has already seen/applied/skipped this job
-        for ufj in user_filtered_jobs:
-            user_job = await get_user_job(session, user.id, ufj.job_id)
-            if user_job and user_job.status in ("sent", "applied", "skipped"):
-                continue
-
-            job: Job | None = await session.get(Job, ufj.job_id)
-            if not job:
-                continue
+        logger.info(f"No new vacancies for user {telegram_id}")
+        await bot.send_message(
+            telegram_id, "🫠 Dried up. Jobs gone. I am but dust"
+        )
+        return
 
-            await create_user_job(session, user.id, job.id, status="sent")
+    if vacancies_count is None:
+        await bot.send_message(
+            telegram_id, f"⚡ {MAX_VACANCIES_PER_DAY} jobs done today!"
+        )
+        await bot.send_message(
+            telegram_id, "Support the bot for future updates 💎"
+        )
+        logger.info(f"User {telegram_id} reached daily limit")
+        return
 
-            user.vacancies_count += 1
-            await session.commit()
-            logger.info(
-                f"Sent job '{job.title}' to user {telegram_id},"
-                f" updated count {user.vacancies_count}"
-            )
+    msg, keyboard = create_vacancy_message(job, score=score)
+    await bot.send_message(
+        telegram_id, msg, reply_markup=keyboard, parse_mode="Markdown"
+    )
+    logger.info(
+        f"Sent job '{job.title}' to user {telegram_id},"
+        f" updated count {vacancies_count}"
+    )
 
-            msg, keyboard = create_vacancy_message(job, score=ufj.score)
-            await bot.send_message(
-                telegram_id, msg, reply_markup=keyboard, parse_mode="Markdown"
-            )
-            job_sent = True
-            break
 
-        if not job_sent:
-            logger.info(f"No new vacancies for user {telegram_id}")
-            await bot.send_message(
-                telegram_id, "🫠 Dried up. Jobs gone. I am but dust"
-            )
+async def send_vacancy_to_user(
+    telegram_id: str, session: AsyncSession, username: str | None = None
+) -> None:
+    """Send next unviewed vacancy to the user."""
+    logger.info("-" * 60)
+    logger.info(f"Sending vacancy to user: {telegram_id}")
 
+    try:
+        user = await get_or_create_user(session, int(telegram_id), username)
+        job, score, vacancies_count = await advance_vacancy(session, user.id)
+        await session.commit()
+        await deliver_vacancy(
+            session, telegram_id, user.id, job, score, vacancies_count
+        )
     except Exception as err:
         logger.exception(
             f"Failed sending vacancy to user {telegram_id}: {err}"
@@ -115,72 +120,73 @@ async def process_callback(callback_query: types.CallbackQuery) -> None:
 
     action, job_id = callback_query.data.split("|", 1)
     telegram_id = str(callback_query.from_user.id)
-    username = callback_query.from_user.username
+    new_status = "applied" if action == "applied" else "skipped"
     logger.info(f"Callback from user {telegram_id}: {action}")
 
     try:
         async with AsyncSessionLocal() as session:
-            async with session.begin():  # transaction
-                # Get the job
-                job = await get_job_by_id(session, int(job_id))
-                if not job:
-                    logger.warning(f"Job not found: {job_id}")
-                    await bot.answer_callback_query(
-                        callback_query.id,
-                        text="Job not found, system issue 🤷‍♂️",
-                    )
-                    return
-
-                # Get or create the user
-                user = await get_or_create_user(
-                    session,
-                    int(telegram_id),
-                    callback_query.from_user.username,
+            marked = await mark_user_job(
+                session, int(telegram_id), int(job_id), new_status
+            )
+            if not marked:
+                logger.warning(
+                    f"Job {job_id} or user {telegram_id} not found"
                 )
+                await bot.answer_callback_query(
+                    callback_query.id,
+                    text="Job not found, system issue 🤷‍♂️",
+                )
+                return
 
-                # Get or create the user_job record
-                user_job = await get_user_job(session, user.id, job.id)
-                if not user_job:
-                    user_job = await create_user_job(
-                        session, user.id, job.id, status="sent"
-                    )
+            # status and next vacancy are committed in one transaction
+            job, score, vacancies_count = await advance_vacancy(
+                session, marked.user_id
+            )
+            await session.commit()
 
-                # Update status
-                new_status = "applied" if action == "applied" else "skipped"
-                await update_user_job_status(session, user_job, new_status)
+            short_title = clean_short_title(marked.title)
+            reply_text = (
+                f"Marked '{short_title}' as {new_status} 😎"
+                if action == "applied"
+                else "Skipped."
+            )
 
-        short_title = clean_short_title(job.title)
-        reply_text = (
-            f"Marked '{short_title}' as {new_status} 😎"
-            if action == "applied"
-            else "Skipped."
-        )
+            try:
+                await bot.answer_callback_query(
+                    callback_query.id, text=reply_text
+                )
+            except TelegramBadRequest as e:
+                if "query is too old" in str(e):
+                    logger.warning("Callback query expired, ignoring.")
+                else:
+                    raise
+
+            if action == "applied":
+                user_request_count[telegram_id] = (
+                    user_request_count.get(telegram_id, 0) + 1
+                )
+                if user_request_count[telegram_id] % 3 == 0:
+                    meme_url = random.choice(APPLIED_GIFS)
+                    await send_cached_animation(
+                        callback_query.message.chat.id, meme_url
+                    )
+                    logger.info(f"Sent meme to user {telegram_id}")
 
-        try:
-            await bot.answer_callback_query(callback_query.id, text=reply_text)
-        except TelegramBadRequest as e:
-            if "query is too old" in str(e):
-                logger.warning("Callback query expired, ignoring.")
-            else:
-                raise
-
-        if action == "applied":
-            user_request_count[telegram_id] = (
-                user_request_count.get(telegram_id, 0) + 1
-            )
-            if user_request_count[telegram_id] % 3 == 0:
-                meme_url = random.choice(APPLIED_GIFS)
-                await callback_query.message.answer_animation(meme_url)
-                logger.info(f"Sent meme to user {telegram_id}")
-
-        # Send next vacancy safely
-        try:
-            async with AsyncSessionLocal() as session2:
-                await send_vacancy_to_user(telegram_id, session2, username)
-        except Exception as err:
-            logger.exception(
-                f"Failed sending next vacancy to user {telegram_id}: {err}"
-            )
+            # Send next vacancy safely
+            try:
+                await deliver_vacancy(
+                    session,
+                    telegram_id,
+                    marked.user_id,
+                    job,
+                    score,
+                    vacancies_count,
+                )
+            except Exception as err:
+                logger.exception(
+                    f"Failed sending next vacancy to user {telegram_id}: "
+                    f"{err}"
+                )
 
     except Exception as err:
         logger.exception(
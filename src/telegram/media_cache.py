@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import Message
+
+from logs.logger import logger
+from src.db.crud.telegram_media import (
+    get_all_media_file_ids,
+    save_media_file_id,
+)
+from src.db.db import AsyncSessionLocal
+from src.telegram.bot_config import bot
+
+
+# errors meaning the file_id itself is no longer usable
+FILE_ID_ERRORS = ("wrong file identifier", "wrong remote file")
+
+_file_ids: dict[str, str] = {}
+_loaded = False
+_load_lock = asyncio.Lock()
+# one first upload per URL, concurrent senders wait for its file_id
+_upload_locks: dict[str, asyncio.Lock] = {}
+
+
+async def get_media_file_id(url: str) -> str | None:
+    """Return the file_id Telegram gave a media URL, if any."""
+    global _loaded
+    if not _loaded:
+        async with _load_lock:
+            if not _loaded:
+                async with AsyncSessionLocal() as session:
+                    _file_ids.update(await get_all_media_file_ids(session))
+                _loaded = True
+    return _file_ids.get(url)
+
+
+async def send_cached_animation(
+    chat_id: int | str, url: str, **kwargs: Any
+) -> Message:
+    """Send an animation by file_id, downloading the URL only once."""
+    file_id = await get_media_file_id(url)
+    if file_id:
+        try:
+            return await bot.send_animation(
+                chat_id=chat_id, animation=file_id, **kwargs
+            )
+        except TelegramBadRequest as e:
+            if not any(error in e.message.lower() for error in FILE_ID_ERRORS):
+                raise
+            # file ids can become invalid, fall back to the URL
+            logger.warning(f"Cached file id for {url} rejected: {e}")
+            if _file_ids.get(url) == file_id:
+                del _file_ids[url]
+
+    async with _upload_locks.setdefault(url, asyncio.Lock()):
+        file_id = _file_ids.get(url)
+        if file_id:
+            return await bot.send_animation(
+                chat_id=chat_id, animation=file_id, **kwargs
+            )
+        message = await bot.send_animation(
+            chat_id=chat_id, animation=url, **kwargs
+        )
+        media = message.animation or message.document
+        if media:
+            _file_ids[url] = media.file_id
+            async with AsyncSessionLocal() as session:
+                await save_media_file_id(session, url, media.file_id)
+    return message
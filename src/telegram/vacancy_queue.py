@@ -0,0 +1,98 @@
+import asyncio
+from collections import OrderedDict, deque
+
+from logs.logger import logger
+from src.db.crud.user_filtered_jobs import get_unseen_jobs
+from src.db.db import AsyncSessionLocal
+from src.db.models.job import Job
+from src.telegram.bot_config import (
+    VACANCY_QUEUE_LOW,
+    VACANCY_QUEUE_SIZE,
+    VACANCY_QUEUE_USERS,
+)
+
+
+class VacancyQueue:
+    """Next ranked unseen jobs of one user, prefetched from the DB."""
+
+    def __init__(self) -> None:
+        self.jobs: deque[tuple[Job, int | None]] = deque()
+        # popped jobs, their user_jobs row may not be committed yet
+        self.handed_out: set[int] = set()
+        self.exhausted = False
+        self.refill_task: asyncio.Task | None = None
+
+
+_queues: OrderedDict[int, VacancyQueue] = OrderedDict()
+
+
+def get_vacancy_queue(user_id: int) -> VacancyQueue:
+    """Return the user's queue, evicting the least recent user."""
+    queue = _queues.get(user_id)
+    if queue is not None:
+        _queues.move_to_end(user_id)
+        return queue
+
+    queue = _queues[user_id] = VacancyQueue()
+    if len(_queues) > VACANCY_QUEUE_USERS:
+        _queues.popitem(last=False)
+    return queue
+
+
+def invalidate_vacancy_queue(user_id: int) -> None:
+    """Forget prefetched jobs after the user's ranking changed."""
+    # a running refill only fills the detached queue
+    _queues.pop(user_id, None)
+
+
+async def fill_vacancy_queue(user_id: int, queue: VacancyQueue) -> None:
+    """Top the queue up to VACANCY_QUEUE_SIZE from the database."""
+    missing = VACANCY_QUEUE_SIZE - len(queue.jobs)
+    if missing <= 0:
+        return
+
+    exclude_ids = {job.id for job, _ in queue.jobs} | queue.handed_out
+    async with AsyncSessionLocal() as session:
+        jobs = await get_unseen_jobs(session, user_id, missing, exclude_ids)
+        # keep loaded jobs usable after the session is closed
+        session.expunge_all()
+
+    queue.jobs.extend(jobs)
+    queue.exhausted = len(jobs) < missing
+    logger.info(f"Prefetched {len(jobs)} vacancies for user {user_id}")
+
+
+def prefetch_vacancies(user_id: int) -> None:
+    """Refill the user's queue in the background when it runs low."""
+    queue = get_vacancy_queue(user_id)
+    if queue.exhausted or len(queue.jobs) > VACANCY_QUEUE_LOW:
+        return
+    if queue.refill_task and not queue.refill_task.done():
+        return
+    queue.refill_task = asyncio.create_task(
+        fill_vacancy_queue(user_id, queue)
+    )
+
+
+async def pop_vacancy(user_id: int) -> tuple[Job, int | None] | None:
+    """Next unseen job and score, querying only on an empty queue."""
+    queue = get_vacancy_queue(user_id)
+    if not queue.jobs and not queue.exhausted:
+        if queue.refill_task and not queue.refill_task.done():
+            await queue.refill_task
+        else:
+            await fill_vacancy_queue(user_id, queue)
+    if not queue.jobs:
+        return None
+
+    job, score = queue.jobs.popleft()
+    queue.handed_out.add(job.id)
+    prefetch_vacancies(user_id)
+    return job, score
+
+
+def return_vacancy(user_id: int, job: Job, score: int | None) -> None:
+    """Put back a popped job that wasn't sent."""
+    queue = get_vacancy_queue(user_id)
+    queue.handed_out.discard(job.id)
+    queue.jobs.appendleft((job, score))
@@ -1,9 +1,17 @@
 import random
 import asyncio
+import time
+from urllib.parse import urlparse
 
 # import httpx
 
 from logs.logger import logger
+from src.config import (
+    SITE_REQUEST_RATES,
+    DEFAULT_REQUEST_RATE,
+    REQUEST_BURST,
+    REQUEST_JITTER,
+)
 
 
 USER_AGENTS = [
@@ -29,6 +37,66 @@ def get_random_user_agent() -> str:
     return random.choice(USER_AGENTS)
 
 
+class TokenBucket:
+    """Token bucket limiting requests per second."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        self.pause_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back, e.g. when the server asks to retry."""
+        self.pause_until = max(self.pause_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available."""
+        async with self._lock:
+            # waiting under the lock queues every other caller behind us
+            while (pause := self.pause_until - time.monotonic()) > 0:
+                logger.debug(f"Rate limiter paused, waiting {pause:.2f}s")
+                await asyncio.sleep(pause)
+
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+
+            if self.tokens < 1:
+                delay = (1 - self.tokens) / self.rate
+                logger.debug(f"Rate limit reached, waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+                self.tokens = 1.0
+                self.updated_at = time.monotonic()
+
+            self.tokens -= 1
+
+
+_buckets: dict[str, TokenBucket] = {}
+
+
+def get_host(url: str) -> str:
+    """Return host of URL without 'www.' prefix."""
+    host = urlparse(url).hostname or url
+    return host.removeprefix("www.")
+
+
+async def throttle_request(url: str) -> None:
+    """Wait for the host's rate limit before hitting the remote site."""
+    host = get_host(url)
+    bucket = _buckets.get(host)
+    if bucket is None:
+        rate = SITE_REQUEST_RATES.get(host, DEFAULT_REQUEST_RATE)
+        bucket = _buckets[host] = TokenBucket(rate, REQUEST_BURST)
+
+    await bucket.acquire()
+    await asyncio.sleep(random.uniform(0, REQUEST_JITTER))
+
+
 # async def fetch_proxies() -> list[str]:
 #     """Fetch a list of working proxies from ProxyScrape."""
 #     # CAN BE ISSUES WITH THAT FREE OPTION!!!
@@ -0,0 +1,170 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+import psutil
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    Page,
+    Playwright,
+    Route,
+    ViewportSize,
+)
+
+from logs.logger import logger
+from src.config import (
+    BROWSER_MAX_CONTEXTS,
+    BROWSER_RECYCLE_PAGES,
+    BROWSER_RECYCLE_MEMORY_MB,
+)
+from src.utils.fetching.anti_block import get_random_user_agent
+
+
+BROWSER_LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+RouteHandler = Callable[[Route], Awaitable[None]]
+
+
+def get_browser_memory_mb() -> float:
+    """Return total RSS of browser child processes in MB."""
+    try:
+        children = psutil.Process(os.getpid()).children(recursive=True)
+        return sum(child.memory_info().rss for child in children) / 1024**2
+    except Exception as e:
+        logger.warning(f"Failed to measure browser memory: {e}")
+        return 0.0
+
+
+class BrowserPool:
+    """Shared Chromium instances handing out isolated site contexts."""
+
+    def __init__(
+        self,
+        max_contexts: int = BROWSER_MAX_CONTEXTS,
+        recycle_pages: int = BROWSER_RECYCLE_PAGES,
+        recycle_memory_mb: int = BROWSER_RECYCLE_MEMORY_MB,
+    ) -> None:
+        self.max_contexts = max_contexts
+        self.recycle_pages = recycle_pages
+        self.recycle_memory_mb = recycle_memory_mb
+
+        self._playwright: Playwright | None = None
+        # current browser per headless mode, shared by every site using it
+        self._browsers: dict[bool, Browser] = {}
+        self._pages_served: dict[bool, int] = {}
+        # open contexts per browser, retired ones close when it hits 0
+        self._active: dict[Browser, int] = {}
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_contexts)
+
+    def _needs_recycle(self, headless: bool) -> bool:
+        """Check page count and memory ceiling."""
+        pages_served = self._pages_served.get(headless, 0)
+        if pages_served >= self.recycle_pages:
+            logger.info(f"Browser served {pages_served} pages, recycling")
+            return True
+        # a retired browser still draining counts towards the memory too
+        if any(b not in self._browsers.values() for b in self._active):
+            return False
+        memory_mb = get_browser_memory_mb()
+        if memory_mb >= self.recycle_memory_mb:
+            logger.info(f"Browser uses {memory_mb:.0f} MB, recycling")
+            return True
+        return False
+
+    async def _close_browser(self, browser: Browser) -> None:
+        """Close one browser, logging failures."""
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser: {e}")
+
+    async def _close_browsers(self) -> None:
+        """Close all launched browsers, retired ones included."""
+        for browser in {*self._browsers.values(), *self._active}:
+            await self._close_browser(browser)
+        self._browsers.clear()
+        self._pages_served.clear()
+        self._active.clear()
+
+    async def _get_browser(self, headless: bool) -> Browser:
+        """Return running browser, launching or recycling it if needed."""
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            browser = self._browsers.get(headless)
+            if browser is not None and self._needs_recycle(headless):
+                # new contexts go to a fresh browser, open ones finish here
+                del self._browsers[headless]
+                if browser not in self._active:
+                    await self._close_browser(browser)
+                browser = None
+
+            if browser is None or not browser.is_connected():
+                logger.info(f"Launching shared Chromium (headless={headless})")
+                browser = await self._playwright.chromium.launch(
+                    headless=headless, args=BROWSER_LAUNCH_ARGS
+                )
+                self._browsers[headless] = browser
+                self._pages_served[headless] = 0
+
+            self._pages_served[headless] += 1
+            self._active[browser] = self._active.get(browser, 0) + 1
+            return browser
+
+    async def _release_browser(self, browser: Browser) -> None:
+        """Drop a context lease, closing the browser if it was retired."""
+        async with self._lock:
+            if browser not in self._active:
+                # the pool was closed meanwhile
+                return
+            self._active[browser] -= 1
+            if self._active[browser] > 0:
+                return
+            del self._active[browser]
+            if browser not in self._browsers.values():
+                await self._close_browser(browser)
+
+    @asynccontextmanager
+    async def new_page(
+        self,
+        headless: bool = True,
+        viewport: ViewportSize | None = None,
+        route_handler: RouteHandler | None = None,
+    ) -> AsyncIterator[Page]:
+        """Yield a page in a fresh context with random user agent."""
+        async with self._slots:
+            browser = await self._get_browser(headless)
+            context = None
+            try:
+                ua = get_random_user_agent()
+                logger.info(f"User-agent: {ua}")
+                context = await browser.new_context(
+                    user_agent=ua,
+                    viewport=viewport or ViewportSize(width=600, height=400),
+                )
+                if route_handler:
+                    await context.route("**/*", route_handler)
+                yield await context.new_page()
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.warning(f"Failed to close context: {e}")
+                await self._release_browser(browser)
+
+    async def close(self) -> None:
+        """Close browsers and stop Playwright."""
+        async with self._lock:
+            await self._close_browsers()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+        logger.info("Shared browser pool closed")
+
+
+browser_pool = BrowserPool()
@@ -0,0 +1,66 @@
+from typing import Any
+
+from playwright.async_api import Page
+
+from logs.logger import logger
+
+
+# Field spec keys, all optional:
+#   selector - CSS selector inside the card, empty means the card itself
+#   attr     - attribute to read instead of textContent
+#   prop     - DOM property to read instead of textContent (e.g. innerText)
+#   many     - read every match as a list instead of the first one
+#   closest  - return whether the card is inside an ancestor matching this
+FieldSpec = dict[str, Any]
+CardSpec = dict[str, FieldSpec]
+
+EXTRACT_CARDS_JS = """
+(cards, { spec, markAttr }) => cards.map(card => {
+    if (markAttr) card.setAttribute(markAttr, "");
+    const read = (el, f) => {
+        if (f.attr) return el.getAttribute(f.attr);
+        if (f.prop) return el[f.prop] ?? null;
+        return el.textContent;
+    };
+    const row = {};
+    for (const [field, f] of Object.entries(spec)) {
+        if (f.closest) {
+            row[field] = card.closest(f.closest) !== null;
+            continue;
+        }
+        const targets = !f.selector
+            ? [card]
+            : f.many
+                ? Array.from(card.querySelectorAll(f.selector))
+                : [card.querySelector(f.selector)];
+        const values = targets.filter(Boolean).map(el => read(el, f));
+        row[field] = f.many
+            ? values.filter(v => v !== null)
+            : (values.length ? values[0] : null);
+    }
+    return row;
+})
+"""
+
+
+async def extract_cards(
+    page: Page,
+    card_selector: str,
+    spec: CardSpec,
+    mark_attr: str | None = None,
+) -> list[dict[str, Any]]:
+    """Extract all cards into plain dicts in one round trip."""
+    try:
+        return await page.eval_on_selector_all(
+            card_selector,
+            EXTRACT_CARDS_JS,
+            {"spec": spec, "markAttr": mark_attr},
+        )
+    except Exception as e:
+        logger.error(f"Failed to extract cards '{card_selector}': {e}")
+        return []
+
+
+def strip_or_none(value: str | None) -> str | None:
+    """Strip text, keeping None for missing values."""
+    return value.strip() if value else None
@@ -1,5 +1,12 @@
 import asyncio
+import time
+from typing import Any, Awaitable, Callable
 
+from src.config import (
+    FETCH_CONCURRENTLY,
+    FETCH_MAX_CONCURRENCY,
+    FETCH_SITE_TIMEOUT,
+)
 from src.fetchers.justjoin.justjoin import (
     run_fetch_and_save_jobs as fetch_justjoin,
 )
@@ -17,6 +24,7 @@ from src.fetchers.bulldog.bulldog import (
 # )
 from src.fetchers.jooble.jooble import run_fetch_and_save_jobs as fetch_jooble
 from logs.logger import logger
+from src.utils.fetching.browser_pool import browser_pool
 from src.utils.resources_logging import log_resources
 
 
@@ -33,27 +41,75 @@ FETCHERS = {
 }
 
 
-async def run_all_fetchers() -> list[dict]:
-    """
-    Runs all job fetchers and combines their results.
-    """
-    all_jobs = []
-
-    for name, fetcher in FETCHERS.items():
+async def run_fetcher(
+    name: str,
+    fetcher: Callable[[], Awaitable[int | None]],
+    semaphore: asyncio.Semaphore,
+) -> dict[str, Any]:
+    """Run one site fetcher with timeout and collect its stats."""
+    async with semaphore:
         logger.info("-" * 60)
         log_resources()
         logger.info(f"Fetching jobs from {name}...")
+        start = time.monotonic()
+        saved = 0
         try:
-            jobs = await fetcher()
-            all_jobs.extend(jobs)
+            saved = await asyncio.wait_for(fetcher(), FETCH_SITE_TIMEOUT) or 0
+            status = "ok"
+        except asyncio.TimeoutError:
+            status = "timeout"
+            logger.error(
+                f"Fetching from {name} timed out after {FETCH_SITE_TIMEOUT}s"
+            )
         except Exception as e:
+            status = "error"
             logger.error(f"Error fetching from {name}: {e}", exc_info=True)
         finally:
             log_resources()
 
-    logger.info(f"Total jobs fetched: {len(all_jobs)}")
+    return {
+        "name": name,
+        "status": status,
+        "jobs": saved,
+        "seconds": time.monotonic() - start,
+    }
+
+
+def log_cycle_report(results: list[dict[str, Any]]) -> None:
+    """Log per-site wall time, job count and outcome."""
+    logger.info("-" * 60)
+    logger.info("Fetch cycle report:")
+    for result in results:
+        logger.info(
+            f"{result['name']:<10} | {result['status']:<7} | "
+            f"{result['jobs']:>5} jobs | {result['seconds']:>8.1f}s"
+        )
+
+
+async def run_all_fetchers() -> int:
+    """
+    Runs all job fetchers and returns the number of saved jobs.
+    """
+    # one slot means the old one-site-after-another behaviour
+    concurrency = FETCH_MAX_CONCURRENCY if FETCH_CONCURRENTLY else 1
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    try:
+        results = await asyncio.gather(
+            *(
+                run_fetcher(name, fetcher, semaphore)
+                for name, fetcher in FETCHERS.items()
+            )
+        )
+    finally:
+        # free Chromium memory between cycles
+        await browser_pool.close()
+    log_cycle_report(results)
+
+    total = sum(result["jobs"] for result in results)
+    logger.info(f"Total jobs fetched: {total}")
 
-    return all_jobs
+    return total
 
 
 if __name__ == "__main__":
@@ -2,10 +2,10 @@ import asyncio
 from datetime import datetime, timedelta
 
 from logs.logger import logger
-from src.db.db import AsyncSessionLocal
+from src.db.db import get_pool_stats
 from src.utils.fetching.fetch_orchestrator import run_all_fetchers
-from src.utils.job_cleanup import delete_old_jobs
 from src.utils.resources_logging import log_resources
+from src.utils.telegram.batch_scoring import score_all_users
 
 
 async def job_process_loop() -> None:
@@ -35,9 +35,7 @@ async def job_process_loop() -> None:
             logger.info(f"Next job processing scheduled at {next_run_time}")
 
             await run_all_fetchers()
-
-            async with AsyncSessionLocal() as session:
-                await delete_old_jobs(session)
+            await score_all_users()
 
         except Exception as e:
             logger.warning(f"Job process failed: {e}")
@@ -45,6 +43,7 @@ async def job_process_loop() -> None:
         finally:
             end_time = datetime.now()
             log_resources()
+            logger.info(f"DB pool stats: {get_pool_stats()}")
             logger.info(f"Job processing finished at {end_time}")
             logger.info(f"Next job processing will be at {next_run_time}")
 
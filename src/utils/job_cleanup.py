@@ -1,27 +1,76 @@
+import asyncio
 from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete
+from sqlalchemy import delete, select
 
-from src.config import ARCHIVE_LIFETIME_DAYS
+from src.config import (
+    ARCHIVE_LIFETIME_DAYS,
+    CLEANUP_BATCH_PAUSE,
+    CLEANUP_BATCH_SIZE,
+    CLEANUP_INTERVAL_HOURS,
+)
+from src.db.db import BatchSessionLocal
 from src.db.models.job import Job
 from logs.logger import logger
 
 
-async def delete_old_jobs(session: AsyncSession) -> None:
-    """Delete jobs archived longer than configured period"""
-    try:
-        cutoff = datetime.now(timezone.utc) - timedelta(
-            days=ARCHIVE_LIFETIME_DAYS
-        )
-        result = await session.execute(
-            delete(Job).where(Job.archived_at <= cutoff)
-        )
-        deleted_count = result.rowcount or 0
-        await session.commit()
-        logger.info(
-            f"Deleted {deleted_count} jobs archived"
-            f" more than {ARCHIVE_LIFETIME_DAYS} days"
-        )
-    except Exception:
-        await session.rollback()
-        raise
+async def delete_old_jobs(
+    session: AsyncSession, batch_size: int = CLEANUP_BATCH_SIZE
+) -> int:
+    """Delete jobs archived longer than configured period in batches"""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=ARCHIVE_LIFETIME_DAYS)
+    deleted_count = 0
+    last_id = 0
+
+    while True:
+        try:
+            # walk ids upwards, each batch cascades in its own transaction
+            batch = (
+                select(Job.id)
+                .where(Job.archived_at <= cutoff, Job.id > last_id)
+                .order_by(Job.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+                .cte("batch")
+            )
+            result = await session.execute(
+                delete(Job)
+                .where(Job.id.in_(select(batch.c.id)))
+                .returning(Job.id)
+                .execution_options(synchronize_session=False)
+            )
+            ids = list(result.scalars())
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+        if ids:
+            last_id = max(ids)
+            deleted_count += len(ids)
+            logger.info(
+                f"Deleted {deleted_count} old jobs so far (up to id {last_id})"
+            )
+        # SKIP LOCKED can return a short batch before the end, only an
+        # empty one means nothing is left past last_id
+        if not ids:
+            break
+        # let bot queries take the locks between batches
+        await asyncio.sleep(CLEANUP_BATCH_PAUSE)
+
+    logger.info(
+        f"Deleted {deleted_count} jobs archived"
+        f" more than {ARCHIVE_LIFETIME_DAYS} days"
+    )
+    return deleted_count
+
+
+async def job_cleanup_loop() -> None:
+    """Delete old jobs every CLEANUP_INTERVAL_HOURS."""
+    while True:
+        try:
+            async with BatchSessionLocal() as session:
+                await delete_old_jobs(session)
+        except Exception as e:
+            logger.error(f"Job cleanup failed: {e}")
+        await asyncio.sleep(CLEANUP_INTERVAL_HOURS * 60 * 60)
@@ -1,22 +1,68 @@
+import asyncio
 import os
+import time
+from collections import deque
 
 import psutil
 
 from logs.logger import logger
+from src.config import RESOURCE_HISTORY_SIZE, RESOURCE_SAMPLE_INTERVAL
+
+
+# ring buffer of the latest samples, oldest dropped automatically
+resource_history: deque[dict] = deque(maxlen=RESOURCE_HISTORY_SIZE)
+
+
+def get_memory_mb() -> float:
+    """Return this process's RSS in MB."""
+    process = psutil.Process(os.getpid())
+    return round(process.memory_info().rss / 1024**2, 2)
+
+
+def sample_resources() -> dict:
+    """Take one non-blocking memory and CPU sample."""
+    sample = {
+        "timestamp": time.time(),
+        "memory_mb": get_memory_mb(),
+        # interval=None compares with previous call instead of sleeping
+        "cpu_percent": psutil.cpu_percent(interval=None),
+    }
+    resource_history.append(sample)
+    return sample
+
+
+async def sample_resources_periodically(
+    interval: float = RESOURCE_SAMPLE_INTERVAL,
+) -> None:
+    """Sample resources into history every interval seconds."""
+    while True:
+        try:
+            sample_resources()
+        except Exception as e:
+            logger.warning(f"Failed to sample resources: {e}")
+        await asyncio.sleep(interval)
 
 
 def log_resources() -> None:
     """
-    Logs current process memory and CPU usage.
+    Logs latest process memory and CPU usage sample.
     """
     try:
-        process = psutil.Process(os.getpid())
-        mem_mb = process.memory_info().rss / 1024**2
-        cpu_percent = psutil.cpu_percent(
-            interval=1.0
-        )
+        sample = resource_history[-1] if resource_history else None
+        # sampler not running (e.g. standalone script): memory only, a
+        # cpu_percent call here would reset the sampler's CPU baseline
+        if (
+            sample is None
+            or time.time() - sample["timestamp"] > 2 * RESOURCE_SAMPLE_INTERVAL
+        ):
+            logger.info(
+                f"Resources usage: {get_memory_mb():.2f} MB "
+                "| CPU: no recent sample"
+            )
+            return
         logger.info(
-            f"Resources usage: {mem_mb:.2f} MB | CPU: {cpu_percent:.2f}%"
+            f"Resources usage: {sample['memory_mb']:.2f} MB "
+            f"| CPU: {sample['cpu_percent']:.2f}%"
         )
     except Exception as e:
         logger.warning(f"Failed to log resources: {e}")
@@ -0,0 +1,26 @@
+SEARCH_TEXT_SEPARATOR = "\n"
+
+
+def normalize_text(text: str | None) -> str:
+    """Lowercase text and collapse whitespace."""
+    return " ".join((text or "").lower().split())
+
+
+def build_search_text(
+    title: str | None, skills: list[str] | str | None
+) -> str:
+    """Normalized title and skills joined by a newline."""
+    if isinstance(skills, list):
+        skills = " ".join(skills)
+    # whitespace is collapsed, so the separator can't appear in either part
+    return (
+        normalize_text(title)
+        + SEARCH_TEXT_SEPARATOR
+        + normalize_text(skills)
+    )
+
+
+def split_search_text(search_text: str) -> tuple[str, str]:
+    """Split search text back into title and skills parts."""
+    title, _, skills = search_text.partition(SEARCH_TEXT_SEPARATOR)
+    return title, skills
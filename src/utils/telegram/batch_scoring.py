@@ -0,0 +1,243 @@
+import asyncio
+import heapq
+from collections import defaultdict
+from datetime import datetime
+from operator import itemgetter
+from typing import Collection, Iterable, Sequence
+
+from sqlalchemy import Row, delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from logs.logger import logger
+from src.config import SCORE_SAVE_CHUNK_SIZE, SCORE_THRESHOLD
+from src.db.crud.job import get_candidate_jobs, get_scoring_watermark
+from src.db.crud.user_filtered_jobs import save_user_filtered_jobs
+from src.db.db import BatchSessionLocal
+from src.db.models.user import User
+from src.db.models.user_filtered_job import UserFilteredJob
+from src.db.models.user_keyword import UserKeyword
+from src.db.models.user_region import UserRegion
+from src.telegram.bot_config import MAX_FILTERED_JOBS
+from src.telegram.vacancy_queue import invalidate_vacancy_queue
+from src.utils.search_text import split_search_text
+from src.utils.telegram.job_filter import (
+    build_keyword_weights,
+    get_region_sources,
+    get_scoring_profile,
+)
+
+# keyword -> (job positions with a title hit, positions with skills-only hit)
+Postings = dict[str, tuple[list[int], list[int]]]
+
+# user id -> (keyword weights, region sources)
+Profiles = dict[int, tuple[dict[str, int], list[str] | None]]
+
+
+def build_postings(
+    search_texts: Sequence[str | None], keywords: Iterable[str]
+) -> Postings:
+    """Match every distinct keyword against every job once."""
+    parts = [split_search_text(text or "") for text in search_texts]
+    postings: Postings = {}
+    for keyword in keywords:
+        in_title: list[int] = []
+        in_skills: list[int] = []
+        for position, (title, skills) in enumerate(parts):
+            if keyword in title:
+                in_title.append(position)
+            elif keyword in skills:
+                in_skills.append(position)
+        postings[keyword] = (in_title, in_skills)
+    return postings
+
+
+def rank_jobs(
+    postings: Postings,
+    keyword_weights: dict[str, int],
+    allowed: Sequence[bool] | None = None,
+) -> list[tuple[int, int]]:
+    """Sparse-sum keyword postings into top (position, score) pairs."""
+    scores: defaultdict[int, int] = defaultdict(int)
+    for keyword, weight in keyword_weights.items():
+        in_title, in_skills = postings[keyword]
+        for position in in_title:
+            scores[position] += weight
+        if half_weight := weight // 2:
+            for position in in_skills:
+                scores[position] += half_weight
+
+    ranked = (
+        (position, score)
+        for position, score in scores.items()
+        if score > SCORE_THRESHOLD and (allowed is None or allowed[position])
+    )
+    return heapq.nlargest(MAX_FILTERED_JOBS, ranked, key=itemgetter(1))
+
+
+def score_profiles(
+    jobs: Sequence[Row],
+    profiles: Profiles,
+    seen_since: dict[int, datetime | None] | None = None,
+) -> dict[int, list[tuple[int, int]]]:
+    """Score all users against jobs, return top (job_id, score) lists."""
+    keywords = {kw for weights, _ in profiles.values() for kw in weights}
+    postings = build_postings([job.search_text for job in jobs], keywords)
+    seen_since = seen_since or {}
+
+    # one mask per region and watermark, not per user
+    masks: dict[tuple, list[bool]] = {}
+    results: dict[int, list[tuple[int, int]]] = {}
+    for user_id, (weights, sources) in profiles.items():
+        since = seen_since.get(user_id)
+        allowed = None
+        if sources is not None or since is not None:
+            key = (sources and tuple(sources), since)
+            if key not in masks:
+                masks[key] = [
+                    (sources is None or job.source in sources)
+                    and (since is None or job.last_seen >= since)
+                    for job in jobs
+                ]
+            allowed = masks[key]
+        results[user_id] = [
+            (jobs[position].id, score)
+            for position, score in rank_jobs(postings, weights, allowed)
+        ]
+    return results
+
+
+async def load_keyword_profiles(session: AsyncSession) -> Profiles:
+    """Load keyword weights and region sources of every user."""
+    keyword_rows = await session.execute(
+        select(UserKeyword.user_id, UserKeyword.keyword, UserKeyword.weight)
+    )
+    keywords_by_user: defaultdict[int, list[Row]] = defaultdict(list)
+    for row in keyword_rows:
+        keywords_by_user[row.user_id].append(row)
+
+    region_rows = await session.execute(
+        select(UserRegion.user_id, UserRegion.region)
+    )
+    regions = {row.user_id: row.region for row in region_rows}
+
+    return {
+        user_id: (
+            build_keyword_weights(keywords),
+            get_region_sources(regions.get(user_id)),
+        )
+        for user_id, keywords in keywords_by_user.items()
+    }
+
+
+async def save_user_scores(
+    session: AsyncSession,
+    scored_jobs: dict[int, list[tuple[int, int]]],
+    scored_at: datetime | None,
+    profiles: dict[int, str],
+    rebuild_ids: Collection[int],
+) -> None:
+    """Store users' scores and their new watermarks together."""
+    await session.execute(
+        update(User),
+        [
+            {"id": user_id, "scored_at": scored_at, "scoring_profile": profile}
+            for user_id, profile in profiles.items()
+        ],
+    )
+    # both commit, so the mark never moves without the scores
+    await save_user_filtered_jobs(
+        session, scored_jobs, rebuild_ids, MAX_FILTERED_JOBS
+    )
+
+
+async def clear_unprofiled_users(session: AsyncSession) -> set[int]:
+    """Drop scores and scoring state of users without keywords."""
+    reset = await session.execute(
+        update(User)
+        .where(
+            User.scoring_profile.is_not(None),
+            ~select(UserKeyword.id)
+            .where(UserKeyword.user_id == User.id)
+            .exists(),
+        )
+        .values(scored_at=None, scoring_profile=None)
+        .returning(User.id)
+    )
+    cleared = await session.execute(
+        delete(UserFilteredJob)
+        .where(
+            ~select(UserKeyword.id)
+            .where(UserKeyword.user_id == UserFilteredJob.user_id)
+            .exists()
+        )
+        .returning(UserFilteredJob.user_id)
+    )
+    user_ids = set(reset.scalars()) | set(cleared.scalars())
+    await session.commit()
+    return user_ids
+
+
+async def score_all_users() -> None:
+    """Score jobs seen since each user's last scoring."""
+    logger.info("-" * 60)
+    logger.info("Batch scoring all users")
+
+    async with BatchSessionLocal() as session:
+        # removed keywords leave no profile, their old ranking must go too
+        for user_id in await clear_unprofiled_users(session):
+            invalidate_vacancy_queue(user_id)
+
+        profiles = await load_keyword_profiles(session)
+        if not profiles:
+            logger.info("No users with keywords, skipping batch scoring")
+            return
+
+        states = await session.execute(
+            select(User.id, User.scored_at, User.scoring_profile).where(
+                User.id.in_(profiles)
+            )
+        )
+        hashes = {
+            user_id: get_scoring_profile(weights, sources)
+            for user_id, (weights, sources) in profiles.items()
+        }
+        # keywords or region changed since last time -> full rebuild
+        seen_since = {
+            state.id: (
+                state.scored_at
+                if state.scoring_profile == hashes[state.id]
+                else None
+            )
+            for state in states
+        }
+        # read before the candidates, so anything it misses is newer
+        watermark = await get_scoring_watermark(session)
+        marks = [seen_since.get(user_id) for user_id in profiles]
+        oldest = None if None in marks else min(marks)
+        jobs = await get_candidate_jobs(session, seen_since=oldest)
+
+        # CPU bound, keep the bot's event loop responsive
+        results = await asyncio.to_thread(
+            score_profiles, jobs, profiles, seen_since
+        )
+
+        rebuild_ids = {
+            user_id for user_id in results if seen_since.get(user_id) is None
+        }
+        user_ids = list(results)
+        for start in range(0, len(user_ids), SCORE_SAVE_CHUNK_SIZE):
+            chunk = user_ids[start:start + SCORE_SAVE_CHUNK_SIZE]
+            await save_user_scores(
+                session,
+                {user_id: results[user_id] for user_id in chunk},
+                watermark,
+                {user_id: hashes[user_id] for user_id in chunk},
+                rebuild_ids,
+            )
+            for user_id in chunk:
+                invalidate_vacancy_queue(user_id)
+
+    logger.info(
+        f"Batch scored {len(jobs)} jobs for {len(profiles)} users, "
+        f"{marks.count(None)} full rebuilds"
+    )
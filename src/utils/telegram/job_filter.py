@@ -1,26 +1,34 @@
 import asyncio
+import hashlib
+import json
 import re
-from datetime import datetime, timezone
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import List, Sequence, Tuple
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.config import SCORE_THRESHOLD
+from src.config import KEYWORD_CACHE_SIZE, REGION_MAP, SCORE_THRESHOLD
 from src.db.crud.user_keyword import get_user_all_keywords
 from src.db.models.job import Job
+from src.db.models.user_keyword import UserKeyword
 from logs.logger import logger
 from src.telegram.bot_config import MAX_FILTERED_JOBS
+from src.utils.search_text import (
+    build_search_text,
+    normalize_text,
+    split_search_text,
+)
 
 
-def score_job(job: Job, keyword_weights: dict[str, int]) -> int:
+def score_job(job: Job | Row, keyword_weights: dict[str, int]) -> int:
     """Score job based on keyword relevance."""
     try:
-        title = (job.title or "").lower()
-        skills = job.skills or ""
-        if isinstance(skills, list):
-            skills = " ".join(skills).lower()
-        else:
-            skills = skills.lower()
+        # normalized at ingestion, rebuilt only for rows saved before that
+        search_text = getattr(job, "search_text", None)
+        if search_text is None:
+            search_text = build_search_text(job.title, job.skills)
+        title, skills = split_search_text(search_text)
 
         score = 0
         for keyword, weight in keyword_weights.items():
@@ -37,42 +45,96 @@ def score_job(job: Job, keyword_weights: dict[str, int]) -> int:
         return 0
 
 
+def get_region_sources(region: str | None) -> list[str] | None:
+    """Job sources of a region, None means every source."""
+    if not region or region == "all":
+        return None
+    return [key for key, reg in REGION_MAP.items() if reg == region]
+
+
+def get_scoring_profile(
+    keyword_weights: dict[str, int], sources: list[str] | None
+) -> str:
+    """Hash keywords and region, a change forces a full rescore."""
+    payload = json.dumps(
+        [sorted(keyword_weights.items()), sources and sorted(sources)]
+    )
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def build_keyword_weights(
+    keywords_list: Sequence[UserKeyword],
+) -> dict[str, int]:
+    """Map each keyword and its comma/space parts to weight."""
+    keyword_weights: dict[str, int] = {
+        normalize_text(kw.keyword): kw.weight for kw in keywords_list
+    }
+    for kw in keywords_list:
+        for k in re.split(r"[, ]+", kw.keyword):
+            k_clean = k.strip().lower()
+            if k_clean:
+                keyword_weights[k_clean] = kw.weight
+    return keyword_weights
+
+
+class KeywordProfile:
+    """User keywords parsed once, reused across refreshes."""
+
+    def __init__(self, keywords_list: Sequence[UserKeyword]) -> None:
+        # plain tuples, ORM rows expire with their session
+        self.keywords = tuple((kw.keyword, kw.weight) for kw in keywords_list)
+        self.weights = build_keyword_weights(keywords_list)
+
+
+_keyword_profiles: OrderedDict[int, KeywordProfile] = OrderedDict()
+
+
+async def get_keyword_profile(
+    session: AsyncSession, user_id: int
+) -> KeywordProfile:
+    """Return cached keyword profile, loading it on a miss."""
+    profile = _keyword_profiles.get(user_id)
+    if profile is not None:
+        _keyword_profiles.move_to_end(user_id)
+        return profile
+
+    profile = KeywordProfile(await get_user_all_keywords(session, user_id))
+    # empty may also mean a failed query, don't pin it
+    if profile.keywords:
+        _keyword_profiles[user_id] = profile
+        if len(_keyword_profiles) > KEYWORD_CACHE_SIZE:
+            _keyword_profiles.popitem(last=False)
+    return profile
+
+
+def invalidate_keyword_profile(user_id: int) -> None:
+    """Drop cached keywords after the user changed them."""
+    _keyword_profiles.pop(user_id, None)
+
+
 async def filter_jobs_for_user(
-    session: AsyncSession, user_id: int, telegram_id: int, jobs: List[Job]
-) -> List[Tuple[Job, int]]:
-    """Filter jobs for a user and compute scores."""
+    session: AsyncSession,
+    user_id: int,
+    telegram_id: int,
+    jobs: Sequence[Job | Row],
+) -> List[Tuple[Job | Row, int]]:
+    """Score active candidate jobs for a user and keep the best."""
     try:
         logger.info("-" * 60)
-        keywords_list = await get_user_all_keywords(session, user_id)
-        keyword_weights: dict[str, int] = {
-            kw.keyword.lower(): kw.weight for kw in keywords_list
-        }
+        profile = await get_keyword_profile(session, user_id)
+        keyword_weights = profile.weights
         if not keyword_weights:
             logger.info(
                 f"No keywords for user {telegram_id}, skipping job filtering"
             )
             return []
 
-        for kw in keywords_list:
-            for k in re.split(r"[, ]+", kw.keyword):
-                k_clean = k.strip().lower()
-                if k_clean:
-                    keyword_weights[k_clean] = kw.weight
-                    logger.info(
-                        f"Filtering keyword '{k_clean}' "
-                        f"with weight {kw.weight} "
-                        f"for user {telegram_id}"
-                    )
         logger.info(
             f"Fetched keywords for user {telegram_id}: {keyword_weights}"
         )
 
-        scored_jobs: List[Tuple[Job, int]] = []
-        now = datetime.now(timezone.utc)
+        scored_jobs: List[Tuple[Job | Row, int]] = []
         for job in jobs:
-            if job.archived_at and job.archived_at <= now:
-                continue
-
             score = score_job(job, keyword_weights)
             if score > SCORE_THRESHOLD:
                 scored_jobs.append((job, score))
@@ -1,64 +1,126 @@
+import asyncio
 import random
-from datetime import date
+from datetime import date, timedelta
 
-from sqlalchemy import select
+from aiogram.exceptions import TelegramRetryAfter
+from sqlalchemy import ColumnElement, and_, or_, select, update
 
 from logs.logger import logger
-from src.db.db import AsyncSessionLocal
+from src.config import (
+    NOTIFY_BATCH_SIZE,
+    NOTIFY_BURST,
+    NOTIFY_RATE,
+    NOTIFY_RETRIES,
+    NOTIFY_WORKERS,
+)
+from src.db.db import BatchSessionLocal
 from src.db.models import User
 from src.telegram.bot_config import (
-    bot,
     NOTIFICATION_MESSAGES,
     NOTIFICATION_GIFS,
 )
+from src.telegram.media_cache import send_cached_animation
+from src.utils.fetching.anti_block import TokenBucket
 
 
-async def send_notification(user: User) -> None:
-    """Helper function for sending notification."""
-    try:
-        telegram_id = user.telegram_id
-        msg = random.choice(NOTIFICATION_MESSAGES)
-        media = random.choice(NOTIFICATION_GIFS)
-
-        await bot.send_animation(
-            chat_id=telegram_id,
-            animation=media,
-            caption=msg,
-        )
-
-        user.last_notification_date = date.today()
-        logger.info(f"Notification sent to user {telegram_id}")
-    except Exception as e:
-        logger.error(f"Failed sending notification: {e}")
+# shared by all workers, keeps the bot under Telegram's global limit
+_send_bucket = TokenBucket(NOTIFY_RATE, NOTIFY_BURST)
+
+
+async def send_notification(telegram_id: int) -> bool:
+    """Send a reminder, waiting out Telegram flood control."""
+    msg = random.choice(NOTIFICATION_MESSAGES)
+    media = random.choice(NOTIFICATION_GIFS)
+
+    for _ in range(NOTIFY_RETRIES + 1):
+        await _send_bucket.acquire()
+        try:
+            await send_cached_animation(telegram_id, media, caption=msg)
+            logger.info(f"Notification sent to user {telegram_id}")
+            return True
+        except TelegramRetryAfter as e:
+            logger.warning(
+                f"Flood control for user {telegram_id}, "
+                f"retrying in {e.retry_after}s"
+            )
+            # the limit is per bot, every worker has to back off
+            _send_bucket.pause(e.retry_after)
+        except Exception as e:
+            logger.error(f"Failed sending notification: {e}")
+            return False
+    return False
+
+
+def notification_due(today: date) -> ColumnElement[bool]:
+    """Users without a notification today who are due one."""
+    return or_(
+        User.last_notification_date.is_(None),
+        and_(
+            User.last_notification_date < today,
+            or_(
+                # active at least in the last days
+                User.last_reset_date > today - timedelta(days=3),
+                # one time notification for other inactive users
+                User.last_reset_date.in_(
+                    [today - timedelta(days=7), today - timedelta(days=30)]
+                ),
+            ),
+        ),
+    )
 
 
 async def notify_inactive_users() -> None:
     """Notify without notification and inactive users for period of days."""
     today = date.today()
+    queue: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
+    sent_ids: list[int] = []
+
+    async def worker() -> None:
+        while True:
+            user_id, telegram_id = await queue.get()
+            try:
+                if await send_notification(telegram_id):
+                    sent_ids.append(user_id)
+            finally:
+                queue.task_done()
 
+    workers = [asyncio.create_task(worker()) for _ in range(NOTIFY_WORKERS)]
+    notified = 0
+    last_id = 0
     try:
-        async with AsyncSessionLocal() as session:
-            result = await session.execute(select(User))
-            users = result.scalars().all()
+        while True:
+            # short sessions, no transaction stays open while sending
+            async with BatchSessionLocal() as session:
+                result = await session.execute(
+                    select(User.id, User.telegram_id)
+                    .where(notification_due(today), User.id > last_id)
+                    .order_by(User.id)
+                    .limit(NOTIFY_BATCH_SIZE)
+                )
+                users = result.all()
+            if not users:
+                break
+            last_id = users[-1].id
 
             for user in users:
-                days_inactive = (today - user.last_reset_date).days
-
-                if not user.last_notification_date:
-                    await send_notification(user)
-
-                elif user.last_notification_date < date.today():
-                    # check if user was active at least last days
-                    if days_inactive < 3:
-                        await send_notification(user)
+                queue.put_nowait((user.id, user.telegram_id))
+            await queue.join()
 
-                    # one time notification for other inactive users
-                    elif days_inactive == 7:
-                        await send_notification(user)
-
-                    elif days_inactive == 30:
-                        await send_notification(user)
-
-            await session.commit()
+            # saved per batch, a rerun skips users notified today
+            if sent_ids:
+                async with BatchSessionLocal() as session:
+                    await session.execute(
+                        update(User)
+                        .where(User.id.in_(sent_ids))
+                        .values(last_notification_date=today)
+                    )
+                    await session.commit()
+            notified += len(sent_ids)
+            sent_ids.clear()
     except Exception as e:
         logger.error(f"DB or session error: {e}")
+    finally:
+        for task in workers:
+            task.cancel()
+
+    logger.info(f"Notified {notified} users")
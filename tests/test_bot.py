@@ -15,3 +15,252 @@ async def test_start_bot_calls_notify_admin_startup():
     ):
         await start_bot()
         mock_notify.assert_called_once()
+
+
+async def test_vacancy_queue_prefetches_and_skips_handed_out_jobs():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.telegram import vacancy_queue
+
+    jobs = [(SimpleNamespace(id=i), 10 - i) for i in range(1, 8)]
+
+    async def get_unseen_jobs(session, user_id, limit, exclude_ids):
+        return [j for j in jobs if j[0].id not in exclude_ids][:limit]
+
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = MagicMock()
+    with patch.object(
+        vacancy_queue, "get_unseen_jobs", side_effect=get_unseen_jobs
+    ) as mock_query, patch.object(
+        vacancy_queue, "AsyncSessionLocal", return_value=mock_context
+    ):
+        vacancy_queue.invalidate_vacancy_queue(1)
+        popped = [await vacancy_queue.pop_vacancy(1) for _ in range(8)]
+
+    assert [p and p[0].id for p in popped] == [1, 2, 3, 4, 5, 6, 7, None]
+    # one blocking fill, then background top-ups until the list ran out
+    assert mock_query.await_count < len(popped)
+
+
+async def test_process_callback_marks_and_advances_in_one_transaction():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.telegram import jobs
+
+    session = AsyncMock()
+    session.begin_nested = MagicMock()
+    marked = MagicMock()
+    marked.first.return_value = SimpleNamespace(user_id=3, title="Dev")
+    reserved = MagicMock()
+    reserved.one.return_value = SimpleNamespace(
+        within_limit=True, vacancies_count=2
+    )
+    session.execute.side_effect = [marked, reserved]
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = session
+
+    callback = MagicMock(data="skip|10", id="cb")
+    callback.from_user.id = 42
+    next_job = SimpleNamespace(id=11, title="Next")
+    with patch.object(
+        jobs, "AsyncSessionLocal", return_value=mock_context
+    ), patch.object(
+        jobs, "pop_vacancy", AsyncMock(return_value=(next_job, 5))
+    ), patch.object(
+        jobs, "create_vacancy_message", return_value=("msg", None)
+    ), patch.object(
+        jobs, "bot", AsyncMock()
+    ) as mock_bot:
+        await jobs.process_callback(callback)
+
+    assert session.execute.await_count == 2
+    session.commit.assert_awaited_once()
+    mock_bot.send_message.assert_awaited_once_with(
+        "42", "msg", reply_markup=None, parse_mode="Markdown"
+    )
+
+
+async def test_advance_vacancy_skips_already_sent_and_failed_jobs():
+    from types import SimpleNamespace
+
+    from src.telegram import jobs
+
+    queued = [(SimpleNamespace(id=i), i) for i in (1, 2, 3)]
+    reservations = [
+        SimpleNamespace(within_limit=True, vacancies_count=None),
+        None,
+        SimpleNamespace(within_limit=True, vacancies_count=4),
+    ]
+    with patch.object(
+        jobs, "pop_vacancy", AsyncMock(side_effect=queued)
+    ), patch.object(
+        jobs, "reserve_vacancy", AsyncMock(side_effect=reservations)
+    ), patch.object(jobs, "return_vacancy") as mock_return:
+        job, score, count = await jobs.advance_vacancy(AsyncMock(), 7)
+
+    assert (job.id, score, count) == (3, 3, 4)
+    mock_return.assert_not_called()
+
+
+async def test_notify_inactive_users_saves_progress_per_batch():
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.utils.telegram import notifications
+
+    batch = MagicMock()
+    batch.all.return_value = [
+        SimpleNamespace(id=i, telegram_id=100 + i) for i in (1, 2, 3)
+    ]
+    empty = MagicMock()
+    empty.all.return_value = []
+    session = AsyncMock()
+    session.execute.side_effect = [batch, MagicMock(), empty]
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = session
+
+    with patch.object(
+        notifications, "BatchSessionLocal", return_value=mock_context
+    ) as mock_factory, patch.object(
+        notifications,
+        "send_notification",
+        AsyncMock(side_effect=lambda telegram_id: telegram_id != 102),
+    ) as mock_send:
+        await notifications.notify_inactive_users()
+
+    assert mock_send.await_count == 3
+    # page read, progress update, last page read: no long transaction
+    assert mock_factory.call_count == 3
+    update_stmt = session.execute.await_args_list[1].args[0]
+    assert sorted(update_stmt.compile().params["id_1"]) == [1, 3]
+    session.commit.assert_awaited_once()
+
+
+async def test_retry_after_pauses_the_shared_send_bucket():
+    from unittest.mock import MagicMock
+
+    from aiogram.exceptions import TelegramRetryAfter
+
+    from src.utils.telegram import notifications
+
+    flood = TelegramRetryAfter(MagicMock(), "Flood control", retry_after=7)
+    with patch.object(
+        notifications, "_send_bucket", MagicMock(acquire=AsyncMock())
+    ) as mock_bucket, patch.object(
+        notifications,
+        "send_cached_animation",
+        AsyncMock(side_effect=[flood, None]),
+    ):
+        assert await notifications.send_notification(42)
+
+    mock_bucket.pause.assert_called_once_with(7)
+    assert mock_bucket.acquire.await_count == 2
+
+
+async def test_send_cached_animation_reuses_file_id():
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.telegram import media_cache
+
+    sent = SimpleNamespace(animation=SimpleNamespace(file_id="F1"))
+
+    async def send_animation(chat_id, animation):
+        await asyncio.sleep(0)
+        return sent
+
+    mock_bot = MagicMock()
+    mock_bot.send_animation = AsyncMock(side_effect=send_animation)
+    with patch.object(media_cache, "bot", mock_bot), patch.object(
+        media_cache, "AsyncSessionLocal", return_value=AsyncMock()
+    ), patch.object(
+        media_cache, "get_all_media_file_ids", AsyncMock(return_value={})
+    ), patch.object(
+        media_cache, "save_media_file_id", AsyncMock()
+    ) as mock_save:
+        # concurrent first sends upload the URL once
+        await asyncio.gather(
+            media_cache.send_cached_animation(1, "https://x/cat.gif"),
+            media_cache.send_cached_animation(2, "https://x/cat.gif"),
+        )
+        await media_cache.send_cached_animation(3, "https://x/cat.gif")
+
+    animations = [
+        c.kwargs["animation"] for c in mock_bot.send_animation.await_args_list
+    ]
+    assert animations == ["https://x/cat.gif", "F1", "F1"]
+    mock_save.assert_awaited_once()
+
+
+async def test_send_cached_animation_keeps_file_id_on_other_errors():
+    from unittest.mock import MagicMock
+
+    from aiogram.exceptions import TelegramBadRequest
+
+    from src.telegram import media_cache
+
+    mock_bot = MagicMock()
+    mock_bot.send_animation = AsyncMock(
+        side_effect=TelegramBadRequest(MagicMock(), "chat not found")
+    )
+    with patch.object(media_cache, "bot", mock_bot), patch.object(
+        media_cache, "_loaded", True
+    ), patch.dict(media_cache._file_ids, {"https://x/dog.gif": "F2"}):
+        with pytest.raises(TelegramBadRequest):
+            await media_cache.send_cached_animation(1, "https://x/dog.gif")
+
+        assert media_cache._file_ids["https://x/dog.gif"] == "F2"
+    mock_bot.send_animation.assert_awaited_once()
+
+
+async def test_refresh_reads_batch_scores_when_profile_unchanged():
+    from datetime import date, datetime, timezone
+    from types import SimpleNamespace
+    from unittest.mock import MagicMock
+
+    from src.telegram.commands import refresh
+    from src.utils.telegram.job_filter import get_scoring_profile
+
+    weights = {"python": 10}
+    user = SimpleNamespace(
+        id=3,
+        refresh_count=0,
+        last_reset_date=date.today(),
+        scoring_profile=get_scoring_profile(weights, None),
+        scored_at=datetime.now(timezone.utc),
+    )
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(scalar=lambda: None)
+    mock_context = AsyncMock()
+    mock_context.__aenter__.return_value = session
+    message = AsyncMock()
+    message.from_user.id = 42
+
+    with patch.object(
+        refresh, "AsyncSessionLocal", return_value=mock_context
+    ), patch.object(
+        refresh, "get_or_create_user", AsyncMock(return_value=user)
+    ), patch.object(
+        refresh,
+        "get_keyword_profile",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                keywords=(("python", 10),), weights=weights
+            )
+        ),
+    ), patch.object(
+        refresh, "get_candidate_jobs", AsyncMock()
+    ) as mock_candidates, patch.object(
+        refresh, "count_user_filtered_jobs", AsyncMock(return_value=12)
+    ), patch.object(
+        refresh, "prefetch_vacancies"
+    ):
+        await refresh.refresh_jobs(message)
+
+    # batch scoring already ranked this profile, nothing to rescore
+    mock_candidates.assert_not_awaited()
+    assert user.refresh_count == 1
+    assert "Found 12" in message.answer.await_args.args[0]
@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 from sqlalchemy import CursorResult
@@ -40,3 +41,236 @@ async def test_test_connection_runs_without_error():
     with patch("src.db.db.AsyncSessionLocal", return_value=mock_context):
         await test_connection()
         mock_session.execute.assert_called_once()
+
+
+async def test_save_jobs_upserts_unique_urls_in_chunks():
+    from src.fetchers import save_jobs
+
+    jobs = [
+        {"title": "Dev", "company": "A", "url": "https://a/1"},
+        {"title": "Dev again", "company": "A", "url": "https://a/1"},
+        {"title": "QA", "company": "B", "url": "https://a/2"},
+        {"title": "No url", "company": "C"},
+    ]
+    with patch.object(save_jobs, "SAVE_JOBS_CHUNK_SIZE", 1), patch.object(
+        save_jobs, "upsert_jobs", new=AsyncMock(side_effect=[(1, 0), (0, 0)])
+    ) as mock_upsert:
+        saved = await save_jobs.save_jobs_to_db(jobs, AsyncMock())
+
+    chunks = [call.args[1] for call in mock_upsert.await_args_list]
+    assert [[row["url"] for row in chunk] for chunk in chunks] == [
+        ["https://a/1"],
+        ["https://a/2"],
+    ]
+    assert chunks[0][0]["title"] == "Dev again"
+    # the second chunk failed, it wrote nothing
+    assert saved == 1
+
+
+async def test_upsert_jobs_uses_single_on_conflict_statement():
+    from sqlalchemy.dialects import postgresql
+
+    from src.db.crud.job import upsert_jobs
+
+    mock_session = AsyncMock()
+    mock_result = mock_session.execute.return_value
+    mock_result.scalars = lambda: mock_result
+    mock_result.all = lambda: [True, False]
+
+    inserted, updated = await upsert_jobs(
+        mock_session,
+        [{"title": "Dev", "company": "A", "score": 0, "url": "https://a/1"}],
+    )
+
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (md5(url)) DO UPDATE" in sql
+    assert (inserted, updated) == (1, 1)
+
+
+async def test_save_job_batches_flushes_in_batches():
+    from src.fetchers import save_jobs
+
+    async def batches():
+        for start in range(0, 5, 2):
+            yield [{"url": f"https://x/{i}"} for i in range(start, start + 2)]
+
+    # the last flush failed and saved nothing
+    with patch.object(
+        save_jobs, "save_jobs_to_db", new=AsyncMock(side_effect=[4, 0])
+    ) as mock_save, patch.object(save_jobs, "BatchSessionLocal"):
+        saved = await save_jobs.save_job_batches(batches(), "test", 4)
+
+    assert saved == 4
+    assert [len(call.args[0]) for call in mock_save.await_args_list] == [4, 2]
+
+
+async def test_get_candidate_jobs_filters_in_sql():
+    from sqlalchemy.dialects import postgresql
+
+    from src.db.crud.job import get_candidate_jobs
+
+    mock_session = AsyncMock()
+    mock_session.execute.return_value.all = lambda: [(1, "dev\n")]
+
+    rows = await get_candidate_jobs(
+        mock_session,
+        ["djinni", "dou"],
+        ["python", "100%_go"],
+        seen_since=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    stmt = mock_session.execute.await_args.args[0]
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert sql.startswith(
+        "SELECT jobs.id, jobs.source, jobs.search_text, jobs.last_seen"
+    )
+    assert "jobs.last_seen >=" in sql
+    assert "jobs.archived_at > now()" in sql
+    assert "jobs.source IN" in sql
+    assert "jobs.search_text LIKE" in sql and "ESCAPE '/'" in sql
+    assert "%100/%/_go%" in compiled.params.values()
+    assert rows == [(1, "dev\n")]
+
+
+async def test_get_unseen_jobs_is_single_limited_query():
+    from unittest.mock import MagicMock
+
+    from sqlalchemy.dialects import postgresql
+
+    from src.db.crud.user_filtered_jobs import get_unseen_jobs
+
+    mock_session = AsyncMock()
+    job = MagicMock()
+    mock_session.execute.return_value = [MagicMock(Job=job, score=7)]
+
+    assert await get_unseen_jobs(mock_session, 5, 3, {9}) == [(job, 7)]
+
+    assert mock_session.execute.await_count == 1
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "JOIN user_filtered_jobs" in sql
+    assert "NOT (EXISTS (SELECT user_jobs.id" in sql
+    assert "user_filtered_jobs.job_id NOT IN" in sql
+    assert "ORDER BY user_filtered_jobs.score DESC" in sql
+    assert sql.endswith("LIMIT %(param_1)s")
+
+
+async def test_save_user_filtered_jobs_bulk_writes_in_one_commit():
+    from sqlalchemy.dialects import postgresql
+
+    from src.db.crud.user_filtered_jobs import save_user_filtered_jobs
+
+    mock_session = AsyncMock()
+    scored_jobs = {
+        5: [(job_id, 10) for job_id in range(1000)],
+        6: [(1, 3)],
+    }
+
+    await save_user_filtered_jobs(mock_session, scored_jobs, {5}, 1000)
+
+    rebuild, archived, upsert, trim = mock_session.execute.await_args_list
+    assert str(rebuild.args[0]).startswith("DELETE FROM user_filtered")
+    assert "archived_at" in str(archived.args[0])
+    upsert_sql = str(upsert.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT" in upsert_sql
+    # every user's rows in one executemany, no per-user statements
+    assert len(upsert.args[1]) == 1001
+    assert "row_number()" in str(trim.args[0])
+    mock_session.add_all.assert_not_called()
+    mock_session.commit.assert_awaited_once()
+
+
+async def test_timed_pool_reports_checkouts_per_profile():
+    import time
+    from unittest.mock import MagicMock
+
+    from sqlalchemy import exc
+    from sqlalchemy.util import greenlet_spawn
+
+    from src.db.db import (
+        DB_POOL_PROFILES,
+        TimedQueuePool,
+        batch_engine,
+        engine,
+        get_pool_stats,
+    )
+
+    assert engine.pool is not batch_engine.pool
+    assert batch_engine.pool.size() == (
+        DB_POOL_PROFILES["batch"]["pool_size"]
+    )
+
+    def slow_connect():
+        time.sleep(0.05)
+        return MagicMock()
+
+    pool = TimedQueuePool(slow_connect, pool_size=1, max_overflow=0, timeout=0)
+    connection = pool.connect()
+    assert pool.checkouts == 1 and pool.checkedout() == 1
+    # opening the connection is not queue wait
+    assert pool.connects == 1 and pool.connect_total >= 0.05
+    assert pool.wait_max < 0.05
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+    assert pool.timeouts == 1 and pool.checkouts == 1
+    connection.close()
+
+    stats = get_pool_stats()
+    assert set(stats) == {"bot", "batch"}
+    assert {"checked_out", "overflow", "wait_avg_ms"} <= set(stats["bot"])
+
+
+async def test_hot_lookups_share_compiled_cache_entries():
+    from unittest.mock import MagicMock
+
+    from src.db.crud.job import get_job_by_id, get_job_by_url
+    from src.db.crud.user import get_user_by_telegram_id
+    from src.db.crud.user_job import get_user_job
+    from src.db.crud.user_keyword import get_user_keyword
+
+    async def cache_key(call, *args):
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = MagicMock()
+        await call(mock_session, *args)
+        return mock_session.execute.await_args.args[0]._generate_cache_key()
+
+    calls = [
+        (get_user_by_telegram_id, (1,), (2,)),
+        (get_user_job, (1, 2), (3, 4)),
+        (get_user_keyword, (1, "python"), (2, "sql")),
+        (get_job_by_id, (1,), (2,)),
+        (get_job_by_url, ("https://a",), ("https://b",)),
+    ]
+    for call, first, second in calls:
+        key = await cache_key(call, *first)
+        # same key: compiled once, same SQL for the prepared statement cache
+        assert key is not None and key == await cache_key(call, *second)
+
+
+async def test_delete_old_jobs_deletes_in_committed_batches():
+    from unittest.mock import MagicMock
+
+    from sqlalchemy.dialects import postgresql
+
+    from src.utils import job_cleanup
+
+    # a short batch only means rows were skipped as locked, keep going
+    full, partial, empty = MagicMock(), MagicMock(), MagicMock()
+    full.scalars.return_value = [1, 2]
+    partial.scalars.return_value = [5]
+    empty.scalars.return_value = []
+    mock_session = AsyncMock()
+    mock_session.execute.side_effect = [full, partial, empty]
+
+    with patch.object(job_cleanup.asyncio, "sleep", AsyncMock()) as pause:
+        deleted = await job_cleanup.delete_old_jobs(mock_session, 2)
+
+    assert deleted == 3
+    assert mock_session.commit.await_count == 3
+    assert pause.await_count == 2
+    second = mock_session.execute.await_args_list[1].args[0]
+    sql = str(second.compile(dialect=postgresql.dialect()))
+    assert "LIMIT" in sql and "FOR UPDATE SKIP LOCKED" in sql
+    assert second.compile().params["id_1"] == 2
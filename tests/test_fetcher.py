@@ -6,15 +6,237 @@ from src.fetchers.pracuj.pracuj import run_fetch_and_save_jobs as fetch_pracuj
 
 @pytest.mark.asyncio
 async def test_pracuj_fetcher_basic() -> None:
-    """Check fetcher returns list with title/company"""
+    """Check fetcher saves streamed jobs and returns their count"""
+
     # Fast fake fetch
+    async def fake_fetch(url: str):
+        yield [{"title": "Python Dev", "company": "Acme"}]
+
+    with patch(
+        "src.fetchers.pracuj.pracuj.fetch_pracuj_jobs", new=fake_fetch
+    ), patch(
+        "src.fetchers.save_jobs.save_jobs_to_db",
+        new=AsyncMock(return_value=1),
+    ) as mock_save, patch("src.fetchers.save_jobs.BatchSessionLocal"):
+        saved = await fetch_pracuj()
+
+    assert saved == 1
+    job = mock_save.await_args.args[0][0]
+    assert "title" in job
+    assert "company" in job
+
+
+@pytest.mark.asyncio
+async def test_run_all_fetchers_survives_hung_site() -> None:
+    """Check hung fetcher times out without blocking others"""
+    import asyncio
+
+    from src.utils.fetching import fetch_orchestrator
+
+    async def hung_fetcher() -> int:
+        await asyncio.sleep(60)
+        return 0
+
+    fast_fetcher = AsyncMock(return_value=1)
+
+    with patch.object(
+        fetch_orchestrator,
+        "FETCHERS",
+        {"hung": hung_fetcher, "fast": fast_fetcher},
+    ), patch.object(fetch_orchestrator, "FETCH_SITE_TIMEOUT", 0.1):
+        saved = await fetch_orchestrator.run_all_fetchers()
+
+    assert saved == 1
+
+
+def make_browser_pool(**kwargs):
+    """Build a pool whose every launch returns a new mock browser"""
+    from src.utils.fetching.browser_pool import BrowserPool
+
+    pool = BrowserPool(**kwargs)
+    pool._playwright = AsyncMock()
+    browsers = []
+
+    async def launch(**_):
+        browser = AsyncMock()
+        browser.is_connected = lambda: True
+        browsers.append(browser)
+        return browser
+
+    pool._playwright.chromium.launch.side_effect = launch
+    return pool, browsers
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_over_memory_ceiling() -> None:
+    """Check pool relaunches browser once it grows past the ceiling"""
+    from src.utils.fetching import browser_pool
+
+    pool, browsers = make_browser_pool(max_contexts=1, recycle_memory_mb=100)
+
+    with patch.object(
+        browser_pool, "get_browser_memory_mb", side_effect=[50, 200]
+    ):
+        for _ in range(3):
+            async with pool.new_page():
+                pass
+
+    assert len(browsers) == 2
+    browsers[0].close.assert_awaited_once()
+    browsers[1].close.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_retires_browser_with_open_contexts() -> None:
+    """Check page limit moves new contexts to a fresh browser while the
+    old one closes only after its last context"""
+    from contextlib import AsyncExitStack
+
+    pool, browsers = make_browser_pool(max_contexts=3, recycle_pages=2)
+
     with patch(
-        "src.fetchers.pracuj.pracuj.fetch_pracuj_jobs", new_callable=AsyncMock
-    ) as mock_fetch:
-        mock_fetch.return_value = [{"title": "Python Dev", "company": "Acme"}]
-        jobs = await fetch_pracuj()
-        assert isinstance(jobs, list)
-        if jobs:
-            job = jobs[0]
-            assert "title" in job
-            assert "company" in job
+        "src.utils.fetching.browser_pool.get_browser_memory_mb",
+        return_value=0,
+    ):
+        async with AsyncExitStack() as pages:
+            for _ in range(3):
+                await pages.enter_async_context(pool.new_page())
+
+            assert len(browsers) == 2
+            assert browsers[0].new_context.await_count == 2
+            assert browsers[1].new_context.await_count == 1
+            browsers[0].close.assert_not_awaited()
+
+    browsers[0].close.assert_awaited_once()
+    browsers[1].close.assert_not_awaited()
+
+    await pool.close()
+    browsers[1].close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_jooble_page_retries_on_server_error() -> None:
+    """Check Jooble page request retries 5xx then succeeds"""
+    import httpx
+
+    from src.fetchers.jooble.fetcher import request_jooble_page
+
+    request = httpx.Request("POST", "https://jooble.org/api/key")
+    client = AsyncMock()
+    client.post.side_effect = [
+        httpx.Response(503, request=request),
+        httpx.Response(
+            200, json={"jobs": [{"title": "Dev"}]}, request=request
+        ),
+    ]
+
+    with patch("src.fetchers.jooble.fetcher.asyncio.sleep", new=AsyncMock()):
+        jobs = await request_jooble_page(client, str(request.url), 1)
+
+    assert jobs == [{"title": "Dev"}]
+    assert client.post.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_justjoin_scroll_parses_only_new_cards() -> None:
+    """Check scroll parses each card batch once and stops at the end"""
+    from src.fetchers.justjoin import pagination
+
+    batches = [
+        [{"href": "/offer/1", "title": "Dev"}, {"href": "/offer/2"}],
+        [{"href": "/offer/3", "salary": ["10 000", "20 000"]}],
+    ]
+    page = AsyncMock()
+
+    with patch.object(
+        pagination, "extract_cards", new=AsyncMock(side_effect=batches)
+    ) as mock_extract, patch.object(
+        pagination, "throttle_request", new=AsyncMock()
+    ), patch.object(
+        pagination,
+        "wait_for_new_offers",
+        new=AsyncMock(side_effect=[True, False]),
+    ):
+        jobs = [
+            job
+            async for batch in pagination.scroll_and_fetch_jobs(page)
+            for job in batch
+        ]
+
+    assert [job["url"] for job in jobs] == [
+        "https://justjoin.it/offer/1",
+        "https://justjoin.it/offer/2",
+        "https://justjoin.it/offer/3",
+    ]
+    assert jobs[1]["title"] == "Unknown"
+    assert jobs[2]["salary"] == "15000"
+    assert mock_extract.await_args.kwargs["mark_attr"] == (
+        pagination.PARSED_ATTR
+    )
+    page.wait_for_timeout.assert_not_called()
+
+
+def test_djinni_card_keeps_previous_output() -> None:
+    """Check bulk-extracted Djinni card builds the same job dict"""
+    from src.fetchers.djinni.fetcher import extract_job_data
+
+    job = extract_job_data(
+        {
+            "title": " Python Dev ",
+            "href": "/jobs/1/",
+            "company": None,
+            "location": " Remote ",
+            "salary": " $3000 USD ",
+            "skills": [" Python ", ""],
+        }
+    )
+
+    assert job == {
+        "title": "Python Dev",
+        "url": "https://djinni.co/jobs/1/",
+        "company": "unknown",
+        "location": "Remote",
+        "salary": "$3000",
+        "currency": "USD",
+        "skills": ["Python"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_only_after_burst() -> None:
+    """Check rate governor sleeps only once burst is used up"""
+    from src.utils.fetching.anti_block import TokenBucket
+
+    bucket = TokenBucket(rate=0.5, burst=2)
+    with patch(
+        "src.utils.fetching.anti_block.asyncio.sleep", new=AsyncMock()
+    ) as mock_sleep:
+        await bucket.acquire()
+        await bucket.acquire()
+        mock_sleep.assert_not_called()
+
+        await bucket.acquire()
+
+    delay = mock_sleep.await_args.args[0]
+    assert 1.9 < delay <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_every_caller() -> None:
+    """Check a pause delays callers even with tokens left"""
+    from src.utils.fetching.anti_block import TokenBucket
+
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.pause(3)
+
+    async def sleep(delay: float) -> None:
+        bucket.pause_until -= delay
+
+    with patch(
+        "src.utils.fetching.anti_block.asyncio.sleep",
+        new=AsyncMock(side_effect=sleep),
+    ) as mock_sleep:
+        await bucket.acquire()
+
+    mock_sleep.assert_awaited_once()
+    assert 2.9 < mock_sleep.await_args.args[0] <= 3.0
@@ -0,0 +1,149 @@
+import os
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.crud.job import get_scoring_watermark, upsert_jobs
+from src.db.models import Job, User, UserFilteredJob
+from src.db.models.base import Base
+from src.db.models.user_keyword import UserKeyword
+from src.fetchers.save_jobs import prepare_job_row
+from src.utils.telegram import batch_scoring
+
+# needs a disposable PostgreSQL database, its tables are recreated
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(
+        not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+    ),
+]
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_re_seen_job_is_scored_again(session_factory):
+    row = prepare_job_row(
+        {"title": "Python Developer", "company": "ACME", "url": "https://x"},
+        datetime.now(timezone.utc),
+        "djinni",
+    )
+    async with session_factory() as session:
+        await session.execute(
+            insert(User).values(
+                telegram_id=1001,
+                refresh_count=0,
+                vacancies_count=0,
+                last_reset_date=date.today(),
+            )
+        )
+        await session.execute(
+            insert(UserKeyword).values(user_id=1, keyword="python", weight=10)
+        )
+        await session.commit()
+        await upsert_jobs(session, [row])
+
+    async def scored_job_ids() -> list[int]:
+        with patch.object(batch_scoring, "BatchSessionLocal", session_factory):
+            await batch_scoring.score_all_users()
+        async with session_factory() as session:
+            result = await session.execute(select(UserFilteredJob.job_id))
+            return list(result.scalars())
+
+    assert await scored_job_ids() == [1]
+
+    async with session_factory() as session:
+        await session.execute(
+            update(Job).values(archived_at=func.now() - text("interval '1d'"))
+        )
+        await session.commit()
+    assert await scored_job_ids() == []
+
+    # the fetcher finds it again, same row id
+    async with session_factory() as session:
+        await upsert_jobs(session, [row])
+    assert await scored_job_ids() == [1]
+
+
+async def test_watermark_waits_for_open_transactions(session_factory):
+    async with session_factory() as writer, session_factory() as scorer:
+        # a fetcher mid-transaction, its rows will carry this last_seen
+        started = (await writer.execute(select(func.now()))).scalar()
+
+        assert await get_scoring_watermark(scorer) <= started
+
+        await writer.rollback()
+        # pg_stat_activity is read once per transaction
+        await scorer.commit()
+        assert await get_scoring_watermark(scorer) > started
+
+
+async def test_users_without_keywords_lose_their_ranking(session_factory):
+    rows = [
+        prepare_job_row(
+            {"title": title, "company": "ACME", "url": f"https://x/{i}"},
+            datetime.now(timezone.utc),
+            "djinni",
+        )
+        for i, title in enumerate(("Python Developer", "Java Engineer"))
+    ]
+    async with session_factory() as session:
+        await session.execute(
+            insert(User),
+            [
+                {
+                    "telegram_id": telegram_id,
+                    "refresh_count": 0,
+                    "vacancies_count": 0,
+                    "last_reset_date": date.today(),
+                }
+                for telegram_id in (1001, 1002)
+            ],
+        )
+        await session.execute(
+            insert(UserKeyword),
+            [
+                {"user_id": 1, "keyword": "python", "weight": 10},
+                {"user_id": 2, "keyword": "java", "weight": 10},
+            ],
+        )
+        await session.commit()
+        await upsert_jobs(session, rows)
+
+    async def ranked() -> dict[int, list[int]]:
+        with patch.object(batch_scoring, "BatchSessionLocal", session_factory):
+            await batch_scoring.score_all_users()
+        async with session_factory() as session:
+            result = await session.execute(
+                select(UserFilteredJob.user_id, UserFilteredJob.job_id)
+            )
+            return {user_id: [job_id] for user_id, job_id in result}
+
+    assert await ranked() == {1: [1], 2: [2]}
+
+    async with session_factory() as session:
+        await session.execute(
+            delete(UserKeyword).where(UserKeyword.user_id == 2)
+        )
+        await session.commit()
+    assert await ranked() == {1: [1]}
+
+    async with session_factory() as session:
+        profile = await session.scalar(
+            select(User.scoring_profile).where(User.id == 2)
+        )
+        assert profile is None
@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.utils.telegram.job_filter import score_job
+
+
+def naive_score(title: str, skills: str, weights: dict[str, int]) -> int:
+    """Reference per-keyword substring scoring"""
+    score = 0
+    for keyword, weight in weights.items():
+        if keyword in title:
+            score += weight
+        elif keyword in skills:
+            score += weight // 2
+    return score
+
+
+def test_score_job_matches_substring_scoring() -> None:
+    """Check overlapping and nested keywords score like plain 'in'"""
+    rng = random.Random(0)
+    weights = {
+        "py": 3, "python": 10, "on": 2, "c++": 5, "java": 7,
+        "javascript": 4, "script": 1, "ab": 2, "bc": 6,
+    }
+    words = list(weights) + ["dev", "senior", "abc", "node", " "]
+
+    for _ in range(500):
+        title = "".join(rng.choices(words, k=4))
+        skills = [rng.choice(words) for _ in range(3)]
+        job = SimpleNamespace(title=title.title(), skills=skills)
+        assert score_job(job, weights) == naive_score(
+            title.lower(), " ".join(skills).lower(), weights
+        )
+
+
+def test_score_job_uses_stored_search_text() -> None:
+    """Check precomputed search text scores like raw title/skills"""
+    from src.utils.search_text import build_search_text
+
+    weights = {"data engineer": 10, "python": 4}
+    raw = SimpleNamespace(title="Data  Engineer", skills=["Python", "SQL"])
+    row = SimpleNamespace(
+        search_text=build_search_text(raw.title, raw.skills)
+    )
+
+    assert row.search_text == "data engineer\npython sql"
+    assert score_job(row, weights) == score_job(raw, weights) == 12
+
+
+def test_batch_scoring_matches_per_job_scoring() -> None:
+    """Check batch postings rank like score_job, honouring regions"""
+    from src.utils.search_text import build_search_text
+    from src.utils.telegram.batch_scoring import score_profiles
+
+    raw_jobs = [
+        ("Python Developer", ["Django"], "djinni"),
+        ("Java Engineer", ["Python"], "justjoin"),
+        ("Data Engineer", ["SQL"], "dou"),
+        ("QA", [], "jooble"),
+    ]
+    jobs = [
+        SimpleNamespace(
+            id=job_id, source=source,
+            search_text=build_search_text(title, skills),
+            last_seen=datetime(2026, 1, job_id, tzinfo=timezone.utc),
+        )
+        for job_id, (title, skills, source) in enumerate(raw_jobs, 1)
+    ]
+    profiles = {
+        1: ({"python": 10, "engineer": 3}, None),
+        2: ({"python": 10, "engineer": 3}, ["djinni", "dou"]),
+        3: ({"golang": 5}, None),
+    }
+
+    results = score_profiles(jobs, profiles)
+
+    expected = sorted(
+        (
+            (job.id, score_job(job, profiles[1][0]))
+            for job in jobs
+            if score_job(job, profiles[1][0]) > 0
+        ),
+        key=lambda pair: pair[1],
+        reverse=True,
+    )
+    assert results[1] == expected == [(1, 10), (2, 8), (3, 3)]
+    assert results[2] == [(1, 10), (3, 3)]
+    assert results[3] == []
+
+    # incremental: only jobs seen since the user's watermark
+    since = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    results = score_profiles(jobs, profiles, {1: since, 2: None, 3: since})
+    assert results[1] == [(2, 8), (3, 3)]
+    assert results[2] == [(1, 10), (3, 3)]
+
+
+def test_scoring_profile_changes_only_with_keywords_or_region() -> None:
+    """Check profile hash triggers full rebuild only on real changes"""
+    from src.utils.telegram.job_filter import get_scoring_profile
+
+    profile = get_scoring_profile({"python": 10, "sql": 3}, ["dou"])
+
+    assert profile == get_scoring_profile({"sql": 3, "python": 10}, ["dou"])
+    assert profile != get_scoring_profile({"python": 5, "sql": 3}, ["dou"])
+    assert profile != get_scoring_profile({"python": 10, "sql": 3}, None)
+
+
+@pytest.mark.asyncio
+async def test_keyword_profile_cached_until_invalidated() -> None:
+    """Check keywords are queried once until the user changes them"""
+    from src.utils.telegram import job_filter
+
+    keywords = [SimpleNamespace(keyword="python", weight=10)]
+    with patch.object(
+        job_filter,
+        "get_user_all_keywords",
+        AsyncMock(return_value=keywords),
+    ) as get_keywords:
+        first = await job_filter.get_keyword_profile(AsyncMock(), 42)
+        second = await job_filter.get_keyword_profile(AsyncMock(), 42)
+        job_filter.invalidate_keyword_profile(42)
+        await job_filter.get_keyword_profile(AsyncMock(), 42)
+
+    assert first is second
+    assert first.weights == {"python": 10}
+    assert get_keywords.await_count == 2
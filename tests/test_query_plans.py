@@ -0,0 +1,174 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.db.crud.job import get_job_by_url, update_jobs_last_seen_archived_at
+from src.db.crud.user_filtered_jobs import (
+    count_user_filtered_jobs,
+    get_unseen_jobs,
+)
+from src.db.crud.user_job import get_user_job, mark_user_job
+from src.db.models import Job, User, UserFilteredJob, UserJob
+from src.db.models.base import Base
+from src.db.models.user_region import UserRegion
+from src.utils.job_cleanup import delete_old_jobs
+
+# needs a disposable PostgreSQL database, its tables are recreated
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(
+        not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+    ),
+]
+
+
+def compiled(stmt) -> tuple[str, tuple]:
+    """Render a statement the way asyncpg sends it, with its parameters."""
+    query = stmt.compile(
+        dialect=asyncpg.dialect(),
+        compile_kwargs={"render_postcompile": True},
+    )
+    return query.string, tuple(query.params[k] for k in query.positiontup)
+
+
+async def captured(call, *args) -> tuple[str, tuple]:
+    """Run a crud function on a mock session, return its SQL."""
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    await call(session, *args)
+    return compiled(session.execute.await_args_list[0].args[0])
+
+
+async def seed(conn) -> None:
+    """Insert users, jobs and their links, then refresh statistics."""
+    now = datetime.now(timezone.utc)
+    await conn.execute(
+        insert(User),
+        [
+            {
+                "telegram_id": 1000 + i,
+                "refresh_count": 0,
+                "vacancies_count": 0,
+                "last_reset_date": date.today(),
+            }
+            for i in range(1, 501)
+        ],
+    )
+    await conn.execute(
+        insert(Job),
+        [
+            {
+                "title": f"Developer {i}",
+                "company": "ACME",
+                "score": 0,
+                "url": f"https://example.com/jobs/{i}",
+                "last_seen": now,
+                "archived_at": now + timedelta(days=i % 60 - 40),
+            }
+            for i in range(1, 5001)
+        ],
+    )
+    await conn.execute(
+        insert(UserFilteredJob),
+        [
+            {"user_id": u, "job_id": (u * 37 + j) % 5000 + 1, "score": j}
+            for u in range(1, 501)
+            for j in range(40)
+        ],
+    )
+    await conn.execute(
+        insert(UserJob),
+        [
+            {"user_id": u, "job_id": (u * 37 + j) % 5000 + 1, "status": "sent"}
+            for u in range(1, 501)
+            for j in range(10)
+        ],
+    )
+    await conn.execute(
+        insert(UserRegion),
+        [{"user_id": u, "region": "Ukraine"} for u in range(1, 501)],
+    )
+    await conn.execute(text("ANALYZE"))
+
+
+async def test_hot_queries_use_indexes():
+    # query -> (SQL, indexes its plan must use)
+    hot_queries = {
+        "next unseen vacancy": (
+            await captured(get_unseen_jobs, 7, 5, [1]),
+            ("ix_user_filtered_jobs_user_score", "uix_user_job"),
+        ),
+        "user job lookup": (
+            await captured(get_user_job, 7, 300),
+            ("uix_user_job",),
+        ),
+        "mark user job": (
+            await captured(mark_user_job, 1007, 300, "skipped"),
+            ("ix_users_telegram_id", "jobs_pkey"),
+        ),
+        "filtered jobs count": (
+            await captured(count_user_filtered_jobs, 7),
+            ("ix_user_filtered_jobs_user_score",),
+        ),
+        "job by url": (
+            await captured(get_job_by_url, "https://example.com/jobs/42"),
+            ("uix_jobs_url_md5",),
+        ),
+        "jobs seen again": (
+            await captured(
+                update_jobs_last_seen_archived_at,
+                ["https://example.com/jobs/1", "https://example.com/jobs/2"],
+            ),
+            ("uix_jobs_url_md5",),
+        ),
+        "old jobs cleanup": (
+            await captured(delete_old_jobs),
+            ("ix_jobs_archived_at",),
+        ),
+        # what ON DELETE CASCADE runs for every deleted job
+        "user jobs cascade": (
+            compiled(delete(UserJob).where(UserJob.job_id == 42)),
+            ("ix_user_jobs_job_id",),
+        ),
+        "filtered jobs cascade": (
+            compiled(
+                delete(UserFilteredJob).where(UserFilteredJob.job_id == 42)
+            ),
+            ("ix_user_filtered_jobs_job_id",),
+        ),
+        "user region": (
+            compiled(select(UserRegion.region).where(UserRegion.user_id == 7)),
+            ("ix_user_regions_user_id",),
+        ),
+    }
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+            await seed(conn)
+
+        async with engine.connect() as conn:
+            # prefer indexes on the small seed, then check they are the
+            # right ones: a full walk of any other index (jobs_pkey, or a
+            # skip scan of a composite one) is no seq scan either
+            await conn.execute(text("SET enable_seqscan = off"))
+            missing = {}
+            for name, ((sql, params), indexes) in hot_queries.items():
+                result = await conn.exec_driver_sql(f"EXPLAIN {sql}", params)
+                plan = "\n".join(row[0] for row in result)
+                if not all(f" {index} " in plan for index in indexes):
+                    missing[name] = plan
+    finally:
+        await engine.dispose()
+
+    assert not missing, missing
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from src.utils import resources_logging
+from src.utils.resources_logging import log_resources, sample_resources
+
+
+def test_sample_resources_does_not_block() -> None:
+    """Check CPU is sampled without interval sleep"""
+    with patch(
+        "src.utils.resources_logging.psutil.cpu_percent", return_value=5.0
+    ) as mock_cpu:
+        sample = sample_resources()
+
+    mock_cpu.assert_called_once_with(interval=None)
+    assert sample["cpu_percent"] == 5.0
+    assert resources_logging.resource_history[-1] is sample
+
+
+def test_log_resources_reuses_fresh_sample() -> None:
+    """Check logging reads latest sample instead of sampling again"""
+    sample_resources()
+    with patch(
+        "src.utils.resources_logging.sample_resources"
+    ) as mock_sample:
+        log_resources()
+
+    mock_sample.assert_not_called()
+
+
+def test_log_resources_without_sampler_keeps_cpu_baseline() -> None:
+    """Check a stale history logs memory without calling cpu_percent"""
+    resources_logging.resource_history.clear()
+    with patch(
+        "src.utils.resources_logging.psutil.cpu_percent"
+    ) as mock_cpu, patch.object(resources_logging, "logger") as mock_logger:
+        log_resources()
+
+    mock_cpu.assert_not_called()
+    assert "no recent sample" in mock_logger.info.call_args.args[0]
+    assert not resources_logging.resource_history
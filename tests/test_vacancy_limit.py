@@ -0,0 +1,85 @@
+import os
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.db.crud.user_job import reserve_vacancy
+from src.db.models import Job, User
+from src.db.models.base import Base
+from src.db.models.user_job import UserJob
+
+# needs a disposable PostgreSQL database, its tables are recreated
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(
+        not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set"
+    ),
+]
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            insert(User).values(
+                telegram_id=1001,
+                refresh_count=0,
+                vacancies_count=0,
+                last_reset_date=date.today(),
+            )
+        )
+        await conn.execute(
+            insert(Job),
+            [
+                {
+                    "title": f"Dev {i}",
+                    "company": "ACME",
+                    "url": f"https://x/{i}",
+                    "score": 0,
+                }
+                for i in (1, 2)
+            ],
+        )
+    yield async_sessionmaker(bind=engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_reserve_vacancy_counts_only_new_sends(session_factory):
+    async with session_factory() as session:
+        first = await reserve_vacancy(session, 1, 1, daily_limit=1)
+        again = await reserve_vacancy(session, 1, 1, daily_limit=2)
+        over = await reserve_vacancy(session, 1, 2, daily_limit=1)
+        await session.commit()
+
+        count = await session.scalar(select(User.vacancies_count))
+        sent = await session.scalars(select(UserJob.job_id))
+        assert tuple(first) == (True, 1)
+        # already sent: nothing inserted, nothing counted
+        assert tuple(again) == (True, None)
+        assert tuple(over) == (False, None)
+        assert count == 1
+        assert list(sent) == [1]
+
+
+async def test_reserve_vacancy_failure_keeps_earlier_changes(
+    session_factory,
+):
+    async with session_factory() as session:
+        await session.execute(insert(UserJob).values(user_id=1, job_id=1))
+        # job 3 does not exist, the foreign key fails
+        assert await reserve_vacancy(session, 1, 3, daily_limit=5) is None
+        await session.commit()
+
+        count = await session.scalar(select(User.vacancies_count))
+        sent = await session.scalars(select(UserJob.job_id))
+        assert count == 0
+        assert list(sent) == [1]